@@ -11,9 +11,11 @@ Uso rápido:
 """
 
 from .core.figuras import Retangulo, Circulo, TrianguloRetangulo, Semicirculo, QuartoCirculo
+from .core.poligono import Poligono
 from .core.secao_composta import SecaoComposta
+from .core.secao_incremental import SecaoIncremental
 
 __all__ = [
-    "Retangulo", "Circulo", "TrianguloRetangulo", "Semicirculo", "QuartoCirculo",
-    "SecaoComposta",
+    "Retangulo", "Circulo", "TrianguloRetangulo", "Semicirculo", "QuartoCirculo", "Poligono",
+    "SecaoComposta", "SecaoIncremental",
 ]
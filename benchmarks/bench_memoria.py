@@ -0,0 +1,86 @@
+"""Benchmark: memória por figura (lista de dataclasses × TabelaFiguras).
+
+Mede com tracemalloc a memória alocada para guardar a mesma chapa
+perfurada como List[Figura] e como TabelaFiguras, e o tempo do
+calcular (motores python e numpy) em cada armazenamento.
+
+Rodar a partir da raiz do projeto:
+    python -m benchmarks.bench_memoria --figuras 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.figuras import Figura
+from core.secao_composta import SecaoComposta
+from core.tabela_figuras import TabelaFiguras
+from interface.adapters import dict_to_core
+
+from .cargas import chapa_perfurada
+
+
+def _alocado(construir: Callable[..., Any], *args: Any) -> Tuple[Any, int]:
+    """(objeto, bytes alocados por construir(*args)); os argumentos já existem antes da medição."""
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        obj = construir(*args)
+        return obj, tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+
+
+def _tempo(secao: SecaoComposta, motor: str) -> float:
+    t0 = time.perf_counter()
+    secao.calcular(modo="quiet", motor=motor)
+    return time.perf_counter() - t0
+
+
+def medir(n_figuras: int) -> List[Dict[str, Any]]:
+    def montar_lista(dicts: List[Dict[str, Any]]) -> List[Figura]:
+        return [dict_to_core(f) for f in dicts]
+
+    lista: List[Figura]
+    lista, mem_lista = _alocado(montar_lista, chapa_perfurada(n_figuras))
+    tabela, mem_tabela = _alocado(lambda: TabelaFiguras(lista))
+
+    linhas = []
+    for nome, figs, mem in (("lista", lista, mem_lista), ("tabela", tabela, mem_tabela)):
+        secao = SecaoComposta(figuras=figs)
+        linhas.append({
+            "armazenamento": nome,
+            "n_figuras": n_figuras,
+            "bytes_por_figura": mem / n_figuras,
+            "tempo_python_s": _tempo(secao, "python"),
+            "tempo_numpy_s": _tempo(secao, "numpy"),
+        })
+    return linhas
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--figuras", type=int, nargs="+", default=[100_000, 1_000_000])
+    ap.add_argument("--json", help="grava as linhas em um arquivo JSON")
+    args = ap.parse_args()
+
+    todas: List[Dict[str, Any]] = []
+    print(f"{'armazenamento':<14} {'n':>9} {'B/figura':>10} {'python (s)':>11} {'numpy (s)':>10}")
+    print("-" * 58)
+    for n in args.figuras:
+        for linha in medir(n):
+            todas.append(linha)
+            print(f"{linha['armazenamento']:<14} {linha['n_figuras']:>9} {linha['bytes_por_figura']:>10.1f} "
+                  f"{linha['tempo_python_s']:>11.3f} {linha['tempo_numpy_s']:>10.3f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(todas, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: precisão × vazão das estratégias de somatório.
+
+Chapa grande com muitos furos pequenos espalhados (cancelamento forte em
+A_total e Ixy). A referência "exata" é o cálculo com soma="fsum".
+
+Rodar a partir da raiz do projeto:
+    python -m benchmarks.bench_somatorio --furos 20000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+from core.secao_composta import SecaoComposta
+from core.somatorio import ESTRATEGIAS
+
+from .cargas import chapa_perfurada, secao_de
+
+
+def chapa_longe_da_origem(n_furos: int, *, semente: int = 0) -> SecaoComposta:
+    """Chapa perfurada de cargas.py (1000 × 400, furos de raio 0,9) centrada em (5000, 3000)."""
+    return secao_de(chapa_perfurada(n_furos + 1, semente=semente, origem=(5000.0, 3000.0)), unidade="mm")
+
+
+def _erro_relativo(valor: float, ref: float) -> float:
+    return abs(valor - ref) / abs(ref) if ref else abs(valor)
+
+
+def medir(secao: SecaoComposta, *, repeticoes: int = 3) -> List[Dict[str, Any]]:
+    linhas: List[Dict[str, Any]] = []
+    for motor in ("python", "numpy"):
+        ref = secao.calcular(motor=motor, soma="fsum")
+        for est in ESTRATEGIAS:
+            melhor = float("inf")
+            for _ in range(repeticoes):
+                t0 = time.perf_counter()
+                r = secao.calcular(motor=motor, soma=est)
+                melhor = min(melhor, time.perf_counter() - t0)
+            linhas.append({
+                "motor": motor,
+                "estrategia": est,
+                "n_figuras": len(secao.figuras),
+                "tempo_total_s": melhor,
+                "tempo_soma_s": r.extras["soma"]["tempo_s"],
+                "figuras_por_s": len(secao.figuras) / melhor,
+                "erro_rel_area": _erro_relativo(r.area_total, ref.area_total),
+                "erro_rel_ix": _erro_relativo(r.ix, ref.ix),
+                "erro_rel_ixy": _erro_relativo(r.ixy, ref.ixy),
+            })
+    return linhas
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--furos", type=int, nargs="+", default=[10_000, 50_000])
+    ap.add_argument("--repeticoes", type=int, default=3)
+    ap.add_argument("--json", help="grava as linhas em um arquivo JSON")
+    args = ap.parse_args()
+
+    todas: List[Dict[str, Any]] = []
+    print(f"{'motor':<7} {'soma':<9} {'n':>8} {'tempo (s)':>10} {'fig/s':>12} "
+          f"{'erro A':>10} {'erro Ix':>10} {'erro Ixy':>10}")
+    print("-" * 82)
+    for n in args.furos:
+        for linha in medir(chapa_longe_da_origem(n), repeticoes=args.repeticoes):
+            todas.append(linha)
+            print(f"{linha['motor']:<7} {linha['estrategia']:<9} {linha['n_figuras']:>8} "
+                  f"{linha['tempo_total_s']:>10.4f} {linha['figuras_por_s']:>12.0f} "
+                  f"{linha['erro_rel_area']:>10.2e} {linha['erro_rel_ix']:>10.2e} {linha['erro_rel_ixy']:>10.2e}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(todas, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
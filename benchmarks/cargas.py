@@ -0,0 +1,106 @@
+"""Cargas sintéticas para os benchmarks.
+
+Cada gerador devolve uma lista de figuras no formato dos dicts da UI
+(os mesmos de interface/adapters.dict_to_core e interface/plotter.plot_secao),
+com exatamente `n_figuras` itens. Assim a mesma carga serve para medir o
+core, os adaptadores, o gráfico e o PDF.
+
+- perfil_i: perfis I soldados lado a lado (mesas, alma e mísulas triangulares);
+- caixao: viga caixão (contorno menos vazio interno) com enrijecedores;
+- chapa_perfurada: chapa com muitos furos circulares.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.secao_composta import SecaoComposta
+from interface.adapters import dict_to_core
+
+Carga = Callable[..., List[Dict[str, Any]]]
+
+
+def _retangulo(b: float, h: float, x: float, y: float, *, furo: bool = False) -> Dict[str, Any]:
+    return {"tipo": "Retângulo", "furo": furo, "base": b, "altura": h,
+            "modo_pos": "Centroide (x, y)", "x": x, "y": y}
+
+
+def _retangulo_vertice(b: float, h: float, x0: float, y0: float) -> Dict[str, Any]:
+    return {"tipo": "Retângulo", "furo": False, "base": b, "altura": h,
+            "modo_pos": "Vértice de referência (x0, y0)", "x0": x0, "y0": y0,
+            "vertice": "Inferior esquerdo"}
+
+
+def _misula(lado: float, x0: float, y0: float, orientacao: str) -> Dict[str, Any]:
+    return {"tipo": "Triângulo Retângulo", "furo": False, "base": lado, "altura": lado,
+            "modo_pos": "Canto do ângulo reto (x0, y0)", "x0": x0, "y0": y0,
+            "orientacao": orientacao}
+
+
+def _circulo(r: float, x: float, y: float, *, furo: bool = False) -> Dict[str, Any]:
+    return {"tipo": "Círculo", "furo": furo, "raio": r,
+            "modo_pos": "Centroide (x, y)", "x": x, "y": y}
+
+
+def perfil_i(n_figuras: int, *, semente: int = 0) -> List[Dict[str, Any]]:
+    """Perfis I (bf=20, d=40, tf=1,6, tw=0,8) com 4 mísulas, lado a lado em x."""
+    bf, d, tf, tw, m = 20.0, 40.0, 1.6, 0.8, 0.6
+    hw = d - 2 * tf
+    figs: List[Dict[str, Any]] = []
+    k = 0
+    while len(figs) < n_figuras:
+        xc = k * 1.5 * bf
+        figs += [
+            _retangulo_vertice(bf, tf, xc - bf / 2, hw / 2),
+            _retangulo(tw, hw, xc, 0.0),
+            _retangulo_vertice(bf, tf, xc - bf / 2, -d / 2),
+            _misula(m, xc + tw / 2, hw / 2, "SE ( +x, -y )"),
+            _misula(m, xc - tw / 2, hw / 2, "SW ( -x, -y )"),
+            _misula(m, xc + tw / 2, -hw / 2, "NE ( +x, +y )"),
+            _misula(m, xc - tw / 2, -hw / 2, "NW ( -x, +y )"),
+        ]
+        k += 1
+    return figs[:n_figuras]
+
+
+def caixao(n_figuras: int, *, semente: int = 0) -> List[Dict[str, Any]]:
+    """Caixão 300 × 150 (paredes de 2) com enrijecedores na mesa inferior."""
+    rng = random.Random(semente)
+    figs = [_retangulo(300.0, 150.0, 0.0, 0.0)]
+    if n_figuras > 1:
+        figs.append(_retangulo(296.0, 146.0, 0.0, 0.0, furo=True))
+    n_enrij = max(n_figuras - len(figs), 0)
+    if n_enrij:
+        passo = 290.0 / n_enrij
+        b = min(0.5, 0.4 * passo)
+        for i in range(n_enrij):
+            h = 4.0 + rng.random()
+            figs.append(_retangulo(b, h, -145.0 + (i + 0.5) * passo, -73.0 + h / 2))
+    return figs[:n_figuras]
+
+
+def chapa_perfurada(
+    n_figuras: int, *, semente: int = 0, origem: Tuple[float, float] = (0.0, 0.0),
+) -> List[Dict[str, Any]]:
+    """Chapa 1000 × 400 centrada em `origem` com n_figuras - 1 furos de raio 0,9."""
+    rng = random.Random(semente)
+    x0, y0 = origem
+    figs = [_retangulo(1000.0, 400.0, x0, y0)]
+    for _ in range(n_figuras - 1):
+        figs.append(_circulo(0.9, x0 + rng.uniform(-495.0, 495.0), y0 + rng.uniform(-195.0, 195.0), furo=True))
+    return figs
+
+
+CARGAS: Dict[str, Carga] = {
+    "perfil_i": perfil_i,
+    "caixao": caixao,
+    "chapa_perfurada": chapa_perfurada,
+}
+
+
+def secao_de(figs: List[Dict[str, Any]], unidade: str = "cm") -> SecaoComposta:
+    secao = SecaoComposta(unidade_comprimento=unidade)
+    for f in figs:
+        secao.adicionar(dict_to_core(f))
+    return secao
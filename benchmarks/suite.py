@@ -0,0 +1,244 @@
+"""Benchmark geral: core, adaptadores, gráfico e PDF.
+
+Mede, para cada carga de benchmarks/cargas.py:
+- SecaoComposta.calcular (quiet/verbose, com e sem logger);
+- dict_to_core e centroid_xy em massa;
+- plot_secao (montagem da figura Plotly, sem renderizar; separado e agrupado);
+- build_pdf_bytes (relatório com a tabela a/b; sem gráfico e com o desenho vetorial).
+
+Os resultados vão para um JSON (um registro por medição) que pode ser
+comparado com uma execução anterior para achar regressões:
+
+    python -m benchmarks.suite --saida bench.json
+    python -m benchmarks.suite --saida novo.json --comparar bench.json --tolerancia 0.25
+
+Com --comparar o processo termina com código 1 se algum caso ficar mais
+lento que a base além da tolerância.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.secao_composta import SecaoComposta
+from interface.adapters import centroid_xy, dict_to_core
+from interface.plotter import plot_secao
+from interface.relatorio import build_pdf_bytes
+
+from .cargas import CARGAS, secao_de
+
+# Campos que identificam uma medição (o resto é tempo/metadado).
+CHAVE = ("caso", "carga", "n_figuras", "modo", "logger")
+
+
+def _cronometrar(func: Callable[[], Any], repeticoes: int) -> Dict[str, float]:
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - t0)
+    return {"tempo_min_s": min(tempos), "tempo_mediana_s": statistics.median(tempos), "repeticoes": repeticoes}
+
+
+def _repeticoes(n: int, pedido: int) -> int:
+    # casos grandes: uma rodada basta (e evita minutos de espera)
+    return pedido if n < 100_000 else 1
+
+
+def _logger_descartavel() -> logging.Logger:
+    """Logger em DEBUG com NullHandler: mede a criação dos registros, sem E/S."""
+    logger = logging.getLogger("momentos_inercia_v4.benchmark")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def _res_para_pdf(secao: SecaoComposta) -> Dict[str, Any]:
+    r = secao.calcular(modo="quiet")
+    return {
+        "area_total": r.area_total, "xg": r.xg, "yg": r.yg,
+        "ix": r.ix, "iy": r.iy, "ixy": r.ixy,
+        "i1": r.i1, "i2": r.i2,
+        "a1": r.extras["alpha1_graus"], "a2": r.extras["alpha2_graus"],
+        "ab_rows": r.extras["parametros_ab"],
+    }
+
+
+def medir_calcular(carga: str, n: int, repeticoes: int, *, verbose_ate: int) -> List[Dict[str, Any]]:
+    secao = secao_de(CARGAS[carga](n))
+    logger = _logger_descartavel()
+    linhas = []
+    for modo in ("quiet", "verbose"):
+        if modo == "verbose" and n > verbose_ate:
+            continue
+        for com_logger in (False, True):
+            lg = logger if com_logger else None
+            with open(os.devnull, "w", encoding="utf-8") as nulo, contextlib.redirect_stdout(nulo):
+                t = _cronometrar(lambda: secao.calcular(modo=modo, logger=lg), _repeticoes(n, repeticoes))
+            linhas.append({"caso": "calcular", "carga": carga, "n_figuras": n,
+                           "modo": modo, "logger": com_logger, **t})
+    return linhas
+
+
+def medir_adaptadores(carga: str, n: int, repeticoes: int) -> List[Dict[str, Any]]:
+    figs = CARGAS[carga](n)
+    rep = _repeticoes(n, repeticoes)
+    return [
+        {"caso": "centroid_xy", "carga": carga, "n_figuras": n, "modo": None, "logger": False,
+         **_cronometrar(lambda: [centroid_xy(f) for f in figs], rep)},
+        {"caso": "dict_to_core", "carga": carga, "n_figuras": n, "modo": None, "logger": False,
+         **_cronometrar(lambda: [dict_to_core(f) for f in figs], rep)},
+    ]
+
+
+def medir_plot(carga: str, n: int, repeticoes: int, *, separado_ate: int = 300) -> List[Dict[str, Any]]:
+    """plot_secao agrupado sempre; uma shape/trace por figura só até separado_ate (custo quadrático)."""
+    figs = CARGAS[carga](n)
+    r = secao_de(figs).calcular(modo="quiet")
+    a1, a2 = r.extras["alpha1_graus"], r.extras["alpha2_graus"]
+    linhas = []
+    for agrupar in (False, True):
+        if not agrupar and n > separado_ate:
+            continue
+        t = _cronometrar(lambda: plot_secao(figs, r.xg, r.yg, alpha1_deg=a1, alpha2_deg=a2, agrupar=agrupar),
+                         _repeticoes(n, repeticoes))
+        linhas.append({"caso": "plot_secao", "carga": carga, "n_figuras": n,
+                       "modo": "agrupado" if agrupar else "separado", "logger": False, **t})
+    return linhas
+
+
+def medir_pdf(carga: str, n: int, repeticoes: int) -> List[Dict[str, Any]]:
+    figs = CARGAS[carga](n)
+    res = _res_para_pdf(secao_de(figs))
+    linhas = []
+    for modo, grafico in ((None, None), ("vetorial", figs)):
+        t = _cronometrar(lambda: build_pdf_bytes(res, "cm", figs=grafico), _repeticoes(n, repeticoes))
+        linhas.append({"caso": "build_pdf_bytes", "carga": carga, "n_figuras": n, "modo": modo, "logger": False, **t})
+    return linhas
+
+
+def _metadados() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    try:
+        import numpy
+        versao_numpy: Optional[str] = numpy.__version__
+    except ImportError:
+        versao_numpy = None
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "numpy": versao_numpy,
+    }
+
+
+def _chave(linha: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(linha.get(k) for k in CHAVE)
+
+
+def comparar(
+    atual: Iterable[Dict[str, Any]],
+    base: Iterable[Dict[str, Any]],
+    tolerancia: float,
+) -> List[Dict[str, Any]]:
+    """Casos presentes nas duas execuções, com a razão atual/base (tempo mínimo)."""
+    por_chave = {_chave(b): b for b in base}
+    linhas = []
+    for a in atual:
+        b = por_chave.get(_chave(a))
+        if b is None or b["tempo_min_s"] <= 0:
+            continue
+        razao = a["tempo_min_s"] / b["tempo_min_s"]
+        linhas.append({**{k: a.get(k) for k in CHAVE}, "razao": razao, "regressao": razao > 1.0 + tolerancia})
+    return linhas
+
+
+def _imprimir(linha: Dict[str, Any]) -> None:
+    modo = linha["modo"] or "-"
+    lg = "log" if linha["logger"] else "-"
+    print(f"{linha['caso']:<16} {linha['carga']:<16} {linha['n_figuras']:>9} {modo:<8} {lg:<4} "
+          f"{linha['tempo_min_s']:>11.5f} {linha['tempo_mediana_s']:>11.5f}", flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark do core, adaptadores, gráfico e PDF.")
+    ap.add_argument("--cargas", nargs="+", default=list(CARGAS), choices=list(CARGAS))
+    ap.add_argument("--tamanhos", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000],
+                    help="nº de figuras para calcular e adaptadores")
+    ap.add_argument("--tamanhos-plot", type=int, nargs="+", default=[10, 100, 300, 10_000],
+                    help="nº de figuras para plot_secao")
+    ap.add_argument("--plot-separado-ate", type=int, default=300,
+                    help="maior seção medida em plot_secao com uma shape/trace por figura")
+    ap.add_argument("--tamanhos-pdf", type=int, nargs="+", default=[10, 1_000],
+                    help="nº de figuras (linhas da tabela a/b) para build_pdf_bytes")
+    ap.add_argument("--verbose-ate", type=int, default=1_000_000,
+                    help="maior seção medida em modo verbose")
+    ap.add_argument("--repeticoes", type=int, default=5)
+    ap.add_argument("--saida", help="grava o JSON da execução neste arquivo")
+    ap.add_argument("--comparar", help="JSON de uma execução anterior (base)")
+    ap.add_argument("--tolerancia", type=float, default=0.2,
+                    help="aumento relativo de tempo aceito antes de acusar regressão")
+    args = ap.parse_args(argv)
+
+    print(f"{'caso':<16} {'carga':<16} {'n':>9} {'modo':<8} {'log':<4} {'mín (s)':>11} {'mediana (s)':>11}")
+    print("-" * 82)
+    resultados: List[Dict[str, Any]] = []
+
+    def registrar(linhas: List[Dict[str, Any]]) -> None:
+        for linha in linhas:
+            resultados.append(linha)
+            _imprimir(linha)
+
+    for carga in args.cargas:
+        for n in args.tamanhos:
+            registrar(medir_calcular(carga, n, args.repeticoes, verbose_ate=args.verbose_ate))
+            registrar(medir_adaptadores(carga, n, args.repeticoes))
+        for n in args.tamanhos_plot:
+            registrar(medir_plot(carga, n, args.repeticoes, separado_ate=args.plot_separado_ate))
+        for n in args.tamanhos_pdf:
+            registrar(medir_pdf(carga, n, args.repeticoes))
+
+    execucao = {"meta": _metadados(), "resultados": resultados}
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(execucao, f, indent=2, ensure_ascii=False)
+
+    if not args.comparar:
+        return 0
+
+    with open(args.comparar, encoding="utf-8") as f:
+        base = json.load(f)["resultados"]
+    diffs = comparar(resultados, base, args.tolerancia)
+    print(f"\nComparação com {args.comparar} (tolerância {args.tolerancia:.0%}):")
+    for d in diffs:
+        marca = "⚠️ " if d["regressao"] else "   "
+        print(f"{marca}{d['caso']:<16} {d['carga']:<16} {d['n_figuras']:>9} "
+              f"{d['modo'] or '-':<8} {'log' if d['logger'] else '-':<4} ×{d['razao']:.2f}")
+    regressoes = sum(1 for d in diffs if d["regressao"])
+    print(f"{regressoes} regressão(ões) em {len(diffs)} casos comparados.")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+"""Cache de resultados de seções, endereçado pelo conteúdo.
+
+A chave é um SHA-256 canônico da unidade, das opções de cálculo e das
+figuras, independente da ordem em que foram adicionadas:
+
+- primitivas (nome padrão) viram linhas (tipo, p1, p2, x, y, furo, sinal),
+  as mesmas da TabelaFiguras, ordenadas em bloco (NumPy);
+- demais figuras (Poligono, FiguraContorno, FiguraMascara, nomes
+  personalizados...) viram o hash dos seus campos de construção (arrays
+  entram pelo hash dos bytes); os hashes são ordenados.
+Figuras com campos sem representação estável (ex.: funções em
+CurvaParametrica) tornam a seção não cacheável: ela é sempre calculada.
+
+Dois níveis:
+- memória: LRU com `capacidade` entradas;
+- disco (opcional): sqlite em `caminho`, com o JSON do resultado
+  comprimido (zlib) e despejo dos menos usados quando passa de
+  `max_bytes_disco`. Pode ser compartilhado entre processos e execuções.
+
+A tabela parametros_ab segue a ordem das figuras: num acerto com as mesmas
+figuras em outra ordem ela é remontada (em bloco) para a ordem atual.
+
+    cache = CacheResultados(caminho="resultados.sqlite")
+    res = cache.calcular(secao)            # calcula e guarda
+    res = cache.calcular(secao)            # acerto
+    cache.estatisticas()
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .figuras import TIPO_GENERICO, Figura
+from .propriedades import ResultadosSecao
+from .secao_composta import SecaoComposta
+from .tabela_figuras import TabelaFiguras
+
+VERSAO_CHAVE = 1
+
+_LINHA = np.dtype([
+    ("tipo", np.int8), ("p1", np.float64), ("p2", np.float64),
+    ("x", np.float64), ("y", np.float64), ("furo", np.int8), ("sinal", np.int8),
+])
+_POSICAO = np.dtype([("linha", _LINHA), ("objeto", "S32")])
+
+
+class NaoCacheavel(TypeError):
+    """A figura tem campos sem representação canônica (ex.: funções)."""
+
+
+# =========================
+# Chave canônica
+# =========================
+# Bytes por bloco no hash de arrays (máscaras em np.memmap não vão inteiras para a RAM).
+_BYTES_POR_BLOCO = 32 * 1024 * 1024
+
+
+def _digest_array(valor: np.ndarray) -> str:
+    """SHA-256 dos bytes do array em ordem C (igual a tobytes()), em blocos de linhas."""
+    dados = np.atleast_1d(valor)
+    h = hashlib.sha256()
+    passo = max(1, _BYTES_POR_BLOCO // max(1, dados[:1].nbytes))
+    for i in range(0, dados.shape[0], passo):
+        h.update(memoryview(np.ascontiguousarray(dados[i:i + passo])).cast("B"))
+    return h.hexdigest()
+
+
+def _canonico(valor: Any) -> str:
+    if valor is None or isinstance(valor, (bool, str)):
+        return repr(valor)
+    if isinstance(valor, (int, float, np.integer, np.floating)):
+        return repr(float(valor))
+    if isinstance(valor, np.ndarray):
+        return f"nd[{valor.dtype.str}{valor.shape}:{_digest_array(valor)}]"
+    if isinstance(valor, (tuple, list)):
+        return "(" + ",".join(_canonico(v) for v in valor) + ")"
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        campos = ",".join(
+            f"{f.name}={_canonico(getattr(valor, f.name))}" for f in dataclasses.fields(valor) if f.init
+        )
+        return f"{type(valor).__module__}.{type(valor).__qualname__}({campos})"
+    if hasattr(valor, "__array__"):
+        return _canonico(np.asarray(valor))
+    raise NaoCacheavel(f"Sem representação canônica para {type(valor).__name__}.")
+
+
+def _digest_figura(fig: Figura) -> bytes:
+    return hashlib.sha256(_canonico(fig).encode()).digest()
+
+
+def _posicoes(figuras: Sequence[Figura]) -> np.ndarray:
+    """Um registro (linha, digest) por figura, na ordem da lista.
+
+    Primitivas têm só a linha; genéricas têm tipo TIPO_GENERICO e o digest
+    dos campos em "objeto".
+    """
+    if isinstance(figuras, TabelaFiguras):
+        cols = figuras.como_dict()
+        regs = np.zeros(len(figuras), dtype=_POSICAO)
+        linhas = regs["linha"]
+        for nome in _LINHA.names:
+            linhas[nome] = np.frombuffer(cols[nome], dtype=_LINHA[nome])
+        for i, fig in figuras.genericas.items():
+            regs["objeto"][i] = _digest_figura(fig)
+        return regs
+
+    linhas_lista: List[tuple] = []
+    objetos: List[bytes] = []
+    for fig in figuras:
+        linha = TabelaFiguras._linha(fig)
+        linhas_lista.append(linha)
+        objetos.append(_digest_figura(fig) if linha[0] == TIPO_GENERICO else b"")
+    regs = np.zeros(len(linhas_lista), dtype=_POSICAO)
+    regs["linha"] = np.array(linhas_lista, dtype=_LINHA)
+    regs["objeto"] = objetos
+    return regs
+
+
+def chaves_secao(secao: SecaoComposta, **opcoes: Any) -> Tuple[str, str]:
+    """(chave, ordem): chave independente da ordem das figuras e digest da ordem atual.
+
+    A ordem cobre todas as figuras, posição a posição (primitivas e
+    genéricas intercaladas como na lista).
+    opcoes: parâmetros de cálculo que mudam o resultado (motor, soma, derivadas).
+    Levanta NaoCacheavel se alguma figura não tiver representação canônica.
+    """
+    regs = _posicoes(secao.figuras)
+    cabecalho = f"v{VERSAO_CHAVE}|{secao.unidade_comprimento}|{sorted(opcoes.items())!r}|".encode()
+
+    ordem = hashlib.sha256(regs.tobytes())
+
+    generica = regs["linha"]["tipo"] == TIPO_GENERICO
+    linhas = regs["linha"][~generica]
+    chave = hashlib.sha256(cabecalho)
+    ordem_linhas = np.lexsort([linhas[c] for c in reversed(_LINHA.names)])
+    chave.update(linhas[ordem_linhas].tobytes())
+    chave.update(b"|")
+    for d in sorted(regs["objeto"][generica].tolist()):
+        chave.update(d)
+    return chave.hexdigest(), ordem.hexdigest()
+
+
+# =========================
+# Serialização (disco)
+# =========================
+_COLUNAS_AB = ("idx", "nome", "area", "xi", "yi", "a", "b")
+
+
+def _serializar(res: ResultadosSecao, ordem: str) -> bytes:
+    """JSON comprimido; parametros_ab vai em colunas (bem mais rápido que lista de dicts)."""
+    d = res.como_dict()
+    extras = dict(d["extras"])
+    linhas = extras.pop("parametros_ab", None)
+    if linhas is not None:
+        extras["parametros_ab_colunas"] = {c: [r[c] for r in linhas] for c in _COLUNAS_AB}
+    d["extras"] = extras
+    return zlib.compress(json.dumps({"ordem": ordem, "resultado": d}).encode(), 1)
+
+
+def _desserializar(blob: bytes) -> Tuple[ResultadosSecao, str]:
+    d = json.loads(zlib.decompress(blob))
+    res = d["resultado"]
+    colunas = res["extras"].pop("parametros_ab_colunas", None)
+    if colunas is not None:
+        res["extras"]["parametros_ab"] = [dict(zip(_COLUNAS_AB, v)) for v in zip(*(colunas[c] for c in _COLUNAS_AB))]
+    return ResultadosSecao(**res), d["ordem"]
+
+
+def _linhas_ab(figuras: Sequence[Figura], xg: float, yg: float) -> List[Dict[str, Any]]:
+    """parametros_ab na ordem atual das figuras (mesmo formato do motor vetorizado)."""
+    from .vetorizado import empacotar_figuras
+
+    pk = empacotar_figuras(figuras)
+    a = pk.y - yg
+    b = pk.x - xg
+    return [
+        {"idx": i, "nome": nome, "area": ar, "xi": xi, "yi": yi, "a": ai, "b": bi}
+        for i, (nome, ar, xi, yi, ai, bi) in enumerate(
+            zip(pk.nomes, pk.area.tolist(), pk.x.tolist(), pk.y.tolist(), a.tolist(), b.tolist()),
+            start=1,
+        )
+    ]
+
+
+# =========================
+# Cache
+# =========================
+class CacheResultados:
+    """Cache LRU em memória + sqlite opcional na frente de SecaoComposta.calcular.
+
+    Seguro para uso entre threads (um lock por instância). Processos
+    diferentes devem abrir cada um a sua instância sobre o mesmo arquivo.
+    """
+
+    def __init__(
+        self,
+        capacidade: int = 256,
+        *,
+        caminho: Optional[str] = None,
+        max_bytes_disco: int = 256 * 1024 * 1024,
+    ) -> None:
+        if capacidade < 0:
+            raise ValueError("capacidade deve ser >= 0.")
+        self.capacidade = capacidade
+        self.caminho = caminho
+        self.max_bytes_disco = max_bytes_disco
+        self._memoria: "OrderedDict[str, Tuple[ResultadosSecao, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "acertos_memoria": 0, "acertos_disco": 0, "faltas": 0, "nao_cacheaveis": 0,
+            "despejos_memoria": 0, "despejos_disco": 0,
+        }
+        self._db: Optional[sqlite3.Connection] = None
+        if caminho is not None:
+            # transações explícitas (_transacao): leitura e escrita dos totais no mesmo BEGIN IMMEDIATE
+            self._db = sqlite3.connect(caminho, timeout=30.0, check_same_thread=False, isolation_level=None)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                " chave TEXT PRIMARY KEY, valor BLOB NOT NULL, tamanho INTEGER NOT NULL, acesso REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS resultados_acesso ON resultados (acesso)")
+            # total de bytes mantido à parte (evita somar a tabela a cada escrita)
+            self._db.execute("CREATE TABLE IF NOT EXISTS totais (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)")
+            with self._transacao():
+                self._db.execute(
+                    "INSERT OR IGNORE INTO totais (id, bytes) SELECT 0, COALESCE(SUM(tamanho), 0) FROM resultados"
+                )
+
+    # -----------------------------
+    # Uso principal
+    # -----------------------------
+    def calcular(
+        self,
+        secao: SecaoComposta,
+        *,
+        motor: str = "python",
+        soma: Optional[str] = None,
+        derivadas: bool = False,
+        logger: Optional[Any] = None,
+    ) -> ResultadosSecao:
+        """Mesmo que secao.calcular(modo="quiet", ...), consultando o cache antes."""
+        def calcular() -> ResultadosSecao:
+            return secao.calcular(modo="quiet", logger=logger, motor=motor, soma=soma, derivadas=derivadas)
+
+        try:
+            chave, ordem = chaves_secao(secao, motor=motor, soma=soma, derivadas=derivadas)
+        except NaoCacheavel:
+            with self._lock:
+                self._stats["nao_cacheaveis"] += 1
+            return calcular()
+
+        achado = self.obter(chave)
+        if achado is not None:
+            res, ordem_guardada = achado
+            if ordem_guardada != ordem and res.extras and "parametros_ab" in res.extras:
+                res.extras["parametros_ab"] = _linhas_ab(secao.figuras, res.xg, res.yg)
+            return res
+
+        res = calcular()
+        self.guardar(chave, res, ordem)
+        return _copia(res)
+
+    def obter(self, chave: str) -> Optional[Tuple[ResultadosSecao, str]]:
+        """(resultado, ordem) da chave, ou None. O resultado é uma cópia rasa."""
+        with self._lock:
+            item = self._memoria.get(chave)
+            if item is not None:
+                self._memoria.move_to_end(chave)
+                self._stats["acertos_memoria"] += 1
+                return _copia(item[0]), item[1]
+
+            if self._db is not None:
+                linha = self._db.execute("SELECT valor FROM resultados WHERE chave = ?", (chave,)).fetchone()
+                if linha is not None:
+                    self._db.execute("UPDATE resultados SET acesso = ? WHERE chave = ?", (time.time(), chave))
+                    res, ordem = _desserializar(linha[0])
+                    self._lembrar(chave, res, ordem)
+                    self._stats["acertos_disco"] += 1
+                    return _copia(res), ordem
+
+            self._stats["faltas"] += 1
+            return None
+
+    def guardar(self, chave: str, res: ResultadosSecao, ordem: str = "") -> None:
+        with self._lock:
+            self._lembrar(chave, _copia(res), ordem)
+            if self._db is not None:
+                blob = _serializar(res, ordem)
+                # outro processo pode gravar a mesma chave: ler o tamanho antigo e somar no mesmo lock de escrita
+                with self._transacao():
+                    antigo = self._db.execute("SELECT tamanho FROM resultados WHERE chave = ?", (chave,)).fetchone()
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO resultados (chave, valor, tamanho, acesso) VALUES (?, ?, ?, ?)",
+                        (chave, blob, len(blob), time.time()),
+                    )
+                    self._somar_bytes(len(blob) - (antigo[0] if antigo else 0))
+                    self._despejar_disco()
+
+    # -----------------------------
+    # Manutenção
+    # -----------------------------
+    def estatisticas(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entradas_memoria"] = len(self._memoria)
+            stats["capacidade_memoria"] = self.capacidade
+            if self._db is not None:
+                (n,) = self._db.execute("SELECT COUNT(*) FROM resultados").fetchone()
+                stats["entradas_disco"] = n
+                stats["bytes_disco"] = self._bytes_disco()
+        consultas = stats["acertos_memoria"] + stats["acertos_disco"] + stats["faltas"]
+        stats["taxa_acerto"] = (stats["acertos_memoria"] + stats["acertos_disco"]) / consultas if consultas else 0.0
+        return stats
+
+    def limpar(self, *, disco: bool = True) -> None:
+        with self._lock:
+            self._memoria.clear()
+            if disco and self._db is not None:
+                with self._transacao():
+                    self._db.execute("DELETE FROM resultados")
+                    self._db.execute("UPDATE totais SET bytes = 0")
+
+    def fechar(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self) -> "CacheResultados":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fechar()
+
+    @contextmanager
+    def _transacao(self) -> Iterator[None]:
+        """BEGIN IMMEDIATE ... COMMIT (trava de escrita desde o início; ROLLBACK em erro)."""
+        assert self._db is not None
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def _lembrar(self, chave: str, res: ResultadosSecao, ordem: str) -> None:
+        if self.capacidade == 0:
+            return
+        self._memoria[chave] = (res, ordem)
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > self.capacidade:
+            self._memoria.popitem(last=False)
+            self._stats["despejos_memoria"] += 1
+
+    def _despejar_disco(self) -> None:
+        """Remove os menos acessados até ficar em 90% de max_bytes_disco."""
+        assert self._db is not None
+        total = self._bytes_disco()
+        if total <= self.max_bytes_disco:
+            return
+        alvo = 0.9 * self.max_bytes_disco
+        remover: List[str] = []
+        for chave, tamanho in self._db.execute("SELECT chave, tamanho FROM resultados ORDER BY acesso"):
+            if total <= alvo:
+                break
+            remover.append(chave)
+            total -= tamanho
+        self._db.executemany("DELETE FROM resultados WHERE chave = ?", [(c,) for c in remover])
+        self._db.execute("UPDATE totais SET bytes = ?", (total,))
+        self._stats["despejos_disco"] += len(remover)
+
+    def _bytes_disco(self) -> int:
+        assert self._db is not None
+        return int(self._db.execute("SELECT bytes FROM totais").fetchone()[0])
+
+    def _somar_bytes(self, delta: int) -> None:
+        assert self._db is not None
+        self._db.execute("UPDATE totais SET bytes = bytes + ?", (delta,))
+
+
+def _copia(res: ResultadosSecao) -> ResultadosSecao:
+    """Cópia de extras e de parametros_ab, para quem chama poder alterá-los sem sujar o cache."""
+    extras = dict(res.extras or {})
+    if extras.get("parametros_ab") is not None:
+        extras["parametros_ab"] = [dict(r) for r in extras["parametros_ab"]]
+    return dataclasses.replace(res, extras=extras)
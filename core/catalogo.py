@@ -0,0 +1,336 @@
+"""Catálogo de perfis de aço com propriedades pré-calculadas e índices ordenados.
+
+Perfis padronizados (I, H, U, L, T, tubos) são montados com as primitivas
+do core (Retangulo, Circulo e, nas concordâncias mesa/alma, um quadrado
+r × r menos um QuartoCirculo furo). Todas as seções são calculadas uma
+única vez, em lote (calcular_lote, com derivadas), e guardadas em colunas
+NumPy num único arquivo .npz (sem pickle).
+
+Para cada campo de CAMPOS_INDEXADOS o catálogo guarda a permutação que o
+ordena; consultas por faixa usam np.searchsorted (O(log n)) e "o mais leve
+com Ix >= X e Iy >= Y" parte do índice mais seletivo:
+
+    cat = Catalogo.construir([
+        {"nome": "W 200 x 15", "tipo": "I", "h": 20.0, "b": 10.0, "tw": 0.43, "tf": 0.52, "r": 0.76},
+        {"nome": "L 50 x 5", "tipo": "L", "h": 5.0, "b": 5.0, "t": 0.5, "r": 0.7},
+    ])
+    cat.salvar("perfis.npz")
+    k = Catalogo.carregar("perfis.npz").mais_leve(ix_min=1000.0, iy_min=80.0)
+
+Dimensões na unidade do catálogo (padrão cm): h altura, b largura, tw/tf
+espessuras de alma/mesa, t espessura (L, tubos), d diâmetro, r raio de
+concordância.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .figuras import Circulo, QuartoCirculo, Retangulo
+from .lote import calcular_lote
+from .propriedades import ResultadosSecao
+from .secao_composta import SecaoComposta, _montar_resultados
+
+_C = 4.0 / (3.0 * math.pi)
+
+# Metros por unidade de comprimento (para a massa por metro).
+_METROS = {"mm": 1e-3, "cm": 1e-2, "m": 1.0}
+
+DENSIDADE_ACO = 7850.0  # kg/m³
+
+CAMPOS_DIMENSAO = ("h", "b", "tw", "tf", "t", "d", "r")
+
+CAMPOS_PROPRIEDADE = (
+    "area", "xg", "yg", "ix", "iy", "ixy", "i1", "i2", "alpha1_rad", "alpha2_rad",
+    "massa_por_metro", "rx", "ry", "r2", "wx", "wy",
+)
+
+CAMPOS_INDEXADOS = ("area", "ix", "iy", "i1", "massa_por_metro")
+
+
+# =========================
+# Construção dos perfis
+# =========================
+def _concordancia(secao: SecaoComposta, r: float, xc: float, yc: float, sx: int, sy: int) -> None:
+    """Concordância de raio r no canto reentrante (xc, yc), voltada para (sx, sy).
+
+    Quadrado r × r no canto menos o 1/4 de círculo centrado no canto oposto.
+    """
+    if r <= 0:
+        return
+    secao.adicionar(Retangulo(r, r, xc + sx * r / 2, yc + sy * r / 2, nome="Concordância"))
+    ox, oy = xc + sx * r, yc + sy * r
+    secao.adicionar(QuartoCirculo(
+        raio=r, x=ox - sx * _C * r, y=oy - sy * _C * r,
+        sinal_ixy=-sx * sy, furo=True, nome="Concordância",
+    ))
+
+
+def secao_i(h: float, b: float, tw: float, tf: float, r: float = 0.0, *, unidade: str = "cm") -> SecaoComposta:
+    """Perfil I/H duplamente simétrico, centrado na origem."""
+    s = SecaoComposta(unidade_comprimento=unidade)
+    s.adicionar(Retangulo(b, tf, 0.0, (h - tf) / 2, nome="Mesa superior"))
+    s.adicionar(Retangulo(tw, h - 2 * tf, 0.0, 0.0, nome="Alma"))
+    s.adicionar(Retangulo(b, tf, 0.0, -(h - tf) / 2, nome="Mesa inferior"))
+    for sx in (1, -1):
+        for sy in (1, -1):
+            _concordancia(s, r, sx * tw / 2, -sy * (h / 2 - tf), sx, sy)
+    return s
+
+
+def secao_u(h: float, b: float, tw: float, tf: float, r: float = 0.0, *, unidade: str = "cm") -> SecaoComposta:
+    """Perfil U: costas da alma em x = 0, mesas para +x, centrado em y."""
+    s = SecaoComposta(unidade_comprimento=unidade)
+    s.adicionar(Retangulo(b, tf, b / 2, (h - tf) / 2, nome="Mesa superior"))
+    s.adicionar(Retangulo(tw, h - 2 * tf, tw / 2, 0.0, nome="Alma"))
+    s.adicionar(Retangulo(b, tf, b / 2, -(h - tf) / 2, nome="Mesa inferior"))
+    for sy in (1, -1):
+        _concordancia(s, r, tw, -sy * (h / 2 - tf), 1, sy)
+    return s
+
+
+def secao_l(h: float, b: float, t: float, r: float = 0.0, *, unidade: str = "cm") -> SecaoComposta:
+    """Cantoneira L: aba vertical (h) em x = 0..t, aba horizontal (b) em y = 0..t."""
+    s = SecaoComposta(unidade_comprimento=unidade)
+    s.adicionar(Retangulo(t, h, t / 2, h / 2, nome="Aba vertical"))
+    s.adicionar(Retangulo(b - t, t, t + (b - t) / 2, t / 2, nome="Aba horizontal"))
+    _concordancia(s, r, t, t, 1, 1)
+    return s
+
+
+def secao_t(h: float, b: float, tw: float, tf: float, r: float = 0.0, *, unidade: str = "cm") -> SecaoComposta:
+    """Perfil T: mesa no topo (y = h - tf .. h), alma até y = 0, simétrico em x."""
+    s = SecaoComposta(unidade_comprimento=unidade)
+    s.adicionar(Retangulo(b, tf, 0.0, h - tf / 2, nome="Mesa"))
+    s.adicionar(Retangulo(tw, h - tf, 0.0, (h - tf) / 2, nome="Alma"))
+    for sx in (1, -1):
+        _concordancia(s, r, sx * tw / 2, h - tf, sx, -1)
+    return s
+
+
+def secao_tubo(d: float, t: float, *, unidade: str = "cm") -> SecaoComposta:
+    """Tubo circular de diâmetro externo d e parede t."""
+    s = SecaoComposta(unidade_comprimento=unidade)
+    s.adicionar(Circulo(d / 2, nome="Tubo"))
+    s.adicionar(Circulo(d / 2 - t, furo=True, nome="Vazio"))
+    return s
+
+
+def secao_tubo_retangular(h: float, b: float, t: float, *, unidade: str = "cm") -> SecaoComposta:
+    """Tubo retangular (cantos vivos) de altura h, largura b e parede t."""
+    s = SecaoComposta(unidade_comprimento=unidade)
+    s.adicionar(Retangulo(b, h, nome="Tubo"))
+    s.adicionar(Retangulo(b - 2 * t, h - 2 * t, furo=True, nome="Vazio"))
+    return s
+
+
+# tipo -> (construtor, dimensões aceitas)
+CONSTRUTORES: Dict[str, Tuple[Callable[..., SecaoComposta], Tuple[str, ...]]] = {
+    "I": (secao_i, ("h", "b", "tw", "tf", "r")),
+    "H": (secao_i, ("h", "b", "tw", "tf", "r")),
+    "U": (secao_u, ("h", "b", "tw", "tf", "r")),
+    "L": (secao_l, ("h", "b", "t", "r")),
+    "T": (secao_t, ("h", "b", "tw", "tf", "r")),
+    "tubo": (secao_tubo, ("d", "t")),
+    "tubo_retangular": (secao_tubo_retangular, ("h", "b", "t")),
+}
+
+
+def montar_secao(perfil: Mapping[str, Any], *, unidade: str = "cm") -> SecaoComposta:
+    """SecaoComposta a partir de {"tipo": ..., <dimensões>} (ver CONSTRUTORES)."""
+    tipo = perfil["tipo"]
+    if tipo not in CONSTRUTORES:
+        raise ValueError(f"Tipo de perfil desconhecido: {tipo!r}. Use um de {tuple(CONSTRUTORES)}.")
+    construtor, campos = CONSTRUTORES[tipo]
+    dims = {c: float(perfil[c]) for c in campos if c in perfil and not math.isnan(float(perfil[c]))}
+    return construtor(**dims, unidade=unidade)
+
+
+# =========================
+# Catálogo
+# =========================
+@dataclass(frozen=True)
+class Catalogo:
+    """Perfis em colunas (uma posição por perfil) + permutações ordenadas."""
+    unidade_comprimento: str
+    nomes: np.ndarray
+    tipos: np.ndarray
+    dimensoes: np.ndarray                 # (n, len(CAMPOS_DIMENSAO)), NaN = não se aplica
+    propriedades: Dict[str, np.ndarray]   # CAMPOS_PROPRIEDADE
+    indices: Dict[str, np.ndarray]        # campo -> argsort estável; "nome" -> ordem alfabética
+
+    @classmethod
+    def construir(
+        cls,
+        perfis: Iterable[Mapping[str, Any]],
+        *,
+        unidade: str = "cm",
+        densidade: float = DENSIDADE_ACO,
+    ) -> "Catalogo":
+        """Monta e calcula todos os perfis de uma vez (calcular_lote com derivadas)."""
+        if unidade not in _METROS:
+            raise ValueError(f"Unidade desconhecida: {unidade!r}. Use uma de {tuple(_METROS)}.")
+        lista = list(perfis)
+        secoes = [montar_secao(p, unidade=unidade) for p in lista]
+        lote = calcular_lote(secoes, derivadas=True)
+        d = lote.derivadas
+
+        m = _METROS[unidade]
+        propriedades = {
+            "area": lote.area_total, "xg": lote.xg, "yg": lote.yg,
+            "ix": lote.ix, "iy": lote.iy, "ixy": lote.ixy,
+            "i1": lote.i1, "i2": lote.i2,
+            "alpha1_rad": lote.alpha1_rad, "alpha2_rad": lote.alpha2_rad,
+            "massa_por_metro": lote.area_total * (m * m) * densidade,
+            "rx": d.rx, "ry": d.ry, "r2": d.r2,
+            "wx": d.wx_min, "wy": d.wy_min,
+        }
+        dimensoes = np.array(
+            [
+                [float(p[c]) if c in p and c in CONSTRUTORES[p["tipo"]][1] else math.nan for c in CAMPOS_DIMENSAO]
+                for p in lista
+            ],
+            dtype=float,
+        ).reshape(len(lista), len(CAMPOS_DIMENSAO))
+        nomes = np.array([str(p.get("nome", f"{p['tipo']}-{k}")) for k, p in enumerate(lista)], dtype=str)
+        tipos = np.array([str(p["tipo"]) for p in lista], dtype=str)
+        return cls(unidade, nomes, tipos, dimensoes, propriedades, _indexar(nomes, propriedades))
+
+    # -----------------------------
+    # Persistência (.npz)
+    # -----------------------------
+    def salvar(self, caminho: str) -> None:
+        """Grava tudo (colunas e índices) num .npz, sem objetos Python."""
+        np.savez(
+            caminho,
+            unidade_comprimento=np.array(self.unidade_comprimento),
+            nomes=self.nomes,
+            tipos=self.tipos,
+            dimensoes=self.dimensoes,
+            **{f"prop_{k}": v for k, v in self.propriedades.items()},
+            **{f"idx_{k}": v for k, v in self.indices.items()},
+        )
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "Catalogo":
+        with np.load(caminho, allow_pickle=False) as z:
+            propriedades = {k: z[f"prop_{k}"] for k in CAMPOS_PROPRIEDADE}
+            indices = {k[4:]: z[k] for k in z.files if k.startswith("idx_")}
+            return cls(
+                str(z["unidade_comprimento"]), z["nomes"], z["tipos"], z["dimensoes"],
+                propriedades, indices,
+            )
+
+    # -----------------------------
+    # Acesso
+    # -----------------------------
+    def __len__(self) -> int:
+        return int(self.nomes.shape[0])
+
+    def posicao(self, nome: str) -> int:
+        """Posição do perfil pelo nome (busca binária na ordem alfabética)."""
+        ordem = self.indices["nome"]
+        i = int(np.searchsorted(self.nomes, nome, sorter=ordem))
+        if i < len(ordem) and self.nomes[ordem[i]] == nome:
+            return int(ordem[i])
+        raise KeyError(f"Perfil não encontrado: {nome}")
+
+    def perfil(self, k: int | str) -> Dict[str, Any]:
+        """{"nome", "tipo", <dimensões>} do perfil (posição ou nome)."""
+        k = self.posicao(k) if isinstance(k, str) else k
+        dims = {c: float(v) for c, v in zip(CAMPOS_DIMENSAO, self.dimensoes[k]) if not math.isnan(v)}
+        return {"nome": str(self.nomes[k]), "tipo": str(self.tipos[k]), **dims}
+
+    def secao(self, k: int | str) -> SecaoComposta:
+        """Reconstrói a SecaoComposta do perfil (para desenho/relatório)."""
+        return montar_secao(self.perfil(k), unidade=self.unidade_comprimento)
+
+    def resultado(self, k: int | str) -> ResultadosSecao:
+        """ResultadosSecao pré-calculado (sem parametros_ab), sem recalcular a seção."""
+        k = self.posicao(k) if isinstance(k, str) else k
+        p = {c: float(v[k]) for c, v in self.propriedades.items()}
+        return _montar_resultados(
+            self.unidade_comprimento,
+            p["area"], p["xg"], p["yg"], p["ix"], p["iy"], p["ixy"],
+            p["i1"], p["i2"], p["alpha1_rad"], p["alpha2_rad"],
+            [],
+            {
+                "perfil": str(self.nomes[k]),
+                "massa_por_metro": p["massa_por_metro"],
+                "derivadas": {c: p[c] for c in ("rx", "ry", "r2", "wx", "wy")},
+            },
+        )
+
+    # -----------------------------
+    # Consultas
+    # -----------------------------
+    def faixa(self, campo: str, minimo: Optional[float] = None, maximo: Optional[float] = None) -> np.ndarray:
+        """Posições com minimo <= campo <= maximo, em ordem crescente do campo (O(log n) + saída)."""
+        ordem = self._indice(campo)
+        valores = self.propriedades[campo]
+        i0 = 0 if minimo is None else int(np.searchsorted(valores, minimo, side="left", sorter=ordem))
+        i1 = len(ordem) if maximo is None else int(np.searchsorted(valores, maximo, side="right", sorter=ordem))
+        return ordem[i0:i1]
+
+    def filtrar(self, *, tipo: Optional[str] = None, **limites: float) -> np.ndarray:
+        """Posições que atendem a todos os limites (`<campo>_min` / `<campo>_max`).
+
+        O campo indexado mais seletivo dá os candidatos por busca binária; os
+        demais limites são conferidos só nesses candidatos. Ex.:
+            cat.filtrar(ix_min=1000, iy_min=80, tipo="I")
+        """
+        faixas = _ler_limites(limites)
+        for campo in faixas:
+            self._indice(campo)
+
+        candidatos: Optional[np.ndarray] = None
+        for campo, (lo, hi) in faixas.items():
+            c = self.faixa(campo, lo, hi)
+            if candidatos is None or len(c) < len(candidatos):
+                candidatos = c
+        if candidatos is None:
+            candidatos = np.arange(len(self))
+
+        ok = np.ones(len(candidatos), dtype=bool)
+        for campo, (lo, hi) in faixas.items():
+            v = self.propriedades[campo][candidatos]
+            if lo is not None:
+                ok &= v >= lo
+            if hi is not None:
+                ok &= v <= hi
+        if tipo is not None:
+            ok &= self.tipos[candidatos] == tipo
+        return candidatos[ok]
+
+    def mais_leve(self, *, tipo: Optional[str] = None, **limites: float) -> Optional[int]:
+        """Posição do perfil de menor massa por metro que atende aos limites (None se nenhum)."""
+        ok = self.filtrar(tipo=tipo, **limites)
+        if len(ok) == 0:
+            return None
+        return int(ok[np.argmin(self.propriedades["massa_por_metro"][ok])])
+
+    def _indice(self, campo: str) -> np.ndarray:
+        if campo not in self.indices:
+            raise ValueError(f"Campo sem índice: {campo!r}. Indexados: {CAMPOS_INDEXADOS}.")
+        return self.indices[campo]
+
+
+def _indexar(nomes: np.ndarray, propriedades: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    indices = {c: np.argsort(propriedades[c], kind="stable") for c in CAMPOS_INDEXADOS}
+    indices["nome"] = np.argsort(nomes, kind="stable")
+    return indices
+
+
+def _ler_limites(limites: Mapping[str, float]) -> Dict[str, List[Optional[float]]]:
+    faixas: Dict[str, List[Optional[float]]] = {}
+    for chave, valor in limites.items():
+        campo, _, lado = chave.rpartition("_")
+        if lado not in ("min", "max") or not campo:
+            raise ValueError(f"Limite inválido: {chave!r} (use <campo>_min ou <campo>_max).")
+        faixa = faixas.setdefault(campo, [None, None])
+        faixa[0 if lado == "min" else 1] = float(valor)
+    return faixas
@@ -0,0 +1,339 @@
+"""Figuras limitadas por curvas (integração no contorno).
+
+Uma FiguraContorno é descrita por anéis fechados de segmentos (retas,
+arcos de elipse, curvas de Bézier ou curvas paramétricas quaisquer).
+Área, centroide e momentos saem do teorema de Green, com integrandos
+da forma P(x, y)·dy (∂P/∂x = integrando de área):
+
+    A   = ∮ x dy          ∫x  = ∮ x²/2 dy     ∫y  = ∮ x·y dy
+    ∫x² = ∮ x³/3 dy       ∫y² = ∮ x·y² dy     ∫xy = ∮ x²·y/2 dy
+
+Cada segmento é integrado por Gauss–Legendre adaptativo: a regra de
+ordem n no intervalo é comparada com a soma das duas metades e o
+intervalo é bisseccionado até a diferença ficar abaixo da tolerância.
+As tabelas de nós/pesos são calculadas uma vez por ordem (cache), e os
+momentos de cada conjunto de parâmetros da figura também ficam em cache
+(varreduras que repetem a mesma forma não recalculam nada).
+
+Retas e Bézier são polinomiais: com a ordem padrão a primeira regra já é
+exata. Arcos e curvas genéricas convergem em poucas bissecções.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+TAMANHO_CACHE_CONTORNOS = 1024
+_PROFUNDIDADE_MAXIMA = 20
+# Grau (em comprimento) de cada integral: A, ∫x, ∫y, ∫x², ∫y², ∫xy.
+_GRAUS = np.array([2.0, 3.0, 3.0, 4.0, 4.0, 4.0])
+
+Ponto = Tuple[float, float]
+
+
+@lru_cache(maxsize=64)
+def tabela_gauss(ordem: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Nós e pesos de Gauss–Legendre em [-1, 1] (somente leitura, em cache)."""
+    if ordem < 1:
+        raise ValueError("A ordem de Gauss–Legendre deve ser >= 1.")
+    nos, pesos = np.polynomial.legendre.leggauss(ordem)
+    nos.setflags(write=False)
+    pesos.setflags(write=False)
+    return nos, pesos
+
+
+# =========================
+# Segmentos
+# =========================
+# Cada segmento é parametrizado em t ∈ [0, 1] e devolve pontos e
+# derivadas em bloco (arrays de t).
+@dataclass(frozen=True)
+class SegmentoReta:
+    p0: Ponto
+    p1: Ponto
+
+    def pontos(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        (x0, y0), (x1, y1) = self.p0, self.p1
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+
+    def derivada(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        (x0, y0), (x1, y1) = self.p0, self.p1
+        return np.full_like(t, x1 - x0), np.full_like(t, y1 - y0)
+
+
+@dataclass(frozen=True)
+class ArcoEliptico:
+    """Arco da elipse de centro (cx, cy) e semieixos a, b (girada de `rotacao` rad),
+    do ângulo paramétrico theta0 a theta1 (anti-horário se theta1 > theta0)."""
+    cx: float
+    cy: float
+    a: float
+    b: float
+    theta0: float = 0.0
+    theta1: float = 2 * math.pi
+    rotacao: float = 0.0
+
+    def pontos(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        th = self.theta0 + (self.theta1 - self.theta0) * t
+        u, v = self.a * np.cos(th), self.b * np.sin(th)
+        c, s = math.cos(self.rotacao), math.sin(self.rotacao)
+        return self.cx + c * u - s * v, self.cy + s * u + c * v
+
+    def derivada(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        d = self.theta1 - self.theta0
+        th = self.theta0 + d * t
+        du, dv = -self.a * np.sin(th) * d, self.b * np.cos(th) * d
+        c, s = math.cos(self.rotacao), math.sin(self.rotacao)
+        return c * du - s * dv, s * du + c * dv
+
+
+@dataclass(frozen=True)
+class Bezier:
+    """Curva de Bézier de qualquer grau (pontos de controle em ordem).
+
+    Uma parábola é exatamente uma Bézier quadrática; splines cúbicas são
+    sequências de Bézier cúbicas.
+    """
+    controle: Tuple[Ponto, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "controle", tuple((float(px), float(py)) for px, py in self.controle))
+        if len(self.controle) < 2:
+            raise ValueError("Bézier precisa de pelo menos 2 pontos de controle.")
+
+    @staticmethod
+    def _bernstein(n: int, t: np.ndarray) -> np.ndarray:
+        k = np.arange(n + 1)[:, None]
+        coef = np.array([math.comb(n, i) for i in range(n + 1)], dtype=float)[:, None]
+        return coef * t[None, :] ** k * (1.0 - t[None, :]) ** (n - k)
+
+    def pontos(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        c = np.array(self.controle)
+        base = self._bernstein(len(c) - 1, t)
+        return c[:, 0] @ base, c[:, 1] @ base
+
+    def derivada(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        c = np.array(self.controle)
+        n = len(c) - 1
+        dc = n * np.diff(c, axis=0)
+        base = self._bernstein(n - 1, t)
+        return dc[:, 0] @ base, dc[:, 1] @ base
+
+
+@dataclass(frozen=True)
+class CurvaParametrica:
+    """Curva dada por funções vetorizadas de t ∈ [t0, t1].
+
+    funcao(t) -> (x, y); derivada(t) -> (dx/dt, dy/dt) é opcional
+    (sem ela usa diferença central). Use funções de módulo (não lambdas)
+    se a figura precisar ir para outro processo.
+    """
+    funcao: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+    t0: float = 0.0
+    t1: float = 1.0
+    funcao_derivada: Optional[Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]] = None
+
+    def _t(self, t: np.ndarray) -> np.ndarray:
+        return self.t0 + (self.t1 - self.t0) * t
+
+    def pontos(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        x, y = self.funcao(self._t(t))
+        return np.broadcast_to(x, t.shape), np.broadcast_to(y, t.shape)
+
+    def derivada(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        escala = self.t1 - self.t0
+        tt = self._t(t)
+        if self.funcao_derivada is not None:
+            dx, dy = self.funcao_derivada(tt)
+        else:
+            h = 1e-6 * max(abs(escala), 1.0)
+            xa, ya = self.funcao(tt + h)
+            xb, yb = self.funcao(tt - h)
+            dx, dy = (np.asarray(xa) - xb) / (2 * h), (np.asarray(ya) - yb) / (2 * h)
+        return np.broadcast_to(dx, t.shape) * escala, np.broadcast_to(dy, t.shape) * escala
+
+
+Segmento = object  # qualquer objeto com pontos(t) e derivada(t), t ∈ [0, 1]
+
+
+# =========================
+# Integração
+# =========================
+def _integrandos(seg: Segmento, t: np.ndarray, ref: Ponto) -> np.ndarray:
+    """Integrandos (6, n): [x, x²/2, x·y, x³/3, x·y², x²·y/2]·dy/dt."""
+    x, y = seg.pontos(t)
+    _, dy = seg.derivada(t)
+    x = np.asarray(x, dtype=float) - ref[0]
+    y = np.asarray(y, dtype=float) - ref[1]
+    dy = np.asarray(dy, dtype=float)
+    xx = x * x
+    return np.stack([x, 0.5 * xx, x * y, xx * x / 3.0, x * y * y, 0.5 * xx * y]) * dy
+
+
+def _regra(seg: Segmento, a: float, b: float, ordem: int, ref: Ponto) -> np.ndarray:
+    nos, pesos = tabela_gauss(ordem)
+    meia = 0.5 * (b - a)
+    t = a + meia * (nos + 1.0)
+    return meia * (_integrandos(seg, t, ref) @ pesos)
+
+
+def integrar_segmento(seg: Segmento, ordem: int = 8, tol: float = 1e-10, *, ref: Ponto = (0.0, 0.0)) -> np.ndarray:
+    """Integrais de contorno do segmento (Gauss–Legendre adaptativo).
+
+    O erro de cada integral é comparado com tol × L^k, em que L é o
+    tamanho característico do segmento (distância máxima à referência)
+    e k o grau da integral (2 para A, 3 para ∫x/∫y, 4 para os momentos):
+    integrais que valem ~0 (ex.: Ixy de figuras simétricas) não forçam
+    bissecções sem fim.
+    """
+    x, y = seg.pontos(tabela_gauss(ordem)[0] * 0.5 + 0.5)
+    comp = float(np.max(np.hypot(np.asarray(x) - ref[0], np.asarray(y) - ref[1]))) or 1.0
+    limite = tol * comp ** _GRAUS
+
+    total = np.zeros(6)
+    pilha = [(0.0, 1.0, _regra(seg, 0.0, 1.0, ordem, ref), 0)]
+    while pilha:
+        a, b, grosso, nivel = pilha.pop()
+        m = 0.5 * (a + b)
+        esq = _regra(seg, a, m, ordem, ref)
+        dir_ = _regra(seg, m, b, ordem, ref)
+        fino = esq + dir_
+        if nivel >= _PROFUNDIDADE_MAXIMA or np.all(np.abs(fino - grosso) <= limite * (b - a)):
+            total += fino
+        else:
+            pilha.append((a, m, esq, nivel + 1))
+            pilha.append((m, b, dir_, nivel + 1))
+    return total
+
+
+def _validar_anel(anel: Tuple[Segmento, ...]) -> None:
+    if not anel:
+        raise ValueError("Anel de contorno vazio.")
+    um = np.array([1.0])
+    zero = np.array([0.0])
+    for s0, s1 in zip(anel, anel[1:] + anel[:1]):
+        x0, y0 = s0.pontos(um)
+        x1, y1 = s1.pontos(zero)
+        d = math.hypot(float(x0[0]) - float(x1[0]), float(y0[0]) - float(y1[0]))
+        escala = 1.0 + math.hypot(float(x1[0]), float(y1[0]))
+        if d > 1e-9 * escala:
+            raise ValueError("Contorno não fechado: o fim de um segmento não coincide com o início do próximo.")
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_CONTORNOS)
+def _momentos_contorno(
+    aneis: Tuple[Tuple[Segmento, ...], ...],
+    ordem: int,
+    tol: float,
+) -> Tuple[float, float, float, float, float, float]:
+    """(A, xc, yc, Ix̄, Iȳ, Ix̄ȳ) da região: 1º anel soma, os demais subtraem."""
+    for anel in aneis:
+        _validar_anel(anel)
+    x0, y0 = aneis[0][0].pontos(np.array([0.0]))
+    ref = (float(x0[0]), float(y0[0]))
+
+    totais = np.zeros(6)
+    for k, anel in enumerate(aneis):
+        t = sum((integrar_segmento(s, ordem, tol, ref=ref) for s in anel), np.zeros(6))
+        sinal = 1.0 if (t[0] >= 0) == (k == 0) else -1.0  # sentido de percurso indiferente
+        totais += sinal * t
+
+    a, sx, sy, sxx, syy, sxy = (float(v) for v in totais)  # [A, ∫x, ∫y, ∫x², ∫y², ∫xy]
+    if a <= 0.0:
+        raise ValueError("Área da figura de contorno deve ser positiva.")
+    xc, yc = sx / a, sy / a
+    return (
+        a,
+        ref[0] + xc,
+        ref[1] + yc,
+        syy - a * yc * yc,
+        sxx - a * xc * xc,
+        sxy - a * xc * yc,
+    )
+
+
+def info_cache_contornos() -> Dict[str, int]:
+    info = _momentos_contorno.cache_info()
+    return {"acertos": info.hits, "faltas": info.misses, "tamanho": info.currsize, "capacidade": info.maxsize or 0}
+
+
+def limpar_cache_contornos() -> None:
+    _momentos_contorno.cache_clear()
+
+
+# =========================
+# Figura
+# =========================
+@dataclass(frozen=True)
+class FiguraContorno:
+    """Região limitada por segmentos de curva (protocolo Figura).
+
+    - contorno: segmentos do anel externo, encadeados (fim de um = início do próximo);
+    - furos: anéis internos, no mesmo formato;
+    - ordem/tol: regra de Gauss–Legendre por intervalo e tolerância relativa.
+    x, y (centroide) são calculados.
+    """
+    contorno: Tuple[Segmento, ...]
+    furos: Tuple[Tuple[Segmento, ...], ...] = ()
+    furo: bool = False
+    nome: str = "Contorno"
+    ordem: int = 8
+    tol: float = 1e-10
+
+    x: float = field(init=False)
+    y: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "contorno", tuple(self.contorno))
+        object.__setattr__(self, "furos", tuple(tuple(f) for f in self.furos))
+        _, xc, yc, _, _, _ = self._momentos()
+        object.__setattr__(self, "x", xc)
+        object.__setattr__(self, "y", yc)
+
+    def _momentos(self) -> Tuple[float, float, float, float, float, float]:
+        return _momentos_contorno((self.contorno,) + self.furos, self.ordem, self.tol)
+
+    @property
+    def aneis(self) -> Tuple[Tuple[Segmento, ...], ...]:
+        return (self.contorno,) + self.furos
+
+    def amostrar(self, pontos_por_segmento: int = 32) -> Tuple[np.ndarray, ...]:
+        """Pontos (n, 2) de cada anel, para desenho ou fibras extremas."""
+        t = np.linspace(0.0, 1.0, pontos_por_segmento, endpoint=False)
+        saida = []
+        for anel in self.aneis:
+            partes = [np.column_stack(s.pontos(t)) for s in anel]
+            saida.append(np.vstack(partes))
+        return tuple(saida)
+
+    def _valor(self, k: int) -> float:
+        v = self._momentos()[k]
+        return -v if self.furo else v
+
+    def area(self) -> float:
+        return self._valor(0)
+
+    def ix_proprio(self) -> float:
+        return self._valor(3)
+
+    def iy_proprio(self) -> float:
+        return self._valor(4)
+
+    def ixy_proprio(self) -> float:
+        return self._valor(5)
+
+
+def elipse(cx: float, cy: float, a: float, b: float, *, rotacao: float = 0.0, furo: bool = False) -> FiguraContorno:
+    """Elipse completa (a, b = semieixos)."""
+    return FiguraContorno(contorno=(ArcoEliptico(cx, cy, a, b, rotacao=rotacao),), furo=furo, nome="Elipse")
+
+
+def contorno_de_pontos(pontos: Sequence[Ponto]) -> Tuple[SegmentoReta, ...]:
+    """Segmentos retos ligando os pontos em ordem (fecha no primeiro)."""
+    pts = [(float(px), float(py)) for px, py in pontos]
+    return tuple(SegmentoReta(p, q) for p, q in zip(pts, pts[1:] + pts[:1]))
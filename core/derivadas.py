@@ -0,0 +1,350 @@
+"""Propriedades derivadas: raios de giração, fibras extremas e módulos resistentes.
+
+    rx = sqrt(Ix / A)            W = I / c   (c = distância do centroide à fibra extrema)
+
+As fibras extremas saem da projeção de todos os pontos de contorno das
+figuras sólidas nas direções ±x, ±y (eixos centroidais) e ±u, ±v (eixos
+principais: u ao longo do eixo de I1, v ao longo do eixo de I2). O custo é
+O(total de vértices), em bloco (NumPy), com máximos segmentados por seção;
+o mesmo código atende uma seção ou um lote inteiro.
+
+Contornos usados:
+- Retângulo: os 4 cantos; Círculo: arco completo (projeção exata);
+- Triângulo e 1/4 de círculo: as primitivas guardam só o centroide e o sinal
+  de Ixy, que admite duas orientações opostas; usa-se a envoltória das duas;
+- Semicírculo: envoltória do arco para cima e para baixo (mesmo motivo);
+- Poligono: vértices do contorno externo; FiguraContorno: pontos amostrados;
+- FiguraMascara: retângulo envolvente dos pixels preenchidos.
+Furos são ignorados (ficam dentro do material); figuras genéricas sem
+geometria conhecida também. Nos casos de envoltória o resultado é
+conservador: c maior, W menor.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .contorno import FiguraContorno
+from .figuras import (
+    _CODIGOS,
+    TIPO_CIRCULO,
+    TIPO_GENERICO,
+    TIPO_QUARTO_CIRCULO,
+    TIPO_RETANGULO,
+    TIPO_SEMICIRCULO,
+    TIPO_TRIANGULO,
+    Figura,
+)
+from .mascara import FiguraMascara
+from .poligono import Poligono
+from .tabela_figuras import TabelaFiguras
+from .vetorizado import _parametros_figura
+
+_C = 4.0 / (3.0 * math.pi)
+_DOIS_PI = 2.0 * math.pi
+
+# Pontos amostrados por segmento de FiguraContorno.
+PONTOS_POR_SEGMENTO = 64
+
+
+@dataclass(frozen=True)
+class GeometriaFibras:
+    """Contornos achatados de várias seções (grupo = índice da seção).
+
+    Pontos (px, py) e arcos de círculo (centro, raio, ângulo inicial e
+    varredura), cada um com o grupo a que pertence.
+    """
+    px: np.ndarray
+    py: np.ndarray
+    grupo_pontos: np.ndarray
+    ox: np.ndarray
+    oy: np.ndarray
+    raio: np.ndarray
+    theta0: np.ndarray
+    varredura: np.ndarray
+    grupo_arcos: np.ndarray
+    n_grupos: int
+
+
+@dataclass(frozen=True)
+class PropriedadesDerivadas:
+    """Raios de giração, fibras extremas e módulos resistentes.
+
+    Floats para uma seção (calcular_derivadas) ou arrays com uma posição por
+    seção (derivadas_lote). Distâncias às fibras são positivas:
+    y_sup/y_inf (acima/abaixo do centroide), x_dir/x_esq, u_pos/u_neg e
+    v_pos/v_neg nos eixos principais. Wx usa y, Wy usa x, W1 usa v e W2 usa u.
+    """
+    rx: Any
+    ry: Any
+    r1: Any
+    r2: Any
+
+    y_sup: Any
+    y_inf: Any
+    x_dir: Any
+    x_esq: Any
+    u_pos: Any
+    u_neg: Any
+    v_pos: Any
+    v_neg: Any
+
+    wx_sup: Any
+    wx_inf: Any
+    wy_dir: Any
+    wy_esq: Any
+    w1_pos: Any
+    w1_neg: Any
+    w2_pos: Any
+    w2_neg: Any
+
+    @property
+    def wx_min(self) -> Any:
+        return np.minimum(self.wx_sup, self.wx_inf)
+
+    @property
+    def wy_min(self) -> Any:
+        return np.minimum(self.wy_dir, self.wy_esq)
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+# =========================
+# Geometria de contorno
+# =========================
+def _pontos_genericos(fig: Any) -> np.ndarray:
+    """Pontos de contorno de figuras não primitivas ((0, 2) se desconhecida)."""
+    if isinstance(fig, Poligono):
+        return fig.vertices
+    if isinstance(fig, FiguraContorno):
+        return fig.amostrar(PONTOS_POR_SEGMENTO)[0]
+    if isinstance(fig, FiguraMascara):
+        xmin, xmax, ymin, ymax = fig.limites
+        return np.array([(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)])
+    return np.empty((0, 2))
+
+
+def _primitivas(
+    tipo: np.ndarray, p1: np.ndarray, p2: np.ndarray, x: np.ndarray, y: np.ndarray,
+    sinal: np.ndarray, grupo: np.ndarray,
+) -> Tuple[List[Tuple[np.ndarray, ...]], List[Tuple[np.ndarray, ...]]]:
+    """Pontos (x, y, grupo) e arcos (ox, oy, r, theta0, varredura, grupo) em bloco."""
+    pontos: List[Tuple[np.ndarray, ...]] = []
+    arcos: List[Tuple[np.ndarray, ...]] = []
+
+    m = tipo == TIPO_RETANGULO
+    if m.any():
+        hb, hh, xc, yc, g = p1[m] / 2, p2[m] / 2, x[m], y[m], grupo[m]
+        for sx, sy in ((-1, -1), (1, -1), (1, 1), (-1, 1)):
+            pontos.append((xc + sx * hb, yc + sy * hh, g))
+
+    m = tipo == TIPO_TRIANGULO
+    if m.any():
+        b, h, xc, yc, s, g = p1[m], p2[m], x[m], y[m], sinal[m], grupo[m]
+        for sx in (1.0, -1.0):
+            sy = -s * sx  # sinal_ixy = -sx·sy (ver interface/adapters.sinal_ixy_por_orientacao)
+            cx, cy = xc - sx * b / 3, yc - sy * h / 3  # vértice do ângulo reto
+            pontos += [(cx, cy, g), (cx + sx * b, cy, g), (cx, cy + sy * h, g)]
+
+    m = tipo == TIPO_CIRCULO
+    if m.any():
+        r = p1[m]
+        arcos.append((x[m], y[m], r, np.zeros_like(r), np.full_like(r, _DOIS_PI), grupo[m]))
+
+    m = tipo == TIPO_SEMICIRCULO
+    if m.any():
+        r, xc, yc, g = p1[m], x[m], y[m], grupo[m]
+        meia = np.full_like(r, math.pi)
+        arcos.append((xc, yc - _C * r, r, np.zeros_like(r), meia, g))      # arco para cima
+        arcos.append((xc, yc + _C * r, r, np.full_like(r, math.pi), meia, g))  # para baixo
+
+    m = tipo == TIPO_QUARTO_CIRCULO
+    if m.any():
+        r, xc, yc, s, g = p1[m], x[m], y[m], sinal[m], grupo[m]
+        quarto = np.full_like(r, math.pi / 2)
+        for sx in (1.0, -1.0):
+            sy = -s * sx
+            ox, oy = xc - sx * _C * r, yc - sy * _C * r  # centro do círculo (canto)
+            inicio = np.where(sx > 0, np.where(sy > 0, 0.0, 1.5 * math.pi), np.where(sy > 0, 0.5 * math.pi, math.pi))
+            pontos.append((ox, oy, g))
+            arcos.append((ox, oy, r, inicio, quarto, g))
+
+    return pontos, arcos
+
+
+def _colunas_tabela(tab: TabelaFiguras, k: int) -> Tuple[np.ndarray, ...]:
+    """Colunas das primitivas sólidas de uma TabelaFiguras (sem criar objetos)."""
+    tipo = np.frombuffer(tab.tipo, dtype=np.int8)
+    m = (np.frombuffer(tab.furo, dtype=np.int8) == 0) & (tipo != TIPO_GENERICO)
+    return (
+        tipo[m],
+        np.frombuffer(tab.p1, dtype=float)[m],
+        np.frombuffer(tab.p2, dtype=float)[m],
+        np.frombuffer(tab.x, dtype=float)[m],
+        np.frombuffer(tab.y, dtype=float)[m],
+        np.frombuffer(tab.sinal, dtype=np.int8)[m].astype(float),
+        np.full(int(m.sum()), k, dtype=np.int64),
+    )
+
+
+def _juntar(partes: List[Tuple[np.ndarray, ...]], n: int) -> List[np.ndarray]:
+    """Concatena tuplas de colunas; a última coluna é o grupo (int64)."""
+    if not partes:
+        return [np.empty(0) for _ in range(n - 1)] + [np.empty(0, dtype=np.int64)]
+    return [np.concatenate([p[i] for p in partes]) for i in range(n - 1)] + [
+        np.concatenate([p[-1] for p in partes]).astype(np.int64)
+    ]
+
+
+def geometria_fibras(secoes: Sequence[Sequence[Figura]]) -> GeometriaFibras:
+    """Achata os contornos das figuras sólidas de cada seção (uma lista de figuras por seção).
+
+    Primitivas são resolvidas em bloco pelos códigos de tipo; uma
+    TabelaFiguras é lida direto das colunas.
+    """
+    tipo: List[int] = []
+    p1: List[float] = []
+    p2: List[float] = []
+    x: List[float] = []
+    y: List[float] = []
+    sinal: List[float] = []
+    grupo: List[int] = []
+    colunas: List[Tuple[np.ndarray, ...]] = []
+    pontos: List[Tuple[np.ndarray, ...]] = []
+
+    def genericos(fig: Any, k: int) -> None:
+        v = np.asarray(_pontos_genericos(fig), dtype=float)
+        pontos.append((v[:, 0], v[:, 1], np.full(len(v), k)))
+
+    for k, figuras in enumerate(secoes):
+        if isinstance(figuras, TabelaFiguras):
+            colunas.append(_colunas_tabela(figuras, k))
+            for fig in figuras.genericas.values():
+                if not fig.furo:
+                    genericos(fig, k)
+            continue
+        for fig in figuras:
+            if fig.furo:
+                continue
+            cod = _CODIGOS.get(type(fig), TIPO_GENERICO)
+            if cod == TIPO_GENERICO:
+                genericos(fig, k)
+                continue
+            a, b, s = _parametros_figura(fig, cod)
+            tipo.append(cod)
+            p1.append(a)
+            p2.append(b)
+            sinal.append(s)
+            x.append(fig.x)
+            y.append(fig.y)
+            grupo.append(k)
+
+    colunas.append((
+        np.array(tipo, dtype=np.int8), np.array(p1, dtype=float), np.array(p2, dtype=float),
+        np.array(x, dtype=float), np.array(y, dtype=float), np.array(sinal, dtype=float),
+        np.array(grupo, dtype=np.int64),
+    ))
+    pts_prim, arcos = _primitivas(*_juntar(colunas, 7))
+    pontos += pts_prim
+
+    px, py, gp = _juntar(pontos, 3)
+    ox, oy, r, t0, varr, ga = _juntar(arcos, 6)
+    return GeometriaFibras(
+        px=px, py=py, grupo_pontos=gp,
+        ox=ox, oy=oy, raio=r, theta0=t0, varredura=varr, grupo_arcos=ga,
+        n_grupos=len(secoes),
+    )
+
+
+# =========================
+# Fibras extremas
+# =========================
+def _maximo_por_grupo(valores: np.ndarray, grupo: np.ndarray, n: int) -> np.ndarray:
+    """Máximo de `valores` (m, k) por grupo -> (n, k); -inf em grupos vazios."""
+    saida = np.full((n, valores.shape[1]), -np.inf)
+    if len(grupo):
+        np.maximum.at(saida, grupo, valores)
+    return saida
+
+
+def fibras_extremas(geo: GeometriaFibras, xg: Any, yg: Any, angulos: np.ndarray) -> np.ndarray:
+    """Maior projeção (p - G)·d por grupo, para direções d = (cos φ, sin φ).
+
+    angulos: (n_grupos, k) em radianos. Retorna (n_grupos, k).
+    Arcos: máximo exato (r no interior do arco, senão o melhor extremo).
+    """
+    xg = np.broadcast_to(np.asarray(xg, dtype=float), (geo.n_grupos,))
+    yg = np.broadcast_to(np.asarray(yg, dtype=float), (geo.n_grupos,))
+    cos, sin = np.cos(angulos), np.sin(angulos)
+
+    g = geo.grupo_pontos
+    proj = (geo.px - xg[g])[:, None] * cos[g] + (geo.py - yg[g])[:, None] * sin[g]
+    maximo = _maximo_por_grupo(proj, g, geo.n_grupos)
+
+    g = geo.grupo_arcos
+    if len(g):
+        phi = angulos[g]
+        t0 = geo.theta0[:, None]
+        varr = geo.varredura[:, None]
+        dentro = np.mod(phi - t0, _DOIS_PI) <= varr
+        alcance = np.where(dentro, 1.0, np.maximum(np.cos(phi - t0), np.cos(phi - t0 - varr)))
+        proj = (
+            (geo.ox - xg[g])[:, None] * cos[g]
+            + (geo.oy - yg[g])[:, None] * sin[g]
+            + geo.raio[:, None] * alcance
+        )
+        maximo = np.maximum(maximo, _maximo_por_grupo(proj, g, geo.n_grupos))
+
+    return maximo
+
+
+def _derivadas(geo: GeometriaFibras, res: Any) -> PropriedadesDerivadas:
+    area = np.asarray(res.area_total, dtype=float).reshape(-1)
+    alpha1 = np.asarray(res.alpha1_rad, dtype=float).reshape(-1)
+    ix, iy, ixy, i1, i2 = (
+        np.asarray(v, dtype=float).reshape(-1) for v in (res.ix, res.iy, res.ixy, res.i1, res.i2)
+    )
+
+    # Eixo de I1: entre alpha1 e alpha2, o de maior momento I(θ) = Ix·cos²θ + Iy·sin²θ - Ixy·sin2θ
+    # (com Ix ~ Iy o core fixa alpha1 = 45°, que pode ser o eixo de I2).
+    alpha2 = alpha1 + math.pi / 2
+    i_alpha1 = ix * np.cos(alpha1) ** 2 + iy * np.sin(alpha1) ** 2 - ixy * np.sin(2 * alpha1)
+    i_alpha2 = ix * np.cos(alpha2) ** 2 + iy * np.sin(alpha2) ** 2 - ixy * np.sin(2 * alpha2)
+    eixo_u = np.where(i_alpha1 >= i_alpha2, alpha1, alpha2)
+    eixo_v = eixo_u + math.pi / 2
+
+    zeros = np.zeros_like(alpha1)
+    angulos = np.column_stack([
+        zeros + math.pi / 2, zeros - math.pi / 2, zeros, zeros + math.pi,  # +y, -y, +x, -x
+        eixo_u, eixo_u + math.pi, eixo_v, eixo_v + math.pi,                  # +u, -u, +v, -v
+    ])
+    c = fibras_extremas(geo, res.xg, res.yg, angulos)
+    c = np.where(np.isfinite(c), c, np.nan)  # seção sem contorno conhecido
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raios = [np.sqrt(i / area) for i in (ix, iy, i1, i2)]
+        w = [
+            ix / c[:, 0], ix / c[:, 1], iy / c[:, 2], iy / c[:, 3],
+            i1 / c[:, 6], i1 / c[:, 7], i2 / c[:, 4], i2 / c[:, 5],
+        ]
+    distancias = [c[:, j] for j in (0, 1, 2, 3, 4, 5, 6, 7)]
+    return PropriedadesDerivadas(*raios, *distancias, *w)
+
+
+def calcular_derivadas(figuras: Sequence[Figura], resultados: Any) -> PropriedadesDerivadas:
+    """Propriedades derivadas de uma seção (floats), a partir do ResultadosSecao."""
+    d = _derivadas(geometria_fibras([figuras]), resultados)
+    return PropriedadesDerivadas(**{k: float(v[0]) for k, v in d.como_dict().items()})
+
+
+def derivadas_lote(secoes: Sequence[Sequence[Figura]], resultados: Any) -> PropriedadesDerivadas:
+    """Propriedades derivadas de todas as seções (arrays), a partir do ResultadosLote.
+
+    secoes: uma sequência de figuras por seção, na ordem do lote.
+    """
+    return _derivadas(geometria_fibras(secoes), resultados)
@@ -0,0 +1,104 @@
+"""Eixos principais de inércia (I1, I2, alpha1, alpha2) em escalar ou em arrays.
+
+    I1,2 = (Ix + Iy)/2 ± sqrt(((Ix - Iy)/2)² + Ixy²)
+
+Convenções de ângulo:
+- "trigonometrica": anti-horário positivo, alpha1 = 0.5·atan2(2Ixy, Iy - Ix)
+  (pi/4 quando Ix ~ Iy), alpha2 = alpha1 + 90°. É a usada no core.
+- "formulario": horário positivo, como na planilha do formulário: alpha2 é
+  o eixo de I2 (menor), alpha1 = alpha2 - 90°, ambos normalizados para
+  (-90°, 90°].
+
+Escalares usam `math` (caminho rápido para uma seção); arrays de qualquer
+formato (lote, varredura) são resolvidos em uma única chamada NumPy.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Tuple
+
+import numpy as np
+
+CONVENCOES = ("trigonometrica", "formulario")
+
+_TOL_ISOTROPO = 1e-12
+
+
+def validar_convencao(convencao: str) -> str:
+    if convencao not in CONVENCOES:
+        raise ValueError(f"Convenção de eixos principais inválida: {convencao!r}. Use uma de {CONVENCOES}.")
+    return convencao
+
+
+def _normalizar_meia_volta(a: Any) -> Any:
+    """Leva o ângulo (rad) para (-pi/2, pi/2]."""
+    if isinstance(a, float):
+        while a <= -math.pi / 2:
+            a += math.pi
+        while a > math.pi / 2:
+            a -= math.pi
+        return a
+    return a - math.pi * np.ceil((a - math.pi / 2) / math.pi)
+
+
+def _escalar(ix: float, iy: float, ixy: float, convencao: str) -> Tuple[float, float, float, float]:
+    termo1 = (ix + iy) / 2
+    termo2 = math.sqrt(((ix - iy) / 2) ** 2 + ixy ** 2)
+
+    if convencao == "trigonometrica":
+        if abs(iy - ix) < _TOL_ISOTROPO:
+            alpha1 = math.pi / 4
+        else:
+            alpha1 = 0.5 * math.atan2(2 * ixy, (iy - ix))
+        return termo1 + termo2, termo1 - termo2, alpha1, alpha1 + math.pi / 2
+
+    alpha2 = _normalizar_meia_volta(-0.5 * math.atan2(-2.0 * ixy, (iy - ix)))
+    alpha1 = _normalizar_meia_volta(alpha2 - math.pi / 2)
+    return termo1 + termo2, termo1 - termo2, alpha1, alpha2
+
+
+def _arrays(ix: np.ndarray, iy: np.ndarray, ixy: np.ndarray, convencao: str):
+    termo1 = (ix + iy) / 2
+    termo2 = np.sqrt(((ix - iy) / 2) ** 2 + ixy ** 2)
+
+    if convencao == "trigonometrica":
+        alpha1 = np.where(
+            np.abs(iy - ix) < _TOL_ISOTROPO,
+            math.pi / 4,
+            0.5 * np.arctan2(2 * ixy, (iy - ix)),
+        )
+        return termo1 + termo2, termo1 - termo2, alpha1, alpha1 + math.pi / 2
+
+    alpha2 = _normalizar_meia_volta(-0.5 * np.arctan2(-2.0 * ixy, (iy - ix)))
+    alpha1 = _normalizar_meia_volta(alpha2 - math.pi / 2)
+    return termo1 + termo2, termo1 - termo2, alpha1, alpha2
+
+
+def eixos_principais(
+    ix: Any,
+    iy: Any,
+    ixy: Any,
+    convencao: str = "trigonometrica",
+    *,
+    graus: bool = False,
+) -> Tuple[Any, Any, Any, Any]:
+    """(I1, I2, alpha1, alpha2) a partir de Ix, Iy, Ixy centroidais.
+
+    Aceita escalares (retorna floats) ou arrays de mesmo formato (retorna
+    arrays). Ângulos em radianos, ou em graus com graus=True.
+    """
+    validar_convencao(convencao)
+    if np.ndim(ix) == 0 and np.ndim(iy) == 0 and np.ndim(ixy) == 0:
+        i1, i2, a1, a2 = _escalar(float(ix), float(iy), float(ixy), convencao)
+        if graus:
+            a1, a2 = math.degrees(a1), math.degrees(a2)
+        return i1, i2, a1, a2
+
+    ix_a, iy_a, ixy_a = np.broadcast_arrays(
+        np.asarray(ix, dtype=float), np.asarray(iy, dtype=float), np.asarray(ixy, dtype=float)
+    )
+    i1, i2, a1, a2 = _arrays(ix_a, iy_a, ixy_a, convencao)
+    if graus:
+        a1, a2 = np.degrees(a1), np.degrees(a2)
+    return i1, i2, a1, a2
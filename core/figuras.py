@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Protocol
+from typing import Dict, Protocol
 
 
 class Figura(Protocol):
@@ -174,3 +174,29 @@ class QuartoCirculo:
         ixy = 0.01647 * self.raio**4
         ixy = ixy * self.sinal_ixy
         return _aplicar_sinal_furo(ixy, self.furo)
+
+
+# =========================
+# Códigos de tipo (arrays/tabelas)
+# =========================
+# Usados pelas representações em colunas (core/tabela_figuras.py,
+# core/vetorizado.py); -1 = figura genérica do protocolo.
+TIPO_GENERICO = -1
+TIPO_RETANGULO = 0
+TIPO_CIRCULO = 1
+TIPO_TRIANGULO = 2
+TIPO_SEMICIRCULO = 3
+TIPO_QUARTO_CIRCULO = 4
+
+_CODIGOS: Dict[type, int] = {
+    Retangulo: TIPO_RETANGULO,
+    Circulo: TIPO_CIRCULO,
+    TrianguloRetangulo: TIPO_TRIANGULO,
+    Semicirculo: TIPO_SEMICIRCULO,
+    QuartoCirculo: TIPO_QUARTO_CIRCULO,
+}
+
+
+def codigo_tipo(cls: type) -> int:
+    """Código de tipo de uma classe de figura (TIPO_GENERICO se não for primitiva)."""
+    return _CODIGOS.get(cls, TIPO_GENERICO)
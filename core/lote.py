@@ -0,0 +1,236 @@
+"""Cálculo em lote: muitas seções em uma única chamada.
+
+As figuras de todas as seções ficam em arrays "achatados" (ragged) e
+`offsets` delimita cada seção: as figuras da seção k são as posições
+offsets[k] .. offsets[k+1]-1. Centroide, Steiner e eixos principais saem
+de reduções segmentadas (np.bincount), sem criar SecaoComposta nem
+ResultadosSecao por seção.
+
+Seções com área total ~ 0 (ou sem figuras) não levantam erro: ficam com
+NaN nos resultados e valido=False.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .derivadas import PropriedadesDerivadas, derivadas_lote
+from .eixos_principais import eixos_principais
+from .figuras import Figura
+from .propriedades import ResultadosSecao
+from .secao_composta import SecaoComposta, _montar_resultados
+from .vetorizado import empacotar_figuras, propriedades_proprias
+
+
+@dataclass(frozen=True)
+class FigurasLote:
+    """Figuras de várias seções em arrays contíguos + offsets por seção."""
+    area: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    ix0: np.ndarray
+    iy0: np.ndarray
+    ixy0: np.ndarray
+    offsets: np.ndarray
+
+    @property
+    def n_secoes(self) -> int:
+        return len(self.offsets) - 1
+
+    def ids_secao(self) -> np.ndarray:
+        """Índice da seção de cada figura (para as reduções segmentadas)."""
+        return np.repeat(np.arange(self.n_secoes), np.diff(self.offsets))
+
+    @classmethod
+    def de_parametros(
+        cls,
+        tipo: Any,
+        p1: Any,
+        p2: Any,
+        x: Any,
+        y: Any,
+        offsets: Any,
+        *,
+        sinal: Any = 1.0,
+        furo: Any = False,
+    ) -> "FigurasLote":
+        """Monta o lote a partir dos códigos de tipo (ver core/vetorizado.py)."""
+        tipo = np.asarray(tipo, dtype=np.int8)
+        area, ix0, iy0, ixy0 = propriedades_proprias(tipo, p1, p2, sinal, furo)
+        return cls(
+            area=area,
+            x=np.broadcast_to(np.asarray(x, dtype=float), tipo.shape),
+            y=np.broadcast_to(np.asarray(y, dtype=float), tipo.shape),
+            ix0=ix0, iy0=iy0, ixy0=ixy0,
+            offsets=_validar_offsets(offsets, tipo.shape[0]),
+        )
+
+    @classmethod
+    def de_secoes(cls, secoes: Sequence[SecaoComposta]) -> "FigurasLote":
+        """Achata uma sequência de SecaoComposta (aceita figuras genéricas)."""
+        todas: List[Figura] = []
+        contagens: List[int] = []
+        for s in secoes:
+            todas.extend(s.figuras)
+            contagens.append(len(s.figuras))
+        pk = empacotar_figuras(todas)
+        offsets = np.zeros(len(contagens) + 1, dtype=np.int64)
+        np.cumsum(contagens, out=offsets[1:])
+        return cls(area=pk.area, x=pk.x, y=pk.y, ix0=pk.ix0, iy0=pk.iy0, ixy0=pk.ixy0, offsets=offsets)
+
+
+def _validar_offsets(offsets: Any, n_figuras: int) -> np.ndarray:
+    off = np.asarray(offsets, dtype=np.int64)
+    if off.ndim != 1 or off.size < 1:
+        raise ValueError("offsets deve ser um vetor 1D com n_secoes + 1 posições.")
+    if off[0] != 0 or off[-1] != n_figuras:
+        raise ValueError("offsets deve começar em 0 e terminar no número total de figuras.")
+    if np.any(np.diff(off) < 0):
+        raise ValueError("offsets deve ser não decrescente.")
+    return off
+
+
+@dataclass(frozen=True)
+class ResultadosLote:
+    """Resultados em colunas: um array por campo (uma posição por seção)."""
+    unidade_comprimento: str
+
+    area_total: np.ndarray
+    xg: np.ndarray
+    yg: np.ndarray
+
+    ix: np.ndarray
+    iy: np.ndarray
+    ixy: np.ndarray
+
+    i1: np.ndarray
+    i2: np.ndarray
+    alpha1_rad: np.ndarray
+    alpha2_rad: np.ndarray
+
+    valido: np.ndarray
+
+    # Raios de giração, fibras extremas e W (calcular_lote(..., derivadas=True))
+    derivadas: Optional[PropriedadesDerivadas] = None
+
+    def __len__(self) -> int:
+        return int(self.area_total.shape[0])
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {
+            "unidade_comprimento": self.unidade_comprimento,
+            "area_total": self.area_total,
+            "xg": self.xg,
+            "yg": self.yg,
+            "ix": self.ix,
+            "iy": self.iy,
+            "ixy": self.ixy,
+            "i1": self.i1,
+            "i2": self.i2,
+            "alpha1_rad": self.alpha1_rad,
+            "alpha2_rad": self.alpha2_rad,
+            "valido": self.valido,
+            **({"derivadas": self.derivadas.como_dict()} if self.derivadas is not None else {}),
+        }
+
+    def eixos_principais(self, convencao: str = "trigonometrica", *, graus: bool = False):
+        """(I1, I2, alpha1, alpha2) de todas as seções em outra convenção (ver core.eixos_principais)."""
+        return eixos_principais(self.ix, self.iy, self.ixy, convencao, graus=graus)
+
+    def resultado(self, k: int) -> ResultadosSecao:
+        """ResultadosSecao de uma seção do lote (sem a tabela parametros_ab)."""
+        if not self.valido[k]:
+            raise ValueError(f"Seção {k}: área total ~ 0 ou sem figuras.")
+        return _montar_resultados(
+            self.unidade_comprimento,
+            float(self.area_total[k]), float(self.xg[k]), float(self.yg[k]),
+            float(self.ix[k]), float(self.iy[k]), float(self.ixy[k]),
+            float(self.i1[k]), float(self.i2[k]),
+            float(self.alpha1_rad[k]), float(self.alpha2_rad[k]),
+            [],
+            {"derivadas": {c: float(v[k]) for c, v in self.derivadas.como_dict().items()}}
+            if self.derivadas is not None else None,
+        )
+
+
+def calcular_lote(
+    figuras: FigurasLote | Sequence[SecaoComposta],
+    *,
+    unidade_comprimento: Optional[str] = None,
+    derivadas: bool = False,
+) -> ResultadosLote:
+    """Calcula todas as seções juntas com reduções segmentadas.
+
+    figuras:
+      - FigurasLote (arrays achatados + offsets), ou
+      - sequência de SecaoComposta (achatada internamente; todas devem
+        ter a mesma unidade, que vai para o resultado).
+    unidade_comprimento: unidade do resultado (padrão "cm" para
+      FigurasLote); com seções, se informada, tem de ser a delas.
+    derivadas: inclui raios de giração, fibras extremas e W de todas as
+      seções (core/derivadas.py); exige as seções, pois usa a geometria.
+    """
+    secoes: Sequence[SecaoComposta] = ()
+    if derivadas and isinstance(figuras, FigurasLote):
+        raise ValueError("derivadas=True exige a sequência de SecaoComposta (FigurasLote não tem geometria).")
+    if not isinstance(figuras, FigurasLote):
+        secoes = list(figuras)
+        unidades = sorted({s.unidade_comprimento for s in secoes})
+        if len(unidades) > 1:
+            raise ValueError(f"Seções com unidades diferentes no lote: {unidades}. Use uma única unidade.")
+        if unidades:
+            if unidade_comprimento is not None and unidade_comprimento != unidades[0]:
+                raise ValueError(
+                    f"unidade_comprimento={unidade_comprimento!r} difere da unidade das seções ({unidades[0]!r})."
+                )
+            unidade_comprimento = unidades[0]
+        figuras = FigurasLote.de_secoes(secoes)
+    if unidade_comprimento is None:
+        unidade_comprimento = "cm"
+
+    n = figuras.n_secoes
+    ids = figuras.ids_secao()
+
+    def somar(valores: np.ndarray) -> np.ndarray:
+        return np.bincount(ids, weights=valores, minlength=n)
+
+    # PASSO 1: Centroide global (por seção)
+    soma_a = somar(figuras.area)
+    valido = np.abs(soma_a) >= 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xg = np.where(valido, somar(figuras.area * figuras.x) / soma_a, np.nan)
+        yg = np.where(valido, somar(figuras.area * figuras.y) / soma_a, np.nan)
+
+    # PASSO 2: distâncias (a, b) ao centroide da própria seção
+    a = figuras.y - yg[ids]
+    b = figuras.x - xg[ids]
+
+    # PASSO 3: Steiner
+    ix = somar(figuras.ix0 + figuras.area * a * a)
+    iy = somar(figuras.iy0 + figuras.area * b * b)
+    ixy = somar(figuras.ixy0 + figuras.area * a * b)
+
+    # PASSO 4: Eixos principais
+    i1, i2, alpha1, alpha2 = eixos_principais(ix, iy, ixy)
+
+    resultados = ResultadosLote(
+        unidade_comprimento=unidade_comprimento,
+        area_total=np.where(valido, soma_a, np.nan),
+        xg=xg,
+        yg=yg,
+        ix=ix,
+        iy=iy,
+        ixy=ixy,
+        i1=i1,
+        i2=i2,
+        alpha1_rad=alpha1,
+        alpha2_rad=alpha2,
+        valido=valido,
+    )
+    if derivadas:
+        extras = derivadas_lote([s.figuras for s in secoes], resultados)
+        resultados = replace(resultados, derivadas=extras)
+    return resultados
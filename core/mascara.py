@@ -0,0 +1,209 @@
+"""Figura a partir de uma máscara raster (desenho escaneado, fatia de CT).
+
+Cada pixel é um quadrado de lado h (tamanho_pixel) com peso w:
+- máscara booleana: w = 1 (cheio) ou 0 (vazio);
+- máscara em tons de cinza: w = fração preenchida (inteiros são
+  normalizados pelo máximo do tipo, ex.: 255 em uint8), ou, com `limiar`,
+  w = 1 onde o valor normalizado >= limiar.
+
+Momentos (no sistema da figura, pixel (i, j) com centro em x_j, y_i):
+
+    A   = h² Σ w            ∫x = h² Σ w·x_j        ∫y = h² Σ w·y_i
+    ∫x² = h² Σ w·x_j² + Σ w·h⁴/12   (idem y)       ∫xy = h² Σ w·x_j·y_i
+
+As somas são reduções NumPy sobre blocos de linhas: somas por coluna
+(x), por linha (y) e o produto bloco @ x (xy). Só um bloco fica em
+memória por vez, então máscaras enormes podem vir de np.memmap ou de um
+.npy aberto com mmap_mode="r" (ver FiguraMascara.de_arquivo).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+# Elementos (pixels) por bloco: ~32 MB em float64.
+_PIXELS_POR_BLOCO = 4_000_000
+
+
+def _pesos(bloco: np.ndarray, limiar: Optional[float]) -> np.ndarray:
+    if bloco.dtype == bool:
+        return bloco.astype(np.float64)
+    w = bloco.astype(np.float64)
+    if np.issubdtype(bloco.dtype, np.integer):
+        w /= float(np.iinfo(bloco.dtype).max)
+    if limiar is not None:
+        w = (w >= limiar).astype(np.float64)
+    return w
+
+
+def momentos_mascara(
+    mascara: Any,
+    tamanho_pixel: float,
+    *,
+    origem: Tuple[float, float] = (0.0, 0.0),
+    limiar: Optional[float] = None,
+    linha_0_no_topo: bool = True,
+    linhas_por_bloco: Optional[int] = None,
+) -> Tuple[Tuple[float, float, float, float, float, float], Tuple[float, float, float, float]]:
+    """((A, xc, yc, Ix̄, Iȳ, Ix̄ȳ), (xmin, xmax, ymin, ymax)) da máscara.
+
+    origem: canto inferior esquerdo da imagem no sistema global.
+    linha_0_no_topo: convenção de imagem (linha 0 em cima); False = linha 0 embaixo.
+    O retângulo (xmin, ...) envolve os pixels com peso > 0.
+    """
+    if mascara.ndim != 2:
+        raise ValueError("A máscara deve ser 2D (linhas × colunas).")
+    if tamanho_pixel <= 0:
+        raise ValueError("tamanho_pixel deve ser positivo.")
+    n_lin, n_col = mascara.shape
+    if linhas_por_bloco is None:
+        linhas_por_bloco = max(1, _PIXELS_POR_BLOCO // max(n_col, 1))
+
+    # coordenadas em pixels, centradas na imagem (somas bem condicionadas)
+    cx0 = 0.5 * n_col
+    cy0 = 0.5 * n_lin
+    xs = (np.arange(n_col) + 0.5) - cx0
+
+    s_w = 0.0
+    s_x = 0.0
+    s_y = 0.0
+    s_xx = 0.0
+    s_yy = 0.0
+    s_xy = 0.0
+    col_ocupada = np.zeros(n_col, dtype=bool)
+    lin_min = lin_max = -1
+
+    for i0 in range(0, n_lin, linhas_por_bloco):
+        w = _pesos(np.asarray(mascara[i0:i0 + linhas_por_bloco]), limiar)
+        linhas = np.arange(i0, i0 + w.shape[0])
+        if linha_0_no_topo:
+            ys = (n_lin - linhas - 0.5) - cy0
+        else:
+            ys = (linhas + 0.5) - cy0
+
+        por_coluna = w.sum(axis=0)
+        por_linha = w.sum(axis=1)
+        w_x = w @ xs  # Σ_j w_ij·x_j por linha
+
+        s_w += por_linha.sum()
+        s_x += por_coluna @ xs
+        s_y += por_linha @ ys
+        s_xx += por_coluna @ (xs * xs)
+        s_yy += por_linha @ (ys * ys)
+        s_xy += w_x @ ys
+
+        col_ocupada |= por_coluna > 0
+        cheias = np.flatnonzero(por_linha > 0)
+        if len(cheias):
+            if lin_min < 0:
+                lin_min = i0 + int(cheias[0])
+            lin_max = i0 + int(cheias[-1])
+
+    if s_w <= 0.0:
+        raise ValueError("Máscara vazia (nenhum pixel preenchido).")
+
+    h = float(tamanho_pixel)
+    h2 = h * h
+    a = h2 * s_w
+    xc_px = s_x / s_w
+    yc_px = s_y / s_w
+    ix = h2 * h2 * (s_yy - s_w * yc_px * yc_px + s_w / 12.0)
+    iy = h2 * h2 * (s_xx - s_w * xc_px * xc_px + s_w / 12.0)
+    ixy = h2 * h2 * (s_xy - s_w * xc_px * yc_px)
+
+    x0, y0 = origem
+    xc = x0 + h * (cx0 + xc_px)
+    yc = y0 + h * (cy0 + yc_px)
+
+    cols = np.flatnonzero(col_ocupada)
+    xmin = x0 + h * float(cols[0])
+    xmax = x0 + h * float(cols[-1] + 1)
+    if linha_0_no_topo:
+        ymin = y0 + h * float(n_lin - 1 - lin_max)
+        ymax = y0 + h * float(n_lin - lin_min)
+    else:
+        ymin = y0 + h * float(lin_min)
+        ymax = y0 + h * float(lin_max + 1)
+
+    return (float(a), float(xc), float(yc), float(ix), float(iy), float(ixy)), (xmin, xmax, ymin, ymax)
+
+
+@dataclass(frozen=True, eq=False)
+class FiguraMascara:
+    """Figura definida por uma máscara 2D (protocolo Figura).
+
+    - mascara: array 2D (bool, inteiro ou float), np.memmap ou .npy mapeado;
+    - tamanho_pixel: lado do pixel na unidade da seção;
+    - origem: canto inferior esquerdo da imagem no sistema global;
+    - limiar: binariza tons de cinza (None = peso proporcional ao tom).
+    Os momentos são calculados uma vez, na construção. x, y = centroide.
+    """
+    mascara: Any
+    tamanho_pixel: float
+    origem: Tuple[float, float] = (0.0, 0.0)
+    limiar: Optional[float] = None
+    linha_0_no_topo: bool = True
+    furo: bool = False
+    nome: str = "Máscara"
+    linhas_por_bloco: Optional[int] = None
+
+    x: float = field(init=False)
+    y: float = field(init=False)
+    limites: Tuple[float, float, float, float] = field(init=False, repr=False)
+    _momentos: Tuple[float, float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        (a, xc, yc, ix, iy, ixy), limites = momentos_mascara(
+            self.mascara,
+            self.tamanho_pixel,
+            origem=self.origem,
+            limiar=self.limiar,
+            linha_0_no_topo=self.linha_0_no_topo,
+            linhas_por_bloco=self.linhas_por_bloco,
+        )
+        object.__setattr__(self, "x", xc)
+        object.__setattr__(self, "y", yc)
+        object.__setattr__(self, "limites", limites)
+        object.__setattr__(self, "_momentos", (a, ix, iy, ixy))
+
+    @classmethod
+    def de_arquivo(
+        cls,
+        caminho: str,
+        tamanho_pixel: float,
+        *,
+        forma: Optional[Tuple[int, int]] = None,
+        dtype: Any = np.uint8,
+        **opcoes: Any,
+    ) -> "FiguraMascara":
+        """Abre a máscara sem carregá-la inteira na memória.
+
+        - .npy: np.load(..., mmap_mode="r");
+        - outros (binário cru): np.memmap com `forma` (linhas, colunas) e `dtype`.
+        """
+        if caminho.endswith(".npy"):
+            mascara = np.load(caminho, mmap_mode="r")
+        else:
+            if forma is None:
+                raise ValueError("Informe `forma` (linhas, colunas) para arquivos binários crus.")
+            mascara = np.memmap(caminho, dtype=dtype, mode="r", shape=forma)
+        return cls(mascara=mascara, tamanho_pixel=tamanho_pixel, **opcoes)
+
+    def _valor(self, k: int) -> float:
+        v = self._momentos[k]
+        return -v if self.furo else v
+
+    def area(self) -> float:
+        return self._valor(0)
+
+    def ix_proprio(self) -> float:
+        return self._valor(1)
+
+    def iy_proprio(self) -> float:
+        return self._valor(2)
+
+    def ixy_proprio(self) -> float:
+        return self._valor(3)
@@ -0,0 +1,202 @@
+"""Otimização de dimensões de seções (busca por propriedades-alvo).
+
+Procura os parâmetros de um ModeloSecao (core/varredura.py) que
+minimizam um objetivo (por padrão a área total) respeitando restrições
+como i1 >= alvo, i2 >= alvo ou limites na posição do centroide.
+
+Método: busca aleatória com caixa adaptativa. A cada iteração sorteia
+um hipercubo latino dentro da caixa atual, avalia todos os candidatos de
+uma vez (somas analíticas vetorizadas) e encolhe a caixa em torno do
+melhor ponto. Com workers > 1 os lotes de candidatos são distribuídos
+em um ProcessPoolExecutor (o modelo precisa ser serializável: use
+funções de módulo em vez de lambdas nas expressões).
+
+O ótimo encontrado é conferido no caminho de referência
+(SecaoComposta.calcular).
+"""
+
+from __future__ import annotations
+
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .propriedades import ResultadosSecao
+from .secao_composta import SecaoComposta
+from .varredura import ModeloSecao, ResultadosVarredura, avaliar_pontos, hipercubo_latino
+
+# Peso da violação das restrições na escolha do melhor ponto inviável.
+_PENALIDADE = 1e6
+
+# Campos de ResultadosVarredura aceitos como objetivo ou restrição.
+CAMPOS_OTIMIZAVEIS = tuple(
+    f.name for f in fields(ResultadosVarredura) if f.name not in ("unidade_comprimento", "parametros")
+)
+
+
+@dataclass(frozen=True)
+class Restricao:
+    """Limite em um campo dos resultados (area_total, xg, yg, ix, iy, ixy, i1, i2, ...)."""
+    campo: str
+    minimo: Optional[float] = None
+    maximo: Optional[float] = None
+
+    def violacao(self, valores: np.ndarray) -> np.ndarray:
+        """Violação relativa (0 quando a restrição é atendida)."""
+        v = np.zeros(valores.shape)
+        if self.minimo is not None:
+            escala = max(abs(self.minimo), 1e-12)
+            v = v + np.maximum(self.minimo - valores, 0.0) / escala
+        if self.maximo is not None:
+            escala = max(abs(self.maximo), 1e-12)
+            v = v + np.maximum(valores - self.maximo, 0.0) / escala
+        return np.where(np.isnan(valores), np.inf, v)
+
+
+@dataclass(frozen=True)
+class ResultadoOtimizacao:
+    parametros: Dict[str, float]
+    objetivo: float
+    viavel: bool
+    secao: SecaoComposta
+    resultados: ResultadosSecao
+    avaliacoes: int
+    iteracoes: int
+
+
+def _avaliar_bloco(
+    modelo: ModeloSecao,
+    amostras: Dict[str, np.ndarray],
+    campos: Tuple[str, ...],
+) -> Dict[str, np.ndarray]:
+    """Avalia um bloco de candidatos (roda no processo de trabalho)."""
+    r = avaliar_pontos(modelo, amostras)
+    return {c: np.asarray(getattr(r, c)) for c in campos}
+
+
+def _avaliar(
+    modelo: ModeloSecao,
+    amostras: Dict[str, np.ndarray],
+    campos: Tuple[str, ...],
+    executor: Optional[Executor],
+    n_blocos: int,
+) -> Dict[str, np.ndarray]:
+    if executor is None or n_blocos <= 1:
+        return _avaliar_bloco(modelo, amostras, campos)
+
+    n = len(next(iter(amostras.values())))
+    cortes = np.array_split(np.arange(n), n_blocos)
+    futuros = [
+        executor.submit(_avaliar_bloco, modelo, {k: v[idx] for k, v in amostras.items()}, campos)
+        for idx in cortes if len(idx)
+    ]
+    partes = [f.result() for f in futuros]
+    return {c: np.concatenate([p[c] for p in partes]) for c in campos}
+
+
+def otimizar(
+    modelo: ModeloSecao,
+    limites: Mapping[str, Tuple[float, float]],
+    restricoes: Sequence[Restricao] = (),
+    *,
+    objetivo: str = "area_total",
+    n_amostras: int = 4000,
+    iteracoes: int = 25,
+    contracao: float = 0.6,
+    workers: int = 1,
+    semente: Optional[int] = None,
+) -> ResultadoOtimizacao:
+    """Minimiza `objetivo` nos limites dados, respeitando as restrições.
+
+    limites: {parametro: (mínimo, máximo)}.
+    contracao: fator de encolhimento da caixa de busca a cada iteração.
+    workers: processos usados para avaliar os candidatos (1 = sem pool).
+    objetivo e os campos das restrições: um de CAMPOS_OTIMIZAVEIS.
+    """
+    if not limites:
+        raise ValueError("Informe ao menos um parâmetro em `limites`.")
+    if not 0.0 < contracao < 1.0:
+        raise ValueError("contracao deve estar entre 0 e 1.")
+    if iteracoes < 1 or n_amostras < 1:
+        raise ValueError("iteracoes e n_amostras devem ser >= 1.")
+    invalidos = [c for c in [objetivo] + [r.campo for r in restricoes] if c not in CAMPOS_OTIMIZAVEIS]
+    if invalidos:
+        raise ValueError(f"Campo(s) desconhecido(s): {invalidos}. Use um de: {', '.join(CAMPOS_OTIMIZAVEIS)}.")
+
+    campos = tuple(dict.fromkeys([objetivo] + [r.campo for r in restricoes]))
+    globais = {k: (float(lo), float(hi)) for k, (lo, hi) in limites.items()}
+    caixa = dict(globais)
+    rng = np.random.default_rng(semente)
+
+    melhor_params: Optional[Dict[str, float]] = None
+    melhor_chave = (np.inf, np.inf)  # (violação, objetivo)
+    avaliacoes = 0
+
+    executor: Optional[Executor] = None
+    if workers > 1:
+        try:
+            pickle.dumps(modelo)
+        except Exception as exc:
+            raise ValueError(
+                "Com workers > 1 o modelo precisa ser serializável (pickle); "
+                "use funções de módulo em vez de lambdas."
+            ) from exc
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        for _ in range(iteracoes):
+            amostras = hipercubo_latino(caixa, n_amostras, semente=int(rng.integers(2**32)))
+            if melhor_params is not None:
+                # mantém o melhor ponto atual entre os candidatos
+                for p in amostras:
+                    amostras[p][0] = melhor_params[p]
+
+            valores = _avaliar(modelo, amostras, campos, executor, workers)
+            avaliacoes += n_amostras
+
+            violacao = np.zeros(n_amostras)
+            for restr in restricoes:
+                violacao = violacao + restr.violacao(valores[restr.campo])
+            obj = np.where(np.isnan(valores[objetivo]), np.inf, valores[objetivo])
+
+            viaveis = violacao == 0.0
+            if viaveis.any():
+                k = int(np.argmin(np.where(viaveis, obj, np.inf)))
+            else:
+                k = int(np.argmin(violacao * _PENALIDADE + obj))
+
+            chave = (float(violacao[k]), float(obj[k]))
+            if chave < melhor_chave:
+                melhor_chave = chave
+                melhor_params = {p: float(v[k]) for p, v in amostras.items()}
+            if melhor_params is None:
+                continue
+
+            # encolhe a caixa em torno do melhor ponto (sem sair dos limites)
+            for p, (lo, hi) in globais.items():
+                meia = 0.5 * (caixa[p][1] - caixa[p][0]) * contracao
+                centro = melhor_params[p]
+                caixa[p] = (max(lo, centro - meia), min(hi, centro + meia))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if melhor_params is None:
+        raise ValueError(
+            f"Nenhum candidato avaliável para {objetivo!r}: objetivo e restrições deram NaN/infinito "
+            "em todas as amostras. Revise os limites e o modelo."
+        )
+    secao = modelo.instanciar(melhor_params)
+    resultados = secao.calcular(modo="quiet")
+    return ResultadoOtimizacao(
+        parametros=melhor_params,
+        objetivo=float(getattr(resultados, objetivo)),
+        viavel=melhor_chave[0] == 0.0,
+        secao=secao,
+        resultados=resultados,
+        avaliacoes=avaliacoes,
+        iteracoes=iteracoes,
+    )
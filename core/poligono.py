@@ -0,0 +1,126 @@
+"""Polígono arbitrário (contorno externo + furos internos).
+
+Área, centroide e momentos próprios saem das fórmulas de Green
+("shoelace") sobre as arestas, em bloco (NumPy). Para cada anel com
+vértices (xi, yi) e ci = xi·y(i+1) - x(i+1)·yi:
+
+    A    = 1/2  Σ ci
+    ∫x   = 1/6  Σ (xi + xi+1) ci
+    ∫y   = 1/6  Σ (yi + yi+1) ci
+    ∫x²  = 1/12 Σ (xi² + xi·xi+1 + xi+1²) ci
+    ∫y²  = 1/12 Σ (yi² + yi·yi+1 + yi+1²) ci
+    ∫xy  = 1/24 Σ (xi·yi+1 + 2xi·yi + 2xi+1·yi+1 + xi+1·yi) ci
+
+As somas são feitas com os vértices transladados para perto do próprio
+polígono (evita cancelamento com coordenadas grandes). O sentido de
+percurso dos anéis não importa: o contorno soma e os furos subtraem.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+
+Pontos = Any  # sequência de (x, y) ou array (n, 2)
+
+
+def _anel(pontos: Pontos) -> np.ndarray:
+    v = np.asarray(pontos, dtype=float)
+    if v.ndim != 2 or v.shape[1] != 2:
+        raise ValueError("Vértices do polígono devem ter formato (n, 2).")
+    if len(v) > 1 and np.array_equal(v[0], v[-1]):
+        v = v[:-1]  # anel fechado explicitamente
+    if len(v) < 3:
+        raise ValueError("Polígono precisa de pelo menos 3 vértices.")
+    return v
+
+
+def integrais_anel(v: np.ndarray) -> Tuple[float, float, float, float, float, float]:
+    """(A, ∫x, ∫y, ∫x², ∫y², ∫xy) de um anel, com sinal do sentido de percurso."""
+    x = v[:, 0]
+    y = v[:, 1]
+    x1 = np.roll(x, -1)
+    y1 = np.roll(y, -1)
+    c = x * y1 - x1 * y
+    area = 0.5 * c.sum()
+    sx = (c * (x + x1)).sum() / 6.0
+    sy = (c * (y + y1)).sum() / 6.0
+    sxx = (c * (x * x + x * x1 + x1 * x1)).sum() / 12.0
+    syy = (c * (y * y + y * y1 + y1 * y1)).sum() / 12.0
+    sxy = (c * (x * y1 + 2.0 * x * y + 2.0 * x1 * y1 + x1 * y)).sum() / 24.0
+    return float(area), float(sx), float(sy), float(sxx), float(syy), float(sxy)
+
+
+@dataclass(frozen=True, eq=False)
+class Poligono:
+    """Polígono simples, com furos opcionais (anéis internos).
+
+    - vertices: contorno externo, (n, 2) ou lista de (x, y);
+    - furos: anéis internos (cada um no mesmo formato);
+    - furo=True subtrai o polígono inteiro da seção, como nas outras figuras.
+
+    x, y (centroide) são calculados a partir dos vértices.
+    """
+    vertices: Pontos
+    furos: Sequence[Pontos] = ()
+    furo: bool = False
+    nome: str = "Polígono"
+
+    x: float = field(init=False)
+    y: float = field(init=False)
+    _momentos: Tuple[float, float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        externo = _anel(self.vertices)
+        internos = tuple(_anel(f) for f in self.furos)
+        object.__setattr__(self, "vertices", externo)
+        object.__setattr__(self, "furos", internos)
+
+        # referência local: primeiro vértice do contorno
+        ref = externo[0]
+        totais = np.zeros(6)
+        for k, anel in enumerate((externo,) + internos):
+            t = np.array(integrais_anel(anel - ref))
+            sinal = 1.0 if (t[0] >= 0) == (k == 0) else -1.0  # contorno soma, furos subtraem
+            totais += sinal * t
+
+        a, sx, sy, sxx, syy, sxy = totais
+        if a <= 0.0:
+            raise ValueError("Área do polígono deve ser positiva (furos maiores que o contorno?).")
+        xc = sx / a
+        yc = sy / a
+        object.__setattr__(self, "x", float(ref[0] + xc))
+        object.__setattr__(self, "y", float(ref[1] + yc))
+        object.__setattr__(self, "_momentos", (
+            float(a),
+            float(syy - a * yc * yc),
+            float(sxx - a * xc * xc),
+            float(sxy - a * xc * yc),
+        ))
+
+    @property
+    def aneis(self) -> Tuple[np.ndarray, ...]:
+        """Contorno externo seguido dos furos (arrays (n, 2), sem repetir o 1º vértice)."""
+        return (self.vertices,) + tuple(self.furos)
+
+    @property
+    def n_vertices(self) -> int:
+        return sum(len(a) for a in self.aneis)
+
+    def _valor(self, k: int) -> float:
+        v = self._momentos[k]
+        return -v if self.furo else v
+
+    def area(self) -> float:
+        return self._valor(0)
+
+    def ix_proprio(self) -> float:
+        return self._valor(1)
+
+    def iy_proprio(self) -> float:
+        return self._valor(2)
+
+    def ixy_proprio(self) -> float:
+        return self._valor(3)
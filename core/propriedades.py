@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from .eixos_principais import eixos_principais
 
 @dataclass(frozen=True)
 class ResultadosSecao:
@@ -40,3 +42,7 @@ class ResultadosSecao:
             "alpha2_rad": self.alpha2_rad,
             "extras": self.extras or {},
         }
+
+    def eixos_principais(self, convencao: str = "trigonometrica", *, graus: bool = False) -> Tuple[float, float, float, float]:
+        """(I1, I2, alpha1, alpha2) na convenção pedida (ver core.eixos_principais)."""
+        return eixos_principais(self.ix, self.iy, self.ixy, convencao, graus=graus)
@@ -3,17 +3,62 @@
 from __future__ import annotations
 
 import math
+import time
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, MutableSequence, Optional, Tuple, Dict, Any
 
+from .eixos_principais import eixos_principais
 from .figuras import Figura
 from .propriedades import ResultadosSecao
+from .somatorio import CUSTO, somar, validar_estrategia
 
 
 def _deg(rad: float) -> float:
     return math.degrees(rad)
 
 
+def _montar_resultados(
+    unidade: str,
+    area_total: float,
+    xg: float,
+    yg: float,
+    ix: float,
+    iy: float,
+    ixy: float,
+    i1: float,
+    i2: float,
+    alpha1: float,
+    alpha2: float,
+    ab_rows: List[Dict[str, Any]],
+    extras_adicionais: Optional[Dict[str, Any]] = None,
+) -> ResultadosSecao:
+    """Monta o ResultadosSecao (mesmo formato para todos os motores de cálculo)."""
+    extras = {
+        "alpha1_graus": _deg(alpha1),
+        "alpha2_graus": _deg(alpha2),
+        "unidade_area": f"{unidade}²",
+        "unidade_inercia": f"{unidade}⁴",
+        "parametros_ab": ab_rows,
+        "definicao_a_b": "a = yi - Yg; b = xi - Xg"
+    }
+    if extras_adicionais:
+        extras.update(extras_adicionais)
+    return ResultadosSecao(
+        unidade_comprimento=unidade,
+        area_total=area_total,
+        xg=xg,
+        yg=yg,
+        ix=ix,
+        iy=iy,
+        ixy=ixy,
+        i1=i1,
+        i2=i2,
+        alpha1_rad=alpha1,
+        alpha2_rad=alpha2,
+        extras=extras,
+    )
+
+
 @dataclass
 class SecaoComposta:
     """Seção composta por figuras.
@@ -21,13 +66,25 @@ class SecaoComposta:
     Parâmetros:
     - unidade_comprimento: apenas metadado (ex.: "mm", "cm", "m").
       Você pode mudar manualmente no código enquanto testa.
+    - figuras: lista de figuras; para seções muito grandes passe uma
+      TabelaFiguras (core/tabela_figuras.py), bem mais compacta.
     """
     unidade_comprimento: str = "cm"
-    figuras: List[Figura] = field(default_factory=list)
+    figuras: MutableSequence[Figura] = field(default_factory=list)
 
     def adicionar(self, figura: Figura) -> None:
         self.figuras.append(figura)
 
+    def remover(self, indice: int) -> Figura:
+        """Remove e devolve a figura na posição `indice` (base 0)."""
+        return self.figuras.pop(indice)
+
+    def substituir(self, indice: int, figura: Figura) -> Figura:
+        """Troca a figura na posição `indice` (base 0) e devolve a antiga."""
+        antiga = self.figuras[indice]
+        self.figuras[indice] = figura
+        return antiga
+
     def limpar(self) -> None:
         self.figuras.clear()
 
@@ -39,6 +96,9 @@ class SecaoComposta:
         *,
         modo: str = "quiet",
         logger: Optional[Any] = None,
+        motor: str = "python",
+        soma: Optional[str] = None,
+        derivadas: bool = False,
     ) -> ResultadosSecao:
         """Calcula propriedades.
 
@@ -47,19 +107,43 @@ class SecaoComposta:
           - "verbose": imprime passo a passo (didático)
         logger:
           - opcional. Se passado, registra DEBUG/INFO.
+        motor:
+          - "python": laço figura a figura (caminho de referência)
+          - "numpy": kernel vetorizado (core/vetorizado.py), para seções
+            com milhares de figuras. Com modo="verbose" usa sempre o laço.
+        soma:
+          - estratégia de somatório dos totais (core/somatorio.py):
+            "naive", "pairwise", "neumaier" ou "fsum".
+            Padrão: "naive" no motor python e "pairwise" no numpy.
+            O custo (estratégia e tempo gasto nas somas) vai em extras["soma"].
+        derivadas:
+          - True inclui raios de giração, fibras extremas e módulos
+            resistentes em extras["derivadas"] (core/derivadas.py).
         """
         if not self.figuras:
             raise ValueError("Nenhuma figura adicionada na seção.")
 
         verbose = (modo.lower().strip() == "verbose")
 
+        motor = motor.lower().strip()
+        if motor not in ("python", "numpy"):
+            raise ValueError(f"Motor de cálculo desconhecido: {motor}")
+        if motor == "numpy" and not verbose:
+            from .vetorizado import calcular_vetorizado
+            return self._com_derivadas(calcular_vetorizado(
+                self.figuras, self.unidade_comprimento, logger=logger, soma=soma or "pairwise",
+            ), derivadas)
+        estrategia = validar_estrategia(soma or "naive")
+        tempo_soma = 0.0
+
         if logger:
             logger.debug("Iniciando cálculo: %d figuras", len(self.figuras))
 
         # PASSO 1: Centroide global
-        soma_a = 0.0
-        soma_ax = 0.0
-        soma_ay = 0.0
+        termos_a: List[float] = []
+        termos_ax: List[float] = []
+        termos_ay: List[float] = []
+        proprios: List[Tuple[float, float, float, float]] = []  # (A, Ix̄, Iȳ, Ix̄ȳ) por figura
 
         if verbose:
             print("\n" + "=" * 70)
@@ -69,13 +153,15 @@ class SecaoComposta:
             print("-" * 70)
 
         for i, fig in enumerate(self.figuras, start=1):
-            a = float(fig.area())
+            props = (float(fig.area()), float(fig.ix_proprio()), float(fig.iy_proprio()), float(fig.ixy_proprio()))
+            proprios.append(props)
+            a = props[0]
             ax = a * float(fig.x)
             ay = a * float(fig.y)
 
-            soma_a += a
-            soma_ax += ax
-            soma_ay += ay
+            termos_a.append(a)
+            termos_ax.append(ax)
+            termos_ay.append(ay)
 
             if logger:
                 logger.debug("Fig %d %s: A=%g x=%g y=%g", i, getattr(fig, "nome", "Figura"), a, fig.x, fig.y)
@@ -84,6 +170,12 @@ class SecaoComposta:
                 nome = getattr(fig, "nome", "Figura")
                 print(f"{i:<5} {nome:<18} {a:>12.4f} {fig.x:>10.4f} {fig.y:>10.4f} {ax:>12.4f} {ay:>12.4f}")
 
+        t0 = time.perf_counter()
+        soma_a = somar(termos_a, estrategia)
+        soma_ax = somar(termos_ax, estrategia)
+        soma_ay = somar(termos_ay, estrategia)
+        tempo_soma += time.perf_counter() - t0
+
         if abs(soma_a) < 1e-12:
             raise ValueError("Área total ~ 0. Verifique furos e figuras (A_total não pode ser zero).")
 
@@ -96,7 +188,7 @@ class SecaoComposta:
             print(f"✅ Centroide: Xg = {xg:.4f} | Yg = {yg:.4f}  (unid: {self.unidade_comprimento})")
 
         # PASSO 2: distâncias (a, b)
-        parametros: List[Tuple[Figura, float, float]] = []
+        parametros: List[Tuple[Figura, float, float, Tuple[float, float, float, float]]] = []
         ab_rows: List[Dict[str, Any]] = []  # a=yi-Yg, b=xi-Xg (para UI/relatório)
         if verbose:
             print("\n" + "=" * 70)
@@ -105,14 +197,14 @@ class SecaoComposta:
             print(f"{'Fig':<5} {'xi':>10} {'yi':>10} {'a=yi-Yg':>12} {'b=xi-Xg':>12}")
             print("-" * 70)
 
-        for i, fig in enumerate(self.figuras, start=1):
+        for i, (fig, props) in enumerate(zip(self.figuras, proprios), start=1):
             a = float(fig.y) - yg
             b = float(fig.x) - xg
-            parametros.append((fig, a, b))
+            parametros.append((fig, a, b, props))
             ab_rows.append({
                 "idx": i,
                 "nome": getattr(fig, "nome", "Figura"),
-                "area": float(fig.area()),
+                "area": props[0],
                 "xi": float(fig.x),
                 "yi": float(fig.y),
                 "a": a,
@@ -126,9 +218,9 @@ class SecaoComposta:
                 print(f"{i:<5} {fig.x:>10.4f} {fig.y:>10.4f} {a:>12.4f} {b:>12.4f}")
 
         # PASSO 3: Steiner
-        ix_total = 0.0
-        iy_total = 0.0
-        ixy_total = 0.0
+        termos_ix: List[float] = []
+        termos_iy: List[float] = []
+        termos_ixy: List[float] = []
 
         if verbose:
             print("\n" + "=" * 70)
@@ -138,19 +230,15 @@ class SecaoComposta:
             print(f"{'Fig':<5} {'A':>12} {'a':>10} {'b':>10} {'Ix̄':>12} {'A a²':>12} {'Ix_i':>12}")
             print("-" * 70)
 
-        for i, (fig, a, b) in enumerate(parametros, start=1):
-            A = float(fig.area())
-            ix0 = float(fig.ix_proprio())
-            iy0 = float(fig.iy_proprio())
-            ixy0 = float(fig.ixy_proprio())
+        for i, (fig, a, b, (A, ix0, iy0, ixy0)) in enumerate(parametros, start=1):
 
             ix = ix0 + A * a * a
             iy = iy0 + A * b * b
             ixy = ixy0 + A * a * b
 
-            ix_total += ix
-            iy_total += iy
-            ixy_total += ixy
+            termos_ix.append(ix)
+            termos_iy.append(iy)
+            termos_ixy.append(ixy)
 
             if logger:
                 logger.debug("Fig %d: Ix=%g Iy=%g Ixy=%g", i, ix, iy, ixy)
@@ -158,23 +246,18 @@ class SecaoComposta:
             if verbose:
                 print(f"{i:<5} {A:>12.4f} {a:>10.4f} {b:>10.4f} {ix0:>12.4f} {A*a*a:>12.4f} {ix:>12.4f}")
 
+        t0 = time.perf_counter()
+        ix_total = somar(termos_ix, estrategia)
+        iy_total = somar(termos_iy, estrategia)
+        ixy_total = somar(termos_ixy, estrategia)
+        tempo_soma += time.perf_counter() - t0
+
         if verbose:
             print("-" * 70)
             print(f"✅ Ix = {ix_total:.4f} | Iy = {iy_total:.4f} | Ixy = {ixy_total:.4f}  (unid^4: {self.unidade_comprimento}⁴)")
 
         # PASSO 4: Eixos principais
-        termo1 = (ix_total + iy_total) / 2
-        termo2 = math.sqrt(((ix_total - iy_total) / 2) ** 2 + ixy_total ** 2)
-
-        i1 = termo1 + termo2
-        i2 = termo1 - termo2
-
-        # alpha1: 0.5 * atan(2Ixy / (Iy - Ix))
-        if abs(iy_total - ix_total) < 1e-12:
-            alpha1 = math.pi / 4
-        else:
-            alpha1 = 0.5 * math.atan2(2 * ixy_total, (iy_total - ix_total))
-        alpha2 = alpha1 + math.pi / 2
+        i1, i2, alpha1, alpha2 = eixos_principais(ix_total, iy_total, ixy_total)
 
         if verbose:
             print("\n" + "=" * 70)
@@ -184,27 +267,20 @@ class SecaoComposta:
             print(f"✅ α1 = {alpha1:.6f} rad ({_deg(alpha1):.2f}°)")
             print(f"✅ α2 = {alpha2:.6f} rad ({_deg(alpha2):.2f}°)")
 
-        return ResultadosSecao(
-            unidade_comprimento=self.unidade_comprimento,
-            area_total=soma_a,
-            xg=xg,
-            yg=yg,
-            ix=ix_total,
-            iy=iy_total,
-            ixy=ixy_total,
-            i1=i1,
-            i2=i2,
-            alpha1_rad=alpha1,
-            alpha2_rad=alpha2,
-            extras={
-                "alpha1_graus": _deg(alpha1),
-                "alpha2_graus": _deg(alpha2),
-                "unidade_area": f"{self.unidade_comprimento}²",
-                "unidade_inercia": f"{self.unidade_comprimento}⁴",
-                "parametros_ab": ab_rows,
-                "definicao_a_b": "a = yi - Yg; b = xi - Xg"
-            },
-        )
+        return self._com_derivadas(_montar_resultados(
+            self.unidade_comprimento,
+            soma_a, xg, yg,
+            ix_total, iy_total, ixy_total,
+            i1, i2, alpha1, alpha2,
+            ab_rows,
+            {"soma": {"estrategia": estrategia, "tempo_s": tempo_soma, "custo": CUSTO[estrategia]}},
+        ), derivadas)
+
+    def _com_derivadas(self, resultados: ResultadosSecao, derivadas: bool) -> ResultadosSecao:
+        if derivadas:
+            from .derivadas import calcular_derivadas
+            resultados.extras["derivadas"] = calcular_derivadas(self.figuras, resultados).como_dict()
+        return resultados
 
     def resumo(self, resultados: ResultadosSecao) -> str:
         u = resultados.unidade_comprimento
@@ -0,0 +1,201 @@
+"""Seção composta incremental (atualizações O(1)).
+
+A seção guarda os momentos de 1ª e 2ª ordem em relação a um ponto de
+referência fixo (x_ref, y_ref):
+
+    ΣA, ΣA·dx, ΣA·dy, Σ(Iȳ + A·dx²), Σ(Ix̄ + A·dy²), Σ(Ix̄ȳ + A·dx·dy)
+
+com dx = x - x_ref e dy = y - y_ref. Adicionar, remover ou trocar uma
+figura só soma/subtrai a contribuição dela. As propriedades centroidais
+saem da translação de eixos (Steiner "ao contrário"):
+
+    Ix = Σ(Ix̄ + A·dy²) - (ΣA·dy)² / ΣA   (idem para Iy e Ixy)
+
+Controle de deriva numérica:
+- a cada `ressomar_a_cada` atualizações os totais são refeitos do zero
+  (math.fsum) e a referência passa a ser o centroide atual;
+- o mesmo acontece quando ΣA fica pequena frente a Σ|A| (cancelamento
+  forte depois de remover figuras).
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .figuras import Figura
+from .propriedades import ResultadosSecao
+from .eixos_principais import eixos_principais
+from .secao_composta import SecaoComposta, _montar_resultados
+from .somatorio import CUSTO
+
+# ΣA pequena frente a Σ|A| => totais perdem dígitos; refaz a soma.
+_LIMIAR_CANCELAMENTO = 1e-8
+
+
+@dataclass
+class SecaoIncremental(SecaoComposta):
+    """SecaoComposta com totais mantidos a cada adicionar/remover/substituir.
+
+    Importante: altere as figuras só pelos métodos da seção; mexer
+    diretamente em `figuras` deixa os totais desatualizados (nesse caso,
+    chame `ressomar()`).
+    """
+    ressomar_a_cada: int = 10_000
+
+    _x_ref: float = field(default=0.0, init=False, repr=False)
+    _y_ref: float = field(default=0.0, init=False, repr=False)
+    _totais: List[float] = field(default_factory=lambda: [0.0] * 7, init=False, repr=False)
+    _atualizacoes: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.ressomar()
+
+    # -----------------------------
+    # Totais
+    # -----------------------------
+    def _contribuicao(self, fig: Figura) -> List[float]:
+        """[A, A·dx, A·dy, Iȳ + A·dx², Ix̄ + A·dy², Ix̄ȳ + A·dx·dy, |A|]."""
+        a = float(fig.area())
+        dx = float(fig.x) - self._x_ref
+        dy = float(fig.y) - self._y_ref
+        return [
+            a,
+            a * dx,
+            a * dy,
+            float(fig.iy_proprio()) + a * dx * dx,
+            float(fig.ix_proprio()) + a * dy * dy,
+            float(fig.ixy_proprio()) + a * dx * dy,
+            abs(a),
+        ]
+
+    def _acumular(self, fig: Figura, sinal: float) -> None:
+        t = self._totais
+        for k, v in enumerate(self._contribuicao(fig)):
+            t[k] += sinal * v
+        self._atualizacoes += 1
+
+    def _conferir_deriva(self) -> None:
+        """Ressoma se preciso; só depois de todas as parcelas de uma edição."""
+        t = self._totais
+        if self._atualizacoes >= self.ressomar_a_cada:
+            self.ressomar()
+        elif self.figuras and abs(t[0]) < _LIMIAR_CANCELAMENTO * t[6]:
+            self.ressomar()
+
+    def ressomar(self) -> None:
+        """Refaz os totais do zero (math.fsum) com referência no centroide atual."""
+        self._x_ref = 0.0
+        self._y_ref = 0.0
+        if self.figuras:
+            contrib = [self._contribuicao(f) for f in self.figuras]
+            soma_a = math.fsum(c[0] for c in contrib)
+            if abs(soma_a) >= 1e-12:
+                self._x_ref = math.fsum(c[1] for c in contrib) / soma_a
+                self._y_ref = math.fsum(c[2] for c in contrib) / soma_a
+                contrib = [self._contribuicao(f) for f in self.figuras]
+            self._totais = [math.fsum(c[k] for c in contrib) for k in range(7)]
+        else:
+            self._totais = [0.0] * 7
+        self._atualizacoes = 0
+
+    # -----------------------------
+    # Edição
+    # -----------------------------
+    def adicionar(self, figura: Figura) -> None:
+        self.figuras.append(figura)
+        self._acumular(figura, +1.0)
+        self._conferir_deriva()
+
+    def remover(self, indice: int) -> Figura:
+        removida = self.figuras.pop(indice)
+        self._acumular(removida, -1.0)
+        self._conferir_deriva()
+        return removida
+
+    def substituir(self, indice: int, figura: Figura) -> Figura:
+        antiga = self.figuras[indice]
+        self.figuras[indice] = figura
+        self._acumular(antiga, -1.0)
+        self._acumular(figura, +1.0)
+        self._conferir_deriva()
+        return antiga
+
+    def limpar(self) -> None:
+        self.figuras.clear()
+        self.ressomar()
+
+    # -----------------------------
+    # Cálculo
+    # -----------------------------
+    def calcular(
+        self,
+        *,
+        modo: str = "quiet",
+        logger: Optional[Any] = None,
+        motor: str = "python",
+        soma: Optional[str] = None,
+        derivadas: bool = False,
+        incluir_ab: bool = True,
+    ) -> ResultadosSecao:
+        """Calcula propriedades a partir dos totais (O(1)).
+
+        Com modo="verbose", motor="numpy" ou uma estratégia `soma`
+        explícita usa o cálculo completo de SecaoComposta.
+        incluir_ab=False omite a tabela parametros_ab (a única parte O(n)
+        do resultado).
+        derivadas=True inclui extras["derivadas"], como em SecaoComposta.
+        extras["soma"] traz a estratégia dos totais: "fsum" logo depois de
+        uma ressoma, "naive" quando há atualizações acumuladas (+=/-=).
+        """
+        if modo.lower().strip() == "verbose" or motor.lower().strip() != "python" or soma:
+            return super().calcular(modo=modo, logger=logger, motor=motor, soma=soma, derivadas=derivadas)
+
+        if not self.figuras:
+            raise ValueError("Nenhuma figura adicionada na seção.")
+
+        t0 = time.perf_counter()
+        soma_a, s_x, s_y, s_xx, s_yy, s_xy, _ = self._totais
+        if abs(soma_a) < 1e-12:
+            raise ValueError("Área total ~ 0. Verifique furos e figuras (A_total não pode ser zero).")
+
+        dxg = s_x / soma_a
+        dyg = s_y / soma_a
+        xg = self._x_ref + dxg
+        yg = self._y_ref + dyg
+
+        ix_total = s_yy - soma_a * dyg * dyg
+        iy_total = s_xx - soma_a * dxg * dxg
+        ixy_total = s_xy - soma_a * dxg * dyg
+        tempo_soma = time.perf_counter() - t0
+        estrategia = "naive" if self._atualizacoes else "fsum"
+
+        i1, i2, alpha1, alpha2 = eixos_principais(ix_total, iy_total, ixy_total)
+
+        if logger:
+            logger.debug("Incremental: %d figuras, %d atualizações desde a última ressoma",
+                         len(self.figuras), self._atualizacoes)
+
+        ab_rows: List[Dict[str, Any]] = []
+        if incluir_ab:
+            for i, fig in enumerate(self.figuras, start=1):
+                ab_rows.append({
+                    "idx": i,
+                    "nome": getattr(fig, "nome", "Figura"),
+                    "area": float(fig.area()),
+                    "xi": float(fig.x),
+                    "yi": float(fig.y),
+                    "a": float(fig.y) - yg,
+                    "b": float(fig.x) - xg,
+                })
+
+        return self._com_derivadas(_montar_resultados(
+            self.unidade_comprimento,
+            soma_a, xg, yg,
+            ix_total, iy_total, ixy_total,
+            i1, i2, alpha1, alpha2,
+            ab_rows,
+            {"soma": {"estrategia": estrategia, "tempo_s": tempo_soma, "custo": CUSTO[estrategia]}},
+        ), derivadas)
@@ -0,0 +1,103 @@
+"""Estratégias de somatório para os totais da seção.
+
+Com dezenas de milhares de furos subtraídos de uma chapa grande, a soma
+ingênua (+=) perde dígitos por cancelamento (Ixy e A_total ficam visivelmente
+errados). Aqui ficam as alternativas, da mais rápida à mais exata:
+
+- "naive":    acumulação sequencial (+=). Erro ~ n·ε·Σ|x|.
+- "pairwise": soma por pares (recursiva). Erro ~ log2(n)·ε·Σ|x|.
+              É o que o NumPy faz em np.sum (padrão do motor "numpy").
+- "neumaier": soma compensada (Kahan-Babuška-Neumaier). Erro ~ ε·Σ|x|,
+              independe de n; ~4 operações por termo.
+- "fsum":     math.fsum, resultado corretamente arredondado (exato para
+              os termos dados); o mais lento.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, Sequence
+
+ESTRATEGIAS = ("naive", "pairwise", "neumaier", "fsum")
+
+# Custo/precisão de cada estratégia (reportado em extras["soma"]).
+CUSTO: Dict[str, str] = {
+    "naive": "1 soma por termo; erro ~ n·ε·Σ|x|",
+    "pairwise": "1 soma por termo (recursão log n); erro ~ log2(n)·ε·Σ|x|",
+    "neumaier": "~4 operações por termo; erro ~ ε·Σ|x| (independe de n)",
+    "fsum": "parciais exatas (math.fsum); arredondamento único, o mais lento",
+}
+
+# Abaixo disso a soma por pares cai para a soma sequencial.
+_BLOCO_PAIRWISE = 16
+
+
+def validar_estrategia(estrategia: str) -> str:
+    est = estrategia.lower().strip()
+    if est not in ESTRATEGIAS:
+        raise ValueError(f"Estratégia de soma desconhecida: {estrategia} (use {', '.join(ESTRATEGIAS)})")
+    return est
+
+
+def _naive(valores: Iterable[float]) -> float:
+    # Laço explícito: a partir do Python 3.12, sum() de floats já é compensado.
+    total = 0.0
+    for v in valores:
+        total += v
+    return total
+
+
+def _pairwise(valores: Sequence[float], ini: int, fim: int) -> float:
+    if fim - ini <= _BLOCO_PAIRWISE:
+        total = 0.0
+        for k in range(ini, fim):
+            total += valores[k]
+        return total
+    meio = (ini + fim) // 2
+    return _pairwise(valores, ini, meio) + _pairwise(valores, meio, fim)
+
+
+def _neumaier(valores: Iterable[float]) -> float:
+    s = 0.0
+    c = 0.0
+    for v in valores:
+        t = s + v
+        if abs(s) >= abs(v):
+            c += (s - t) + v
+        else:
+            c += (v - t) + s
+        s = t
+    return s + c
+
+
+def somar(valores: Sequence[float], estrategia: str = "naive") -> float:
+    """Soma uma sequência de floats com a estratégia escolhida."""
+    est = validar_estrategia(estrategia)
+    if est == "naive":
+        return _naive(valores)
+    if est == "pairwise":
+        return _pairwise(valores, 0, len(valores))
+    if est == "neumaier":
+        return _neumaier(valores)
+    return math.fsum(valores)
+
+
+def somar_array(valores: Any, estrategia: str = "pairwise") -> float:
+    """Mesma ideia para arrays NumPy (motor vetorizado).
+
+    "naive" acumula em sequência (np.add.accumulate, sem a divisão por
+    pares); "pairwise" é np.sum; "neumaier" e "fsum" percorrem os valores
+    em Python e custam bem mais.
+    """
+    import numpy as np
+
+    est = validar_estrategia(estrategia)
+    if est == "naive":
+        arr = np.asarray(valores, dtype=float).ravel()
+        return float(np.add.accumulate(arr)[-1]) if arr.size else 0.0
+    if est == "pairwise":
+        return float(np.sum(valores))
+    lista = np.asarray(valores, dtype=float).ravel().tolist()
+    if est == "neumaier":
+        return _neumaier(lista)
+    return math.fsum(lista)
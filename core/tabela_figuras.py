@@ -0,0 +1,243 @@
+"""Tabela compacta de figuras (armazenamento em colunas).
+
+Uma lista de dataclasses custa algumas centenas de bytes por figura
+(objeto + __dict__ + floats + string do nome). Em uma chapa com um
+milhão de furos isso passa de centenas de MB. A TabelaFiguras guarda
+cada campo em um array.array tipado:
+
+    tipo (int8) | p1, p2, x, y (float64) | furo (int8) | sinal_ixy (int8)
+
+~35 bytes por figura primitiva. p1/p2 seguem os códigos de tipo de
+core/figuras.py (base/altura ou raio).
+
+Ela se comporta como uma lista de figuras (append, insert, del, pop,
+índices e fatias, iteração): ao ler uma posição, a dataclass correspondente é
+reconstruída. Figuras fora das primitivas (ou com `nome` personalizado)
+ficam guardadas como objeto, à parte.
+
+Use como armazenamento de uma seção:
+
+    secao = SecaoComposta(figuras=TabelaFiguras())
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, MutableSequence, Union, overload
+
+from .figuras import (
+    _CODIGOS,
+    TIPO_CIRCULO,
+    TIPO_GENERICO,
+    TIPO_QUARTO_CIRCULO,
+    TIPO_RETANGULO,
+    TIPO_SEMICIRCULO,
+    TIPO_TRIANGULO,
+    Circulo,
+    Figura,
+    QuartoCirculo,
+    Retangulo,
+    Semicirculo,
+    TrianguloRetangulo,
+)
+
+_CLASSES = {cod: cls for cls, cod in _CODIGOS.items()}
+
+# Nome padrão de cada classe (figuras com outro nome vão como objeto).
+_NOMES_PADRAO = {cod: cls.__dataclass_fields__["nome"].default for cls, cod in _CODIGOS.items()}
+
+
+class TabelaFiguras(MutableSequence[Figura]):
+    """Sequência de figuras guardada em colunas (array.array)."""
+
+    def __init__(self, figuras: Iterable[Figura] = ()) -> None:
+        self.tipo = array("b")
+        self.p1 = array("d")
+        self.p2 = array("d")
+        self.x = array("d")
+        self.y = array("d")
+        self.furo = array("b")
+        self.sinal = array("b")
+        # posição -> objeto, para figuras genéricas
+        self._objetos: Dict[int, Figura] = {}
+        self.extend(figuras)
+
+    # -----------------------------
+    # Conversão linha <-> figura
+    # -----------------------------
+    @staticmethod
+    def _linha(fig: Figura) -> tuple:
+        """(tipo, p1, p2, x, y, furo, sinal) de uma figura."""
+        cod = _CODIGOS.get(type(fig), TIPO_GENERICO)
+        if cod != TIPO_GENERICO and fig.nome != _NOMES_PADRAO[cod]:
+            cod = TIPO_GENERICO
+        if cod == TIPO_RETANGULO or cod == TIPO_TRIANGULO:
+            p1, p2 = fig.base, fig.altura
+        elif cod == TIPO_GENERICO:
+            p1 = p2 = 0.0
+        else:
+            p1, p2 = fig.raio, 0.0
+        furo = bool(fig.furo) if cod != TIPO_GENERICO else False
+        return cod, p1, p2, float(fig.x), float(fig.y), furo, getattr(fig, "sinal_ixy", 1)
+
+    def _figura(self, i: int) -> Figura:
+        cod = self.tipo[i]
+        if cod == TIPO_GENERICO:
+            return self._objetos[i]
+        x, y, furo = self.x[i], self.y[i], bool(self.furo[i])
+        if cod == TIPO_RETANGULO:
+            return Retangulo(base=self.p1[i], altura=self.p2[i], x=x, y=y, furo=furo)
+        if cod == TIPO_CIRCULO:
+            return Circulo(raio=self.p1[i], x=x, y=y, furo=furo)
+        if cod == TIPO_TRIANGULO:
+            return TrianguloRetangulo(base=self.p1[i], altura=self.p2[i], x=x, y=y,
+                                      sinal_ixy=self.sinal[i], furo=furo)
+        if cod == TIPO_SEMICIRCULO:
+            return Semicirculo(raio=self.p1[i], x=x, y=y, furo=furo)
+        if cod == TIPO_QUARTO_CIRCULO:
+            return QuartoCirculo(raio=self.p1[i], x=x, y=y, sinal_ixy=self.sinal[i], furo=furo)
+        raise ValueError(f"Código de tipo inválido na tabela: {cod}")
+
+    def _colunas(self) -> tuple:
+        return self.tipo, self.p1, self.p2, self.x, self.y, self.furo, self.sinal
+
+    def _indice(self, i: int) -> int:
+        n = len(self.tipo)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice fora da tabela de figuras")
+        return i
+
+    # -----------------------------
+    # Protocolo de sequência
+    # -----------------------------
+    def __len__(self) -> int:
+        return len(self.tipo)
+
+    @overload
+    def __getitem__(self, i: int) -> Figura: ...
+    @overload
+    def __getitem__(self, i: slice) -> List[Figura]: ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Figura, List[Figura]]:
+        if isinstance(i, slice):
+            return [self._figura(k) for k in range(*i.indices(len(self)))]
+        return self._figura(self._indice(i))
+
+    @overload
+    def __setitem__(self, i: int, fig: Figura) -> None: ...
+    @overload
+    def __setitem__(self, i: slice, fig: Iterable[Figura]) -> None: ...
+
+    def __setitem__(self, i: Union[int, slice], fig: Any) -> None:
+        if isinstance(i, slice):
+            self._atribuir_fatia(i, list(fig))
+            return
+        i = self._indice(i)
+        linha = self._linha(fig)
+        for col, v in zip(self._colunas(), linha):
+            col[i] = v
+        if linha[0] == TIPO_GENERICO:
+            self._objetos[i] = fig
+        else:
+            self._objetos.pop(i, None)
+
+    def _atribuir_fatia(self, fatia: slice, figuras: List[Figura]) -> None:
+        """Mesma semântica de list: passo 1 aceita outro tamanho, os demais não."""
+        inicio, fim, passo = fatia.indices(len(self))
+        if passo != 1:
+            posicoes = range(inicio, fim, passo)
+            if len(posicoes) != len(figuras):
+                raise ValueError(
+                    f"fatia com passo {passo} tem {len(posicoes)} posições; recebeu {len(figuras)} figuras"
+                )
+            for k, fig in zip(posicoes, figuras):
+                self[k] = fig
+            return
+        fim = max(fim, inicio)
+        linhas = [self._linha(f) for f in figuras]
+        for c, col in enumerate(self._colunas()):
+            col[inicio:fim] = array(col.typecode, [linha[c] for linha in linhas])
+        desloc = len(figuras) - (fim - inicio)
+        objetos = {(k + desloc if k >= fim else k): f
+                   for k, f in self._objetos.items() if not inicio <= k < fim}
+        for j, (linha, fig) in enumerate(zip(linhas, figuras)):
+            if linha[0] == TIPO_GENERICO:
+                objetos[inicio + j] = fig
+        self._objetos = objetos
+
+    def __delitem__(self, i: Union[int, slice]) -> None:
+        if isinstance(i, slice):
+            removidas = range(*i.indices(len(self)))
+            for col in self._colunas():
+                del col[i]
+            if self._objetos:
+                fora = set(removidas)
+                antes = sorted(fora)
+                self._objetos = {k - bisect_left(antes, k): f
+                                 for k, f in self._objetos.items() if k not in fora}
+            return
+        i = self._indice(i)
+        for col in self._colunas():
+            del col[i]
+        if self._objetos:
+            self._objetos.pop(i, None)
+            self._objetos = {(k - 1 if k > i else k): f for k, f in self._objetos.items()}
+
+    def insert(self, i: int, fig: Figura) -> None:
+        n = len(self)
+        i = max(0, min(n, i + n if i < 0 else i))
+        linha = self._linha(fig)
+        for col, v in zip(self._colunas(), linha):
+            col.insert(i, v)
+        if self._objetos and i < n:
+            self._objetos = {(k + 1 if k >= i else k): f for k, f in self._objetos.items()}
+        if linha[0] == TIPO_GENERICO:
+            self._objetos[i] = fig
+
+    def append(self, fig: Figura) -> None:
+        linha = self._linha(fig)
+        if linha[0] == TIPO_GENERICO:
+            self._objetos[len(self)] = fig
+        for col, v in zip(self._colunas(), linha):
+            col.append(v)
+
+    def extend(self, figuras: Iterable[Figura]) -> None:
+        for fig in figuras:
+            self.append(fig)
+
+    def clear(self) -> None:
+        for col in self._colunas():
+            del col[:]
+        self._objetos.clear()
+
+    def __iter__(self) -> Iterator[Figura]:
+        for i in range(len(self)):
+            yield self._figura(i)
+
+    def __repr__(self) -> str:
+        return f"TabelaFiguras({len(self)} figuras, {len(self._objetos)} genéricas)"
+
+    # -----------------------------
+    # Memória
+    # -----------------------------
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados pelas colunas (sem contar figuras genéricas)."""
+        return sum(col.itemsize * col.buffer_info()[1] for col in self._colunas())
+
+    def bytes_por_figura(self) -> float:
+        return self.memoria_bytes() / len(self) if len(self) else 0.0
+
+    def como_dict(self) -> Dict[str, Any]:
+        """Colunas da tabela (arrays, sem cópia)."""
+        return {
+            "tipo": self.tipo, "p1": self.p1, "p2": self.p2,
+            "x": self.x, "y": self.y, "furo": self.furo, "sinal": self.sinal,
+        }
+
+    @property
+    def genericas(self) -> Dict[int, Figura]:
+        """Posição -> figura para as linhas guardadas como objeto."""
+        return self._objetos
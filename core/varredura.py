@@ -0,0 +1,280 @@
+"""Varredura paramétrica de seções (grade completa ou hipercubo latino).
+
+Um ModeloSecao descreve a seção com figuras paramétricas: cada dimensão
+ou coordenada pode ser um número fixo, o nome de um parâmetro ou uma
+função dos parâmetros. As propriedades são avaliadas em bloco sobre
+todos os pontos (arrays N-dimensionais), sem criar SecaoComposta por ponto.
+
+Exemplo (perfil I do exercício 3.1, variando mesa e alma):
+
+    modelo = ModeloSecao([
+        FiguraParametrica(Retangulo, base=12, altura="tf", y=lambda p: (p["hw"] + p["tf"]) / 2),
+        FiguraParametrica(Retangulo, base=0.8, altura="hw"),
+        FiguraParametrica(Retangulo, base=8, altura="tf", y=lambda p: -(p["hw"] + p["tf"]) / 2),
+    ])
+    r = varrer(modelo, {"tf": np.linspace(0.8, 2.0, 200), "hw": np.linspace(10, 30, 200)})
+    r.i1.shape  # (200, 200)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from .eixos_principais import eixos_principais
+from .figuras import TIPO_GENERICO, TIPO_RETANGULO, TIPO_TRIANGULO, Figura, codigo_tipo
+from .secao_composta import SecaoComposta
+from .vetorizado import propriedades_proprias
+
+# Número fixo, nome de parâmetro ou função dos parâmetros (dict nome -> array).
+Valor = Union[float, str, Callable[[Mapping[str, np.ndarray]], Any]]
+
+
+def _avaliar(valor: Valor, params: Mapping[str, np.ndarray]) -> Any:
+    if isinstance(valor, str):
+        try:
+            return params[valor]
+        except KeyError:
+            raise KeyError(f"Parâmetro não informado na varredura: {valor}") from None
+    if callable(valor):
+        return valor(params)
+    return float(valor)
+
+
+@dataclass(frozen=True)
+class FiguraParametrica:
+    """Figura primitiva de core/figuras.py com dimensões/posição paramétricas.
+
+    Os nomes seguem as classes: base/altura (retângulo, triângulo) ou
+    raio (círculos), além de x, y. sinal_ixy e furo são fixos; sinal_ixy
+    só vale para as classes que o têm (triângulo, quarto de círculo).
+    """
+    classe: type
+    base: Valor = 0.0
+    altura: Valor = 0.0
+    raio: Valor = 0.0
+    x: Valor = 0.0
+    y: Valor = 0.0
+    sinal_ixy: Optional[int] = None
+    furo: bool = False
+
+    def __post_init__(self):
+        if codigo_tipo(self.classe) == TIPO_GENERICO:
+            raise ValueError(f"Figura não suportada na varredura: {self.classe.__name__}")
+        if self.sinal_ixy is not None and "sinal_ixy" not in self.classe.__dataclass_fields__:
+            raise ValueError(f"{self.classe.__name__} não tem sinal_ixy; deixe sinal_ixy=None.")
+
+    def propriedades(self, params: Mapping[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """(A, x, y, Ix̄, Iȳ, Ix̄ȳ) em todos os pontos da varredura."""
+        cod = codigo_tipo(self.classe)
+        if cod in (TIPO_RETANGULO, TIPO_TRIANGULO):
+            p1, p2 = _avaliar(self.base, params), _avaliar(self.altura, params)
+        else:
+            p1, p2 = _avaliar(self.raio, params), 0.0
+
+        sinal = self.sinal_ixy
+        if sinal is None:
+            # mesmo padrão da classe (ex.: QuartoCirculo usa -1)
+            campo = self.classe.__dataclass_fields__.get("sinal_ixy")
+            sinal = campo.default if campo is not None else 1
+
+        area, ix0, iy0, ixy0 = propriedades_proprias(cod, p1, p2, sinal, self.furo)
+        x = np.asarray(_avaliar(self.x, params), dtype=float)
+        y = np.asarray(_avaliar(self.y, params), dtype=float)
+        return area, x, y, ix0, iy0, ixy0
+
+    def instanciar(self, params: Mapping[str, float]) -> Figura:
+        """Figura concreta (core/figuras.py) para um único ponto da varredura."""
+        cod = codigo_tipo(self.classe)
+        if cod in (TIPO_RETANGULO, TIPO_TRIANGULO):
+            kwargs: Dict[str, Any] = {
+                "base": float(_avaliar(self.base, params)),
+                "altura": float(_avaliar(self.altura, params)),
+            }
+        else:
+            kwargs = {"raio": float(_avaliar(self.raio, params))}
+        kwargs["x"] = float(_avaliar(self.x, params))
+        kwargs["y"] = float(_avaliar(self.y, params))
+        kwargs["furo"] = self.furo
+        if self.sinal_ixy is not None:
+            kwargs["sinal_ixy"] = self.sinal_ixy
+        return self.classe(**kwargs)
+
+
+@dataclass
+class ModeloSecao:
+    figuras: List[FiguraParametrica] = field(default_factory=list)
+    unidade_comprimento: str = "cm"
+
+    def adicionar(self, figura: FiguraParametrica) -> None:
+        self.figuras.append(figura)
+
+    def instanciar(self, params: Mapping[str, float]) -> SecaoComposta:
+        """SecaoComposta concreta para um único ponto (ex.: conferir um ótimo)."""
+        secao = SecaoComposta(unidade_comprimento=self.unidade_comprimento)
+        for fig in self.figuras:
+            secao.adicionar(fig.instanciar(params))
+        return secao
+
+
+@dataclass(frozen=True)
+class ResultadosVarredura:
+    """Propriedades em arrays com o formato da varredura.
+
+    - grade: formato (n_1, n_2, ..., n_d), na ordem dos parâmetros;
+    - hipercubo latino: formato (n_amostras,).
+    `parametros` guarda os eixos da grade ou as amostras sorteadas.
+    """
+    unidade_comprimento: str
+    parametros: Dict[str, np.ndarray]
+
+    area_total: np.ndarray
+    xg: np.ndarray
+    yg: np.ndarray
+
+    ix: np.ndarray
+    iy: np.ndarray
+    ixy: np.ndarray
+
+    i1: np.ndarray
+    i2: np.ndarray
+    alpha1_rad: np.ndarray
+    alpha2_rad: np.ndarray
+
+    @property
+    def forma(self) -> Tuple[int, ...]:
+        return self.area_total.shape
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {
+            "unidade_comprimento": self.unidade_comprimento,
+            "parametros": self.parametros,
+            "area_total": self.area_total,
+            "xg": self.xg,
+            "yg": self.yg,
+            "ix": self.ix,
+            "iy": self.iy,
+            "ixy": self.ixy,
+            "i1": self.i1,
+            "i2": self.i2,
+            "alpha1_rad": self.alpha1_rad,
+            "alpha2_rad": self.alpha2_rad,
+        }
+
+    def eixos_principais(self, convencao: str = "trigonometrica", *, graus: bool = False):
+        """(I1, I2, alpha1, alpha2) de todos os pontos da varredura em outra convenção (ver core.eixos_principais)."""
+        return eixos_principais(self.ix, self.iy, self.ixy, convencao, graus=graus)
+
+
+def hipercubo_latino(
+    limites: Mapping[str, Tuple[float, float]],
+    n_amostras: int,
+    *,
+    semente: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """Amostra de hipercubo latino: cada parâmetro com n estratos, um ponto por estrato."""
+    rng = np.random.default_rng(semente)
+    amostras: Dict[str, np.ndarray] = {}
+    for nome, (lo, hi) in limites.items():
+        u = (rng.permutation(n_amostras) + rng.random(n_amostras)) / n_amostras
+        amostras[nome] = lo + u * (hi - lo)
+    return amostras
+
+
+def avaliar_pontos(
+    modelo: ModeloSecao,
+    params: Mapping[str, Any],
+    *,
+    parametros_saida: Optional[Dict[str, np.ndarray]] = None,
+) -> ResultadosVarredura:
+    """Avalia o modelo em pontos já montados (arrays com broadcasting entre si)."""
+    if not modelo.figuras:
+        raise ValueError("Nenhuma figura adicionada no modelo.")
+    params = {k: np.asarray(v, dtype=float) for k, v in params.items()}
+    if parametros_saida is None:
+        parametros_saida = dict(params)
+
+    # (A, x, y, Ix̄, Iȳ, Ix̄ȳ) de cada figura, avaliados uma vez
+    proprias = [fig.propriedades(params) for fig in modelo.figuras]
+
+    # PASSO 1: Centroide global
+    soma_a = 0.0
+    soma_ax = 0.0
+    soma_ay = 0.0
+    for area, x, y, _, _, _ in proprias:
+        soma_a = soma_a + area
+        soma_ax = soma_ax + area * x
+        soma_ay = soma_ay + area * y
+
+    soma_a = np.asarray(soma_a)
+    valido = np.abs(soma_a) >= 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xg = np.where(valido, soma_ax / soma_a, np.nan)
+        yg = np.where(valido, soma_ay / soma_a, np.nan)
+
+    # PASSOS 2 e 3: distâncias ao centroide e Steiner
+    ix = 0.0
+    iy = 0.0
+    ixy = 0.0
+    for area, x, y, ix0, iy0, ixy0 in proprias:
+        a = y - yg
+        b = x - xg
+        ix = ix + ix0 + area * a * a
+        iy = iy + iy0 + area * b * b
+        ixy = ixy + ixy0 + area * a * b
+
+    # PASSO 4: Eixos principais
+    forma = np.broadcast_shapes(soma_a.shape, *(np.shape(v) for v in params.values()))
+    ix, iy, ixy = (np.broadcast_to(v, forma) for v in (ix, iy, ixy))
+    i1, i2, alpha1, alpha2 = eixos_principais(ix, iy, ixy)
+
+    return ResultadosVarredura(
+        unidade_comprimento=modelo.unidade_comprimento,
+        parametros=parametros_saida,
+        area_total=np.broadcast_to(np.where(valido, soma_a, np.nan), forma),
+        xg=np.broadcast_to(xg, forma),
+        yg=np.broadcast_to(yg, forma),
+        ix=ix,
+        iy=iy,
+        ixy=ixy,
+        i1=i1,
+        i2=i2,
+        alpha1_rad=alpha1,
+        alpha2_rad=alpha2,
+    )
+
+
+def varrer(
+    modelo: ModeloSecao,
+    parametros: Mapping[str, Any],
+    *,
+    amostragem: str = "grade",
+    n_amostras: Optional[int] = None,
+    semente: Optional[int] = None,
+) -> ResultadosVarredura:
+    """Avalia o modelo em todos os pontos da varredura.
+
+    amostragem:
+      - "grade": produto cartesiano; cada parâmetro é um array de valores.
+      - "lhs": hipercubo latino com n_amostras pontos; cada parâmetro é
+        (mínimo, máximo) ou um array (usa o mínimo e o máximo dele).
+    """
+    amostragem = amostragem.lower().strip()
+    if amostragem == "grade":
+        eixos = {k: np.atleast_1d(np.asarray(v, dtype=float)) for k, v in parametros.items()}
+        grades = np.meshgrid(*eixos.values(), indexing="ij", sparse=True) if eixos else []
+        return avaliar_pontos(modelo, dict(zip(eixos.keys(), grades)), parametros_saida=eixos)
+
+    if amostragem == "lhs":
+        if not n_amostras:
+            raise ValueError("Informe n_amostras para a amostragem por hipercubo latino.")
+        limites = {}
+        for k, v in parametros.items():
+            arr = np.asarray(v, dtype=float)
+            limites[k] = (float(arr.min()), float(arr.max()))
+        amostras = hipercubo_latino(limites, n_amostras, semente=semente)
+        return avaliar_pontos(modelo, amostras)
+
+    raise ValueError(f"Amostragem desconhecida: {amostragem} (use 'grade' ou 'lhs')")
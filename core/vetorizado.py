@@ -0,0 +1,277 @@
+"""Motor vetorizado (NumPy) para seções compostas.
+
+O laço de SecaoComposta.calcular continua sendo o caminho de referência
+(didático, passo a passo). Aqui as figuras são empacotadas em arrays
+contíguos (A, x, y, Ix̄, Iȳ, Ix̄ȳ) e o centroide, o Steiner e os eixos
+principais saem de reduções sobre esses arrays.
+
+Convenção de tipos (códigos inteiros usados nos arrays):
+- 0: Retângulo          (p1 = base, p2 = altura)
+- 1: Círculo            (p1 = raio)
+- 2: Triângulo retângulo (p1 = base, p2 = altura, sinal = sinal_ixy)
+- 3: Semicírculo        (p1 = raio)
+- 4: 1/4 de círculo     (p1 = raio, sinal = sinal_ixy)
+- -1: figura genérica (qualquer objeto do protocolo Figura; usa os métodos)
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .figuras import (
+    _CODIGOS,
+    TIPO_CIRCULO,
+    TIPO_GENERICO,
+    TIPO_QUARTO_CIRCULO,
+    TIPO_RETANGULO,
+    TIPO_SEMICIRCULO,
+    TIPO_TRIANGULO,
+    Figura,
+)
+from .propriedades import ResultadosSecao
+from .eixos_principais import eixos_principais
+from .secao_composta import _montar_resultados
+from .somatorio import CUSTO, somar_array, validar_estrategia
+from .tabela_figuras import _NOMES_PADRAO, TabelaFiguras
+
+
+@dataclass(frozen=True)
+class FigurasEmpacotadas:
+    """Figuras de uma seção em arrays contíguos (uma posição por figura)."""
+    area: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    ix0: np.ndarray
+    iy0: np.ndarray
+    ixy0: np.ndarray
+    nomes: List[str]
+
+
+def propriedades_proprias(
+    tipo: np.ndarray,
+    p1: np.ndarray,
+    p2: np.ndarray,
+    sinal: np.ndarray,
+    furo: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Área e momentos próprios (Ix̄, Iȳ, Ix̄ȳ) por código de tipo.
+
+    Mesmas fórmulas de core/figuras.py, avaliadas em bloco.
+    Aceita arrays de qualquer formato (com broadcasting entre eles).
+    Códigos TIPO_GENERICO ficam com zero (o chamador preenche).
+    """
+    tipo, p1, p2, sinal, furo = np.broadcast_arrays(
+        np.asarray(tipo), np.asarray(p1, dtype=float), np.asarray(p2, dtype=float),
+        np.asarray(sinal, dtype=float), np.asarray(furo, dtype=bool),
+    )
+    area = np.zeros(tipo.shape)
+    ix0 = np.zeros(tipo.shape)
+    iy0 = np.zeros(tipo.shape)
+    ixy0 = np.zeros(tipo.shape)
+
+    m = tipo == TIPO_RETANGULO
+    if m.any():
+        b, h = p1[m], p2[m]
+        area[m] = b * h
+        ix0[m] = (b * h**3) / 12
+        iy0[m] = (h * b**3) / 12
+
+    m = tipo == TIPO_CIRCULO
+    if m.any():
+        r = p1[m]
+        area[m] = math.pi * r**2
+        ix0[m] = (math.pi * r**4) / 4
+        iy0[m] = (math.pi * r**4) / 4
+
+    m = tipo == TIPO_TRIANGULO
+    if m.any():
+        b, h = p1[m], p2[m]
+        area[m] = (b * h) / 2
+        ix0[m] = (b * h**3) / 36
+        iy0[m] = (h * b**3) / 36
+        ixy0[m] = (b**2 * h**2) / 72 * sinal[m]
+
+    m = tipo == TIPO_SEMICIRCULO
+    if m.any():
+        r = p1[m]
+        area[m] = (math.pi * r**2) / 2
+        ix0[m] = 0.1098 * r**4
+        iy0[m] = (math.pi * r**4) / 8
+
+    m = tipo == TIPO_QUARTO_CIRCULO
+    if m.any():
+        r = p1[m]
+        area[m] = (math.pi * r**2) / 4
+        ix0[m] = 0.0549 * r**4
+        iy0[m] = 0.0549 * r**4
+        ixy0[m] = 0.01647 * r**4 * sinal[m]
+
+    s = np.where(furo, -1.0, 1.0)
+    return area * s, ix0 * s, iy0 * s, ixy0 * s
+
+
+def _parametros_figura(fig: Any, cod: int) -> Tuple[float, float, float]:
+    """(p1, p2, sinal) de uma figura primitiva, conforme o código de tipo."""
+    if cod == TIPO_RETANGULO or cod == TIPO_TRIANGULO:
+        return fig.base, fig.altura, getattr(fig, "sinal_ixy", 1)
+    return fig.raio, 0.0, getattr(fig, "sinal_ixy", 1)
+
+
+def empacotar_figuras(figuras: Sequence[Figura]) -> FigurasEmpacotadas:
+    """Percorre a lista uma única vez e devolve os arrays da seção.
+
+    Primitivas conhecidas são avaliadas em bloco; figuras genéricas usam
+    seus próprios métodos (área/momentos chamados uma única vez cada).
+    Uma TabelaFiguras é lida direto das colunas, sem reconstruir objetos.
+    """
+    if isinstance(figuras, TabelaFiguras):
+        return _empacotar_tabela(figuras)
+
+    tipo: List[int] = []
+    p1: List[float] = []
+    p2: List[float] = []
+    sinal: List[float] = []
+    furo: List[bool] = []
+    x: List[float] = []
+    y: List[float] = []
+    nomes: List[str] = []
+    genericas: List[int] = []
+
+    for i, fig in enumerate(figuras):
+        cod = _CODIGOS.get(type(fig), TIPO_GENERICO)
+        tipo.append(cod)
+        x.append(fig.x)
+        y.append(fig.y)
+        nomes.append(getattr(fig, "nome", "Figura"))
+        if cod == TIPO_GENERICO:
+            genericas.append(i)
+            p1.append(0.0)
+            p2.append(0.0)
+            sinal.append(1)
+            furo.append(False)
+        else:
+            a, b, s = _parametros_figura(fig, cod)
+            p1.append(a)
+            p2.append(b)
+            sinal.append(s)
+            furo.append(fig.furo)
+
+    area, ix0, iy0, ixy0 = propriedades_proprias(
+        np.array(tipo, dtype=np.int8),
+        np.array(p1, dtype=float),
+        np.array(p2, dtype=float),
+        np.array(sinal, dtype=float),
+        np.array(furo, dtype=bool),
+    )
+
+    for i in genericas:
+        fig = figuras[i]
+        area[i] = fig.area()
+        ix0[i] = fig.ix_proprio()
+        iy0[i] = fig.iy_proprio()
+        ixy0[i] = fig.ixy_proprio()
+
+    return FigurasEmpacotadas(
+        area=area,
+        x=np.array(x, dtype=float),
+        y=np.array(y, dtype=float),
+        ix0=ix0, iy0=iy0, ixy0=ixy0, nomes=nomes,
+    )
+
+
+def _empacotar_tabela(tab: TabelaFiguras) -> FigurasEmpacotadas:
+    tipo = np.frombuffer(tab.tipo, dtype=np.int8).copy()
+    area, ix0, iy0, ixy0 = propriedades_proprias(
+        tipo,
+        np.frombuffer(tab.p1, dtype=float),
+        np.frombuffer(tab.p2, dtype=float),
+        np.frombuffer(tab.sinal, dtype=np.int8),
+        np.frombuffer(tab.furo, dtype=np.int8).astype(bool),
+    )
+    nomes = [_NOMES_PADRAO.get(c, "Figura") for c in tipo.tolist()]
+    for i, fig in tab.genericas.items():
+        nomes[i] = getattr(fig, "nome", "Figura")
+        area[i] = fig.area()
+        ix0[i] = fig.ix_proprio()
+        iy0[i] = fig.iy_proprio()
+        ixy0[i] = fig.ixy_proprio()
+
+    return FigurasEmpacotadas(
+        area=area,
+        x=np.frombuffer(tab.x, dtype=float).copy(),
+        y=np.frombuffer(tab.y, dtype=float).copy(),
+        ix0=ix0, iy0=iy0, ixy0=ixy0, nomes=nomes,
+    )
+
+
+def calcular_vetorizado(
+    figuras: Sequence[Figura],
+    unidade_comprimento: str = "cm",
+    *,
+    logger: Optional[Any] = None,
+    soma: str = "pairwise",
+) -> ResultadosSecao:
+    """Equivalente vetorizado de SecaoComposta.calcular(modo="quiet").
+
+    soma: estratégia de somatório (ver core/somatorio.py).
+    """
+    estrategia = validar_estrategia(soma)
+    if len(figuras) == 0:
+        raise ValueError("Nenhuma figura adicionada na seção.")
+
+    if logger:
+        logger.debug("Iniciando cálculo vetorizado: %d figuras", len(figuras))
+
+    pk = empacotar_figuras(figuras)
+
+    # PASSO 1: Centroide global
+    t0 = time.perf_counter()
+    soma_a = somar_array(pk.area, estrategia)
+    soma_ax = somar_array(pk.area * pk.x, estrategia)
+    soma_ay = somar_array(pk.area * pk.y, estrategia)
+    tempo_soma = time.perf_counter() - t0
+    if abs(soma_a) < 1e-12:
+        raise ValueError("Área total ~ 0. Verifique furos e figuras (A_total não pode ser zero).")
+
+    xg = soma_ax / soma_a
+    yg = soma_ay / soma_a
+
+    # PASSO 2: distâncias (a, b)
+    a = pk.y - yg
+    b = pk.x - xg
+
+    # PASSO 3: Steiner
+    t0 = time.perf_counter()
+    ix_total = somar_array(pk.ix0 + pk.area * a * a, estrategia)
+    iy_total = somar_array(pk.iy0 + pk.area * b * b, estrategia)
+    ixy_total = somar_array(pk.ixy0 + pk.area * a * b, estrategia)
+    tempo_soma += time.perf_counter() - t0
+
+    # PASSO 4: Eixos principais
+    i1, i2, alpha1, alpha2 = eixos_principais(ix_total, iy_total, ixy_total)
+
+    if logger:
+        logger.debug("Vetorizado: A=%g Xg=%g Yg=%g Ix=%g Iy=%g Ixy=%g",
+                     soma_a, xg, yg, ix_total, iy_total, ixy_total)
+
+    ab_rows: List[Dict[str, Any]] = [
+        {"idx": i, "nome": nome, "area": ar, "xi": xi, "yi": yi, "a": ai, "b": bi}
+        for i, (nome, ar, xi, yi, ai, bi) in enumerate(
+            zip(pk.nomes, pk.area.tolist(), pk.x.tolist(), pk.y.tolist(), a.tolist(), b.tolist()),
+            start=1,
+        )
+    ]
+
+    return _montar_resultados(
+        unidade_comprimento,
+        soma_a, xg, yg,
+        ix_total, iy_total, ixy_total,
+        i1, i2, alpha1, alpha2,
+        ab_rows,
+        {"soma": {"estrategia": estrategia, "tempo_s": tempo_soma, "custo": CUSTO[estrategia]}},
+    )
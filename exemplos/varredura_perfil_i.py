@@ -0,0 +1,31 @@
+"""Varredura paramétrica do perfil I do exercício 3.1.
+
+Espessura das mesas (tf) de 0,8 a 2,0 cm e altura da alma (hw) de 10 a 30 cm,
+grade 200 × 200 avaliada de uma vez (sem um SecaoComposta por ponto).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from momentos_inercia_v4 import Retangulo
+from momentos_inercia_v4.core.varredura import FiguraParametrica, ModeloSecao, varrer
+
+
+def main():
+    modelo = ModeloSecao(unidade_comprimento="cm")
+    modelo.adicionar(FiguraParametrica(Retangulo, base=12, altura="tf", y=lambda p: (p["hw"] + p["tf"]) / 2))
+    modelo.adicionar(FiguraParametrica(Retangulo, base=0.8, altura="hw"))
+    modelo.adicionar(FiguraParametrica(Retangulo, base=8, altura="tf", y=lambda p: -(p["hw"] + p["tf"]) / 2))
+
+    r = varrer(modelo, {"tf": np.linspace(0.8, 2.0, 200), "hw": np.linspace(10.0, 30.0, 200)})
+
+    k = np.unravel_index(np.argmax(r.i1 / r.area_total), r.forma)
+    tf = r.parametros["tf"][k[0]]
+    hw = r.parametros["hw"][k[1]]
+    print(f"Grade: {r.forma} pontos")
+    print(f"Maior I1/A: tf={tf:.3f} cm, hw={hw:.3f} cm -> I1={r.i1[k]:.2f} cm^4, A={r.area_total[k]:.2f} cm^2")
+
+
+if __name__ == "__main__":
+    main()
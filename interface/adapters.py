@@ -10,6 +10,7 @@ from core.figuras import (
     Semicirculo,
     QuartoCirculo,
 )
+from core.poligono import Poligono
 
 # deslocamento do centróide em relação:
 # - ao diâmetro (semicírculo)
@@ -73,6 +74,11 @@ def centroid_xy(fig: Dict[str, Any]) -> Tuple[float, float]:
     tipo = fig["tipo"]
     modo = fig.get("modo_pos", "Centroide (x, y)")
 
+    if tipo == "Polígono":
+        # centroide calculado a partir dos vértices (posição = coordenadas dos vértices)
+        p = poligono_de_dict(fig)
+        return p.x, p.y
+
     if modo.startswith("Centroide"):
         return float(fig.get("x", 0.0)), float(fig.get("y", 0.0))
 
@@ -123,6 +129,15 @@ def centroid_xy(fig: Dict[str, Any]) -> Tuple[float, float]:
     return float(fig.get("x", 0.0)), float(fig.get("y", 0.0))
 
 
+def poligono_de_dict(fig: Dict[str, Any]) -> Poligono:
+    """Polígono do dict da UI: "vertices" = [[x, y], ...], "furos" = [anel, ...]."""
+    return Poligono(
+        vertices=fig["vertices"],
+        furos=fig.get("furos") or (),
+        furo=bool(fig.get("furo", False)),
+    )
+
+
 # =========================
 # Dict -> Core
 # =========================
@@ -164,6 +179,9 @@ def dict_to_core(fig: Dict[str, Any]):
             furo=furo,
         )
 
+    if tipo == "Polígono":
+        return poligono_de_dict(fig)
+
     raise ValueError(f"Tipo não suportado: {tipo}")
 
 
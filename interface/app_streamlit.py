@@ -15,25 +15,20 @@ INTERFACE = _Path(__file__).resolve().parent
 if str(INTERFACE) not in sys.path:
     sys.path.insert(0, str(INTERFACE))
 
+import hashlib
+import json
+import os
 from decimal import Decimal, ROUND_HALF_DOWN
-import math
-from datetime import datetime
-from io import BytesIO
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.io as pio
 
+from core.cache_resultados import CacheResultados
 from core.secao_composta import SecaoComposta
 
 from interface.state import init_state, new_id, bump_id, reset_state_deep
 from interface.adapters import dict_to_core, defaults_for, ORIENT_Q, ORIENT_SEMI
 from interface.plotter import plot_secao
-
-# PDF export (ReportLab)
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
-from reportlab.pdfgen import canvas as pdf_canvas
+from interface.relatorio import build_pdf_bytes
 
 
 # -------------------------
@@ -47,45 +42,14 @@ def fmt2(x: float) -> str:
     return f"{x:.2f}"
 
 
-def plot_to_png_bytes(fig: go.Figure, scale: int = 2) -> bytes | None:
-    """
-    Converte figura Plotly para PNG em memória (requer 'kaleido').
-    Retorna None se kaleido não estiver instalado.
-    """
-    try:
-        return pio.to_image(fig, format="png", scale=scale)
-    except Exception:
-        return None
+@st.cache_resource
+def cache_resultados() -> CacheResultados:
+    """Cache de resultados compartilhado entre reruns e sessões.
 
-
-def principais_formulario(ix: float, iy: float, ixy: float) -> tuple[float, float, float, float]:
-    """
-    Convenção igual à sua planilha:
-      - I1 = maior
-      - I2 = menor
-      - alpha2 = eixo de I2 (menor)
-      - alpha1 = alpha2 - 90° (eixo de I1)
-      - sinal dos ângulos compatível (planilha costuma ser horário positivo)
+    Com a variável de ambiente MOMENTOS_CACHE (caminho .sqlite) o cache
+    também fica em disco e sobrevive a reinícios do app.
     """
-    iavg = 0.5 * (ix + iy)
-    r = math.sqrt(((ix - iy) * 0.5) ** 2 + ixy ** 2)
-    I1 = iavg + r
-    I2 = iavg - r
-
-    theta_trig = 0.5 * math.atan2(-2.0 * ixy, (iy - ix))
-    alpha2_trig = math.degrees(theta_trig)  # anti-horário positivo
-    alpha2 = -alpha2_trig                   # planilha: horário positivo
-
-    def norm(a: float) -> float:
-        while a <= -90.0:
-            a += 180.0
-        while a > 90.0:
-            a -= 180.0
-        return a
-
-    alpha2n = norm(alpha2)
-    alpha1n = norm(alpha2n - 90.0)
-    return I1, I2, alpha1n, alpha2n
+    return CacheResultados(capacidade=256, caminho=os.environ.get("MOMENTOS_CACHE"))
 
 
 def device_is_small() -> bool:
@@ -305,106 +269,16 @@ def editor_figura(f: dict, idx: int):
             st.rerun()
 
 
-# -------------------------
-# PDF export
-# -------------------------
-def build_pdf_bytes(res_dict: dict, unidade: str, plot_png: bytes | None = None) -> bytes:
-    """
-    Export: 1 página A4 com resultados + tabela a/b + (opcional) imagem do plot.
-    """
-    buf = BytesIO()
-    c = pdf_canvas.Canvas(buf, pagesize=A4)
-    w, h = A4
-
-    x = 20 * mm
-    y = h - 20 * mm
-
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(x, y, "Momentos de Inércia — Relatório")
-    y -= 8 * mm
-
-    c.setFont("Helvetica", 10)
-    c.drawString(x, y, f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
-    y -= 10 * mm
-
-    # Imagem do gráfico primeiro (quando existir)
-    if plot_png:
-        try:
-            from reportlab.lib.utils import ImageReader
-            img = ImageReader(BytesIO(plot_png))
-            img_w = 170 * mm
-            img_h = 95 * mm
-            if y - img_h < 20 * mm:
-                c.showPage()
-                y = h - 20 * mm
-            c.drawImage(img, x, y - img_h, width=img_w, height=img_h, preserveAspectRatio=True, anchor="sw")
-            y -= (img_h + 8 * mm)
-        except Exception:
-            pass
-
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(x, y, "Resultados")
-    y -= 8 * mm
-
-    c.setFont("Helvetica", 10)
-
-    lines = [
-        f"Unidade: {unidade}",
-        f"Área total: {res_dict['area_total']:.4f} {unidade}^2",
-        f"Xg: {res_dict['xg']:.4f} {unidade}",
-        f"Yg: {res_dict['yg']:.4f} {unidade}",
-        "",
-        f"Ix: {res_dict['ix']:.4f} {unidade}^4",
-        f"Iy: {res_dict['iy']:.4f} {unidade}^4",
-        f"Ixy: {res_dict['ixy']:.4f} {unidade}^4",
-        "",
-        f"I1 (maior): {res_dict['i1']:.4f} {unidade}^4",
-        f"I2 (menor): {res_dict['i2']:.4f} {unidade}^4",
-        f"α1 (eixo de I1): {res_dict['a1']:.4f}°",
-        f"α2 (eixo de I2): {res_dict['a2']:.4f}°",
-        "",
-        "Parâmetros a e b (a = yi - Yg ; b = xi - Xg):",
-    ]
-
-    for line in lines:
-        c.drawString(x, y, line)
-        y -= 6.2 * mm
-        if y < 20 * mm:
-            c.showPage()
-            y = h - 20 * mm
-            c.setFont("Helvetica", 10)
-
-    # tabela a/b
-    for r in res_dict.get("ab_rows", []):
-        line = (
-            f"Fig #{r.get('idx')} ({r.get('nome','')}): "
-            f"xi={float(r.get('xi',0.0)):.4f} {unidade} | "
-            f"yi={float(r.get('yi',0.0)):.4f} {unidade} | "
-            f"a={float(r.get('a',0.0)):.4f} {unidade} | "
-            f"b={float(r.get('b',0.0)):.4f} {unidade}"
-        )
-        c.drawString(x, y, line)
-        y -= 6.2 * mm
-        if y < 20 * mm:
-            c.showPage()
-            y = h - 20 * mm
-            c.setFont("Helvetica", 10)
-
-    c.showPage()
-    c.save()
-    return buf.getvalue()
-
-
 # -------------------------
 # Resultados UI
 # -------------------------
 def resultados_ui(secao: SecaoComposta, unidade: str):
-    res = secao.calcular(modo="quiet")
+    res = cache_resultados().calcular(secao)
 
     ix = float(res.ix)
     iy = float(res.iy)
     ixy = float(res.ixy)
-    I1, I2, a1, a2 = principais_formulario(ix, iy, ixy)
+    I1, I2, a1, a2 = res.eixos_principais("formulario", graus=True)
 
     ab_rows = (res.extras or {}).get("parametros_ab", [])
 
@@ -471,6 +345,49 @@ def resultados_ui(secao: SecaoComposta, unidade: str):
     return float(res.xg), float(res.yg), a1, a2, export_dict
 
 
+# -------------------------
+# Exportação (sob demanda)
+# -------------------------
+def chave_exportacao(figs: list, unidade: str) -> str:
+    """Hash do conteúdo da seção (dicts da UI) + unidade: identifica o PDF gerado."""
+    bruto = json.dumps([figs, unidade], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(bruto.encode()).hexdigest()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def pdf_exportacao(chave: str, unidade: str, _figs, _export_dict) -> bytes:
+    """PDF com o desenho vetorial da seção, memorizado por chave + unidade.
+
+    Parâmetros com "_" não entram no hash do st.cache_data: a chave já
+    resume o conteúdo da seção.
+    """
+    return build_pdf_bytes(_export_dict, unidade, figs=_figs)
+
+
+def exportacao_ui(figs: list, unidade: str, export_dict: dict):
+    """Botão "Gerar PDF": nada é renderizado nos reruns comuns (edição de campos).
+
+    Depois de gerado, o download fica disponível enquanto a seção não mudar.
+    """
+    chave = chave_exportacao(figs, unidade)
+    pronto = st.session_state.get("pdf_chave") == chave
+
+    if not pronto and st.button("📄 Gerar PDF", use_container_width=True):
+        with st.spinner("Gerando PDF..."):
+            pdf_exportacao(chave, unidade, figs, export_dict)
+        st.session_state["pdf_chave"] = chave
+        pronto = True
+
+    if pronto:
+        st.download_button(
+            "⬇️ Exportar resultados (PDF)",
+            data=pdf_exportacao(chave, unidade, figs, export_dict),
+            file_name="momentos_inercia_resultados.pdf",
+            mime="application/pdf",
+            use_container_width=True,
+        )
+
+
 # -------------------------
 # Main
 # -------------------------
@@ -504,17 +421,7 @@ def main():
             fig_plot = plot_secao(figs, xg, yg, alpha1_deg=a1, alpha2_deg=a2)
             st.plotly_chart(fig_plot, use_container_width=True)
 
-            # gera imagem do gráfico "atual" para o PDF
-            plot_png = plot_to_png_bytes(fig_plot, scale=2)
-            pdf_bytes = build_pdf_bytes(export_dict, unidade, plot_png=plot_png)
-
-            st.download_button(
-                "⬇️ Exportar resultados (PDF)",
-                data=pdf_bytes,
-                file_name="momentos_inercia_resultados.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
+            exportacao_ui(figs, unidade, export_dict)
         else:
             st.plotly_chart(plot_secao([], None, None), use_container_width=True)
             st.subheader("Resultados")
@@ -544,16 +451,7 @@ def main():
             fig_plot = plot_secao(figs, xg, yg, alpha1_deg=a1, alpha2_deg=a2)
             st.plotly_chart(fig_plot, use_container_width=True)
 
-            plot_png = plot_to_png_bytes(fig_plot, scale=2)
-            pdf_bytes = build_pdf_bytes(export_dict, unidade, plot_png=plot_png)
-
-            st.download_button(
-                "⬇️ Exportar resultados (PDF)",
-                data=pdf_bytes,
-                file_name="momentos_inercia_resultados.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-            )
+            exportacao_ui(figs, unidade, export_dict)
         else:
             st.plotly_chart(plot_secao([], None, None), use_container_width=True)
             st.subheader("Resultados")
@@ -0,0 +1,174 @@
+"""Leitura e escrita de seções/resultados em arquivo (streaming).
+
+Tudo aqui é gerador ou escrita incremental: uma seção por vez fica em
+memória, qualquer que seja o tamanho do arquivo. Arquivos terminados em
+.gz são (des)comprimidos de forma transparente.
+
+Entrada
+- JSONL: uma seção por linha
+    {"id": "VS-250", "unidade": "cm", "figuras": [<dict da UI>, ...]}
+- CSV: uma figura por linha; linhas consecutivas com o mesmo `id` formam
+  uma seção. Colunas: id, unidade, tipo, furo, base, altura, raio, x, y,
+  modo_pos, x0, y0, vertice, orientacao (células vazias são ignoradas).
+
+As figuras seguem o formato dos dicts usados por adapters.dict_to_core.
+
+Saída
+- JSONL: {"id": ..., **ResultadosSecao.como_dict()} por linha.
+- CSV: uma linha por seção com os campos escalares (sem extras).
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, TextIO
+
+from core.propriedades import ResultadosSecao
+
+# Campos numéricos dos dicts de figura (o resto é texto).
+_CAMPOS_NUMERICOS = {"base", "altura", "raio", "x", "y", "x0", "y0"}
+
+CAMPOS_CSV_RESULTADOS = [
+    "id", "unidade_comprimento", "area_total", "xg", "yg",
+    "ix", "iy", "ixy", "i1", "i2", "alpha1_rad", "alpha2_rad", "erro",
+]
+
+
+def _abrir(caminho: str, modo: str, *, erros: str = "strict") -> TextIO:
+    if caminho.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(caminho, modo + "b"), encoding="utf-8", errors=erros, newline="")
+    return open(caminho, modo, encoding="utf-8", errors=erros, newline="")
+
+
+def _formato(caminho: str, formato: Optional[str]) -> str:
+    if formato:
+        return formato.lower()
+    nome = caminho[:-3] if caminho.endswith(".gz") else caminho
+    if nome.endswith(".csv"):
+        return "csv"
+    if nome.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    raise ValueError(f"Não sei o formato de {caminho} (use .jsonl ou .csv, ou informe `formato`).")
+
+
+def _bool(txt: str) -> bool:
+    return txt.strip().lower() in {"1", "true", "s", "sim", "y", "yes"}
+
+
+# =========================
+# Leitura
+# =========================
+def ler_secoes_jsonl(caminho: str) -> Iterator[Dict[str, Any]]:
+    with _abrir(caminho, "r") as f:
+        for linha in f:
+            linha = linha.strip()
+            if linha:
+                yield json.loads(linha)
+
+
+def _figura_csv(linha: Dict[str, str]) -> Dict[str, Any]:
+    fig: Dict[str, Any] = {}
+    for k, v in linha.items():
+        if k in ("id", "unidade") or v is None or v == "":
+            continue
+        if k == "furo":
+            fig[k] = _bool(v)
+        elif k in _CAMPOS_NUMERICOS:
+            fig[k] = float(v)
+        else:
+            fig[k] = v
+    return fig
+
+
+def ler_secoes_csv(caminho: str) -> Iterator[Dict[str, Any]]:
+    with _abrir(caminho, "r") as f:
+        atual: Optional[Dict[str, Any]] = None
+        for linha in csv.DictReader(f):
+            ident = linha.get("id")
+            if atual is None or ident != atual["id"]:
+                if atual is not None:
+                    yield atual
+                atual = {"id": ident, "unidade": linha.get("unidade") or "cm", "figuras": []}
+            atual["figuras"].append(_figura_csv(linha))
+        if atual is not None:
+            yield atual
+
+
+def ler_secoes(caminho: str, *, formato: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Gera as seções do arquivo, uma por vez (formato pela extensão)."""
+    if _formato(caminho, formato) == "csv":
+        return ler_secoes_csv(caminho)
+    return ler_secoes_jsonl(caminho)
+
+
+# =========================
+# Escrita
+# =========================
+class EscritorResultados:
+    """Grava resultados à medida que chegam (use como context manager).
+
+        with EscritorResultados("saida.csv") as esc:
+            for r in resultados:
+                esc.escrever(r)
+    """
+
+    def __init__(self, caminho: str, *, formato: Optional[str] = None):
+        self.caminho = caminho
+        self.formato = _formato(caminho, formato)
+        self.linhas = 0
+        self._f: Optional[IO[str]] = None
+        self._csv: Optional[csv.DictWriter] = None
+
+    def __enter__(self) -> "EscritorResultados":
+        self._f = _abrir(self.caminho, "w")
+        if self.formato == "csv":
+            self._csv = csv.DictWriter(self._f, fieldnames=CAMPOS_CSV_RESULTADOS, extrasaction="ignore")
+            self._csv.writeheader()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+    def escrever(self, resultado: ResultadosSecao | Dict[str, Any], *, ident: Any = None) -> None:
+        """Grava um ResultadosSecao ou um dict já no formato de saída."""
+        if self._f is None:
+            raise RuntimeError("Escritor fechado (use dentro de um bloco `with`).")
+
+        if isinstance(resultado, ResultadosSecao):
+            linha: Dict[str, Any] = {"id": ident, **resultado.como_dict()}
+        else:
+            linha = resultado if ident is None else {**resultado, "id": ident}
+
+        if self._csv is not None:
+            self._csv.writerow(linha)
+        else:
+            self._f.write(json.dumps(linha, ensure_ascii=False))
+            self._f.write("\n")
+        self.linhas += 1
+
+    def escrever_varios(self, resultados: Iterable[Dict[str, Any]]) -> int:
+        n = 0
+        for r in resultados:
+            self.escrever(r)
+            n += 1
+        return n
+
+
+def escrever_secoes_jsonl(caminho: str, secoes: Iterable[Dict[str, Any]]) -> int:
+    """Grava definições de seções em JSONL (ex.: para gerar catálogos de teste)."""
+    n = 0
+    with _abrir(caminho, "w") as f:
+        for s in secoes:
+            f.write(json.dumps(s, ensure_ascii=False))
+            f.write("\n")
+            n += 1
+    return n
+
@@ -9,7 +9,7 @@ A UI principal do projeto é o Streamlit em: interface/app_streamlit.py
 
 from __future__ import annotations
 
-from ..core.secao_composta import SecaoComposta
+from ..core.secao_incremental import SecaoIncremental
 from ..core.figuras import Retangulo, Circulo, TrianguloRetangulo, Semicirculo, QuartoCirculo
 from ..utils.validacao import ler_float, ler_bool_sim_nao, ler_sinal
 
@@ -20,7 +20,7 @@ def rodar_cli() -> None:
     print("=" * 70)
 
     unidade = input("Unidade de comprimento (ex: mm, cm, m) [cm]: ").strip() or "cm"
-    secao = SecaoComposta(unidade_comprimento=unidade)
+    secao = SecaoIncremental(unidade_comprimento=unidade)
 
     while True:
         print("\nFiguras disponíveis:")
@@ -116,7 +116,7 @@ def rodar_cli() -> None:
                 print("❌ Digite um número válido.")
                 continue
 
-            removida = secao.figuras.pop(idx - 1)
+            removida = secao.remover(idx - 1)
             nome = getattr(removida, "nome", removida.__class__.__name__)
             print(f"🗑️ Figura removida: {nome}")
             continue
@@ -0,0 +1,248 @@
+"""Serviço de exportação de gráficos (PNG/SVG) fora da thread do app.
+
+`pio.to_image` chamado direto na thread do Streamlit bloqueia o rerun e,
+sem controle, paga a partida do renderizador (kaleido + Chrome) a cada
+chamada. Aqui:
+
+- o renderizador é aquecido uma vez (`kaleido.start_sync_server`, quando
+  disponível, + um gráfico mínimo) e reaproveitado por todos os pedidos;
+- os pedidos vão para um pool de threads e voltam como `Future`;
+- imagens prontas ficam num cache LRU com chave = SHA-256 da especificação
+  do gráfico (JSON) + formato/escala/tamanho; pedidos iguais em andamento
+  compartilham o mesmo Future;
+- falhas não são engolidas: o Future carrega a exceção e as estatísticas
+  contam falhas, tempos e o último erro.
+
+    with ServicoExportacao() as servico:
+        futuros = [servico.enviar(plot_secao(...), "png") for ...]
+        imagens = [f.result() for f in futuros]
+        servico.estatisticas()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+FORMATOS = ("png", "svg")
+
+# renderizador(especificação, formato, escala, largura, altura) -> bytes
+Renderizador = Callable[[Dict[str, Any], str, float, Optional[int], Optional[int]], bytes]
+
+
+def validar_formato(formato: str) -> str:
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de exportação inválido: {formato!r}. Use um de {FORMATOS}.")
+    return formato
+
+
+def _renderizar_kaleido(
+    espec: Dict[str, Any], formato: str, escala: float, largura: Optional[int], altura: Optional[int],
+) -> bytes:
+    return pio.to_image(espec, format=formato, scale=escala, width=largura, height=altura, validate=False)
+
+
+def _aquecer_kaleido() -> bool:
+    """Sobe o servidor persistente do kaleido (v1+), se houver. True quando subiu."""
+    try:
+        import kaleido
+    except ImportError:
+        return False
+    iniciar = getattr(kaleido, "start_sync_server", None)
+    if iniciar is None:
+        return False
+    iniciar()
+    return True
+
+
+def _parar_kaleido() -> None:
+    try:
+        import kaleido
+    except ImportError:
+        return
+    parar = getattr(kaleido, "stop_sync_server", None)
+    if parar is not None:
+        parar()
+
+
+def especificacao(fig: go.Figure | Dict[str, Any]) -> str:
+    """JSON da figura (dados + layout): é o que define a imagem."""
+    return pio.to_json(fig, validate=False)
+
+
+def chave_render(espec: str, formato: str, escala: float, largura: Optional[int], altura: Optional[int]) -> str:
+    h = hashlib.sha256(espec.encode())
+    h.update(json.dumps([formato, escala, largura, altura]).encode())
+    return h.hexdigest()
+
+
+class ServicoExportacao:
+    """Renderizador aquecido + pool de threads + cache de imagens.
+
+    trabalhadores: threads do pool (pedidos simultâneos ao renderizador).
+    capacidade: nº de imagens no cache LRU (0 desliga o cache).
+    renderizador: função que faz a conversão; padrão = kaleido via pio.to_image.
+    aquecer: sobe o servidor do kaleido e renderiza um gráfico mínimo em
+    segundo plano, para o primeiro pedido real não pagar a partida.
+    """
+
+    def __init__(
+        self,
+        trabalhadores: int = 2,
+        capacidade: int = 128,
+        *,
+        escala: float = 2,
+        renderizador: Optional[Renderizador] = None,
+        aquecer: bool = True,
+    ) -> None:
+        if trabalhadores < 1:
+            raise ValueError("trabalhadores deve ser >= 1.")
+        if capacidade < 0:
+            raise ValueError("capacidade deve ser >= 0.")
+        self.capacidade = capacidade
+        self.escala = escala
+        self._renderizador = renderizador or _renderizar_kaleido
+        self._kaleido_persistente = False
+        self._pool = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix="exportacao")
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._pendentes: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "pedidos": 0, "acertos_cache": 0, "compartilhados": 0, "renderizacoes": 0, "falhas": 0,
+            "tempo_total_s": 0.0, "tempo_max_s": 0.0, "tempo_aquecimento_s": None, "ultimo_erro": None,
+        }
+        self._aquecimento: Optional[Future] = None
+        if aquecer:
+            self._aquecimento = self._pool.submit(self._aquecer, renderizador is None)
+
+    # -----------------------------
+    # Uso principal
+    # -----------------------------
+    def enviar(
+        self,
+        fig: go.Figure | Dict[str, Any],
+        formato: str = "png",
+        *,
+        escala: Optional[float] = None,
+        largura: Optional[int] = None,
+        altura: Optional[int] = None,
+    ) -> "Future[bytes]":
+        """Enfileira a exportação; devolve um Future com os bytes da imagem.
+
+        A figura é serializada aqui (retrato do momento do pedido): alterá-la
+        depois não muda a imagem.
+        """
+        validar_formato(formato)
+        escala = self.escala if escala is None else escala
+        espec = especificacao(fig)
+        chave = chave_render(espec, formato, escala, largura, altura)
+
+        with self._lock:
+            self._stats["pedidos"] += 1
+            img = self._cache.get(chave)
+            if img is not None:
+                self._cache.move_to_end(chave)
+                self._stats["acertos_cache"] += 1
+                pronto: Future = Future()
+                pronto.set_result(img)
+                return pronto
+            andamento = self._pendentes.get(chave)
+            if andamento is not None:
+                self._stats["compartilhados"] += 1
+                return andamento
+            futuro = self._pool.submit(self._renderizar, chave, espec, formato, escala, largura, altura)
+            self._pendentes[chave] = futuro
+            return futuro
+
+    def renderizar(self, fig: go.Figure | Dict[str, Any], formato: str = "png", **opcoes: Any) -> bytes:
+        """Versão bloqueante de enviar(); exceções do renderizador sobem."""
+        return self.enviar(fig, formato, **opcoes).result()
+
+    def png_ou_none(self, fig: go.Figure | Dict[str, Any], **opcoes: Any) -> Optional[bytes]:
+        """PNG ou None se a exportação falhar (a falha fica nas estatísticas)."""
+        try:
+            return self.renderizar(fig, "png", **opcoes)
+        except Exception:
+            return None
+
+    # -----------------------------
+    # Métricas e ciclo de vida
+    # -----------------------------
+    def estatisticas(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entradas_cache"] = len(self._cache)
+            stats["bytes_cache"] = sum(len(v) for v in self._cache.values())
+            stats["em_andamento"] = len(self._pendentes)
+        stats["kaleido_persistente"] = self._kaleido_persistente
+        n = stats["renderizacoes"]
+        stats["tempo_medio_s"] = stats["tempo_total_s"] / n if n else 0.0
+        stats["taxa_acerto"] = stats["acertos_cache"] / stats["pedidos"] if stats["pedidos"] else 0.0
+        return stats
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def fechar(self) -> None:
+        """Espera os pedidos em andamento e para o pool (e o servidor do kaleido)."""
+        self._pool.shutdown(wait=True)
+        if self._kaleido_persistente:
+            _parar_kaleido()
+            self._kaleido_persistente = False
+
+    def __enter__(self) -> "ServicoExportacao":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fechar()
+
+    # -----------------------------
+    # Internos (threads do pool)
+    # -----------------------------
+    def _aquecer(self, kaleido: bool) -> None:
+        t0 = time.perf_counter()
+        try:
+            if kaleido:
+                self._kaleido_persistente = _aquecer_kaleido()
+            self._renderizador(go.Figure().to_plotly_json(), "png", 1, 16, 16)
+        except Exception as e:
+            with self._lock:
+                self._stats["ultimo_erro"] = f"aquecimento: {type(e).__name__}: {e}"
+            return
+        with self._lock:
+            self._stats["tempo_aquecimento_s"] = time.perf_counter() - t0
+
+    def _renderizar(
+        self, chave: str, espec: str, formato: str, escala: float, largura: Optional[int], altura: Optional[int],
+    ) -> bytes:
+        t0 = time.perf_counter()
+        try:
+            img = self._renderizador(json.loads(espec), formato, escala, largura, altura)
+        except Exception as e:
+            with self._lock:
+                self._pendentes.pop(chave, None)
+                self._stats["falhas"] += 1
+                self._stats["ultimo_erro"] = f"{type(e).__name__}: {e}"
+            raise
+        dt = time.perf_counter() - t0
+
+        with self._lock:
+            self._pendentes.pop(chave, None)
+            self._stats["renderizacoes"] += 1
+            self._stats["tempo_total_s"] += dt
+            self._stats["tempo_max_s"] = max(self._stats["tempo_max_s"], dt)
+            if self.capacidade:
+                self._cache[chave] = img
+                self._cache.move_to_end(chave)
+                while len(self._cache) > self.capacidade:
+                    self._cache.popitem(last=False)
+        return img
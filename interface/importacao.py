@@ -0,0 +1,273 @@
+"""Importação de geometria: DXF (ASCII) e CSV de vértices.
+
+Tudo é lido em streaming (geradores): o arquivo é percorrido uma vez, par
+a par de linhas (código de grupo, valor) no DXF, e cada entidade vira uma
+figura do core assim que termina. Não há árvore do documento em memória.
+
+DXF (seção ENTITIES):
+- CIRCLE      -> Circulo
+- LWPOLYLINE  -> Poligono (fechada, sem arcos) ou FiguraContorno
+                 (com "bulge": os arcos entram exatos); abertas são ignoradas
+- ARC         -> setor circular (região entre o arco e os dois raios):
+                 QuartoCirculo para 90° alinhados aos eixos, Semicirculo para
+                 180° com diâmetro horizontal, FiguraContorno nos demais casos
+Entidades em camadas cujo nome contém `padrao_furo` (padrão "FURO") viram furos.
+
+CSV de vértices (uma linha por vértice, polígonos em linhas consecutivas):
+    id, x, y[, anel][, furo]
+anel = 0 (ou vazio) é o contorno externo; anéis > 0 são furos internos do
+mesmo polígono. furo = 1/sim subtrai o polígono inteiro.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.contorno import ArcoEliptico, FiguraContorno, SegmentoReta
+from core.figuras import Circulo, Figura, QuartoCirculo, Semicirculo
+from core.poligono import Poligono
+from core.secao_composta import SecaoComposta
+
+from .adapters import sinal_ixy_por_orientacao
+from .arquivos import _abrir, _bool
+
+_C = 4.0 / (3.0 * math.pi)
+_TOL_ANGULO = 1e-9
+
+
+@dataclass
+class EstatisticasImportacao:
+    entidades: int = 0
+    figuras: int = 0
+    ignoradas: Dict[str, int] = field(default_factory=dict)
+
+    def ignorar(self, tipo: str) -> None:
+        self.ignoradas[tipo] = self.ignoradas.get(tipo, 0) + 1
+
+
+# =========================
+# DXF
+# =========================
+def _pares_dxf(caminho: str) -> Iterator[Tuple[int, str]]:
+    # DXFs antigos vêm em ANSI; caracteres fora de UTF-8 só aparecem em textos
+    with _abrir(caminho, "r", erros="replace") as f:
+        while True:
+            codigo = f.readline()
+            valor = f.readline()
+            if not valor:
+                return
+            yield int(codigo), valor.strip()
+
+
+def ler_entidades_dxf(caminho: str) -> Iterator[Tuple[str, List[Tuple[int, str]]]]:
+    """Gera (tipo, [(código, valor), ...]) para cada entidade da seção ENTITIES."""
+    em_entidades = False
+    atual: Optional[str] = None
+    grupos: List[Tuple[int, str]] = []
+    anterior: Tuple[int, str] = (-1, "")
+
+    for codigo, valor in _pares_dxf(caminho):
+        if codigo == 0:
+            if atual is not None:
+                yield atual, grupos
+                atual, grupos = None, []
+            if valor == "ENDSEC":
+                em_entidades = False
+            elif em_entidades:
+                atual = valor
+        elif codigo == 2 and anterior == (0, "SECTION"):
+            em_entidades = valor == "ENTITIES"
+        elif atual is not None:
+            grupos.append((codigo, valor))
+        anterior = (codigo, valor)
+
+
+def _primeiro(grupos: List[Tuple[int, str]], codigo: int, padrao: float = 0.0) -> float:
+    for c, v in grupos:
+        if c == codigo:
+            return float(v)
+    return padrao
+
+
+def _camada(grupos: List[Tuple[int, str]]) -> str:
+    for c, v in grupos:
+        if c == 8:
+            return v
+    return "0"
+
+
+def _arco_bulge(p0: Tuple[float, float], p1: Tuple[float, float], bulge: float) -> ArcoEliptico:
+    """Arco entre p0 e p1 com bulge = tan(θ/4) (θ > 0: anti-horário)."""
+    theta = 4.0 * math.atan(bulge)
+    dx, dy = p1[0] - p0[0], p1[1] - p0[1]
+    corda = math.hypot(dx, dy)
+    raio = abs(corda / (2.0 * math.sin(theta / 2.0)))
+    d = corda / (2.0 * math.tan(theta / 2.0))  # distância (com sinal) do centro ao meio da corda
+    cx = 0.5 * (p0[0] + p1[0]) - dy / corda * d
+    cy = 0.5 * (p0[1] + p1[1]) + dx / corda * d
+    inicio = math.atan2(p0[1] - cy, p0[0] - cx)
+    return ArcoEliptico(cx, cy, raio, raio, inicio, inicio + theta)
+
+
+def _polilinha(grupos: List[Tuple[int, str]], furo: bool) -> Optional[Figura]:
+    fechada = int(_primeiro(grupos, 70)) & 1
+    vertices: List[List[float]] = []  # [x, y, bulge]
+    for c, v in grupos:
+        if c == 10:
+            vertices.append([float(v), 0.0, 0.0])
+        elif c == 20 and vertices:
+            vertices[-1][1] = float(v)
+        elif c == 42 and vertices:
+            vertices[-1][2] = float(v)
+
+    if len(vertices) > 1 and vertices[0][:2] == vertices[-1][:2]:
+        vertices.pop()
+        fechada = 1
+    if not fechada or (len(vertices) < 3 and not any(b for _, _, b in vertices)):
+        return None
+
+    if not any(b for _, _, b in vertices):
+        return Poligono(vertices=[(x, y) for x, y, _ in vertices], furo=furo)
+
+    segmentos = []
+    for (x0, y0, b), (x1, y1, _) in zip(vertices, vertices[1:] + vertices[:1]):
+        if b:
+            segmentos.append(_arco_bulge((x0, y0), (x1, y1), b))
+        else:
+            segmentos.append(SegmentoReta((x0, y0), (x1, y1)))
+    return FiguraContorno(contorno=tuple(segmentos), furo=furo, nome="Polilinha")
+
+
+def _multiplo(angulo: float, passo: float) -> Optional[int]:
+    k = round(angulo / passo)
+    return int(k) % round(2 * math.pi / passo) if abs(angulo - k * passo) < _TOL_ANGULO else None
+
+
+def _setor(cx: float, cy: float, r: float, ini_graus: float, fim_graus: float, furo: bool) -> Figura:
+    ini = math.radians(ini_graus) % (2 * math.pi)
+    fim = math.radians(fim_graus) % (2 * math.pi)
+    varredura = (fim - ini) % (2 * math.pi) or 2 * math.pi
+
+    if abs(varredura - 2 * math.pi) < _TOL_ANGULO:
+        return Circulo(raio=r, x=cx, y=cy, furo=furo)
+
+    q = _multiplo(ini, math.pi / 2)
+    if q is not None and abs(varredura - math.pi / 2) < _TOL_ANGULO:
+        sx, sy = ((1, 1), (-1, 1), (-1, -1), (1, -1))[q]
+        return QuartoCirculo(
+            raio=r, x=cx + sx * _C * r, y=cy + sy * _C * r,
+            sinal_ixy=sinal_ixy_por_orientacao(sx, sy, base_sinal=-1), furo=furo,
+        )
+    if q in (0, 2) and abs(varredura - math.pi) < _TOL_ANGULO:
+        s = 1 if q == 0 else -1  # arco para cima (0° -> 180°) ou para baixo
+        return Semicirculo(raio=r, x=cx, y=cy + s * _C * r, furo=furo)
+
+    p0 = (cx + r * math.cos(ini), cy + r * math.sin(ini))
+    p1 = (cx + r * math.cos(ini + varredura), cy + r * math.sin(ini + varredura))
+    return FiguraContorno(
+        contorno=(
+            SegmentoReta((cx, cy), p0),
+            ArcoEliptico(cx, cy, r, r, ini, ini + varredura),
+            SegmentoReta(p1, (cx, cy)),
+        ),
+        furo=furo,
+        nome="Setor circular",
+    )
+
+
+def figuras_dxf(
+    caminho: str,
+    *,
+    padrao_furo: str = "FURO",
+    estatisticas: Optional[EstatisticasImportacao] = None,
+) -> Iterator[Figura]:
+    """Gera as figuras do core a partir das entidades do DXF."""
+    stats = estatisticas if estatisticas is not None else EstatisticasImportacao()
+    padrao = padrao_furo.upper()
+
+    for tipo, grupos in ler_entidades_dxf(caminho):
+        stats.entidades += 1
+        furo = bool(padrao) and padrao in _camada(grupos).upper()
+
+        fig: Optional[Figura] = None
+        if tipo == "CIRCLE":
+            fig = Circulo(raio=_primeiro(grupos, 40), x=_primeiro(grupos, 10), y=_primeiro(grupos, 20), furo=furo)
+        elif tipo == "LWPOLYLINE":
+            fig = _polilinha(grupos, furo)
+        elif tipo == "ARC":
+            fig = _setor(
+                _primeiro(grupos, 10), _primeiro(grupos, 20), _primeiro(grupos, 40),
+                _primeiro(grupos, 50), _primeiro(grupos, 51), furo,
+            )
+
+        if fig is None:
+            stats.ignorar(tipo)
+            continue
+        stats.figuras += 1
+        yield fig
+
+
+# =========================
+# CSV de vértices
+# =========================
+def _poligono_csv(aneis: Dict[int, List[Tuple[float, float]]], furo: bool) -> Poligono:
+    if 0 not in aneis:
+        raise ValueError("Polígono sem contorno externo (anel 0) no CSV.")
+    return Poligono(
+        vertices=aneis[0],
+        furos=[aneis[k] for k in sorted(aneis) if k != 0],
+        furo=furo,
+    )
+
+
+def figuras_csv(caminho: str) -> Iterator[Poligono]:
+    """Gera um Poligono por grupo de linhas consecutivas com o mesmo id."""
+    with _abrir(caminho, "r") as f:
+        atual: Any = None
+        aneis: Dict[int, List[Tuple[float, float]]] = {}
+        furo = False
+        for linha in csv.DictReader(f):
+            ident = linha.get("id")
+            if ident != atual and aneis:
+                yield _poligono_csv(aneis, furo)
+                aneis = {}
+            atual = ident
+            anel = int(linha.get("anel") or 0)
+            aneis.setdefault(anel, []).append((float(linha["x"]), float(linha["y"])))
+            furo = _bool(linha.get("furo") or "")
+        if aneis:
+            yield _poligono_csv(aneis, furo)
+
+
+# =========================
+# Seção
+# =========================
+def importar_geometria(
+    caminho: str,
+    *,
+    unidade: str = "cm",
+    secao: Optional[SecaoComposta] = None,
+    padrao_furo: str = "FURO",
+    estatisticas: Optional[EstatisticasImportacao] = None,
+) -> SecaoComposta:
+    """Lê um .dxf ou .csv (também .gz) e adiciona as figuras à seção.
+
+    secao: seção existente (ex.: com TabelaFiguras); por padrão cria uma nova.
+    """
+    if secao is None:
+        secao = SecaoComposta(unidade_comprimento=unidade)
+
+    nome = caminho[:-3] if caminho.endswith(".gz") else caminho
+    if nome.lower().endswith(".dxf"):
+        figuras: Iterator[Figura] = figuras_dxf(caminho, padrao_furo=padrao_furo, estatisticas=estatisticas)
+    elif nome.lower().endswith(".csv"):
+        figuras = figuras_csv(caminho)
+    else:
+        raise ValueError(f"Formato de geometria não suportado: {caminho} (use .dxf ou .csv)")
+
+    for fig in figuras:
+        secao.adicionar(fig)
+    return secao
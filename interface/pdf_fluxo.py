@@ -0,0 +1,267 @@
+"""Escrita de PDF em fluxo: cada página vai para o arquivo no showPage().
+
+O Canvas do ReportLab guarda o documento inteiro até o save(); num relatório
+com milhares de seções a memória cresce com o número de páginas. CanvasFluxo
+implementa o subconjunto da API do canvas usado nos relatórios (fontes
+padrão Helvetica/Courier, texto, linhas, retângulos, caminhos, cores,
+tracejado, recorte) e grava o conteúdo de cada página (comprimido) assim que
+ela termina. Na memória ficam só os offsets dos objetos (tabela xref).
+
+showPage(frente=True) coloca a página no início do documento (árvore de
+páginas): o sumário pode ser escrito por último, quando todas as seções e
+suas páginas já são conhecidas.
+
+    c = CanvasFluxo("relatorio.pdf")
+    c.setFont("Helvetica", 10)
+    c.drawString(72, 800, "Seção 1")
+    c.showPage()
+    c.save()
+"""
+
+from __future__ import annotations
+
+import zlib
+from array import array
+from datetime import datetime
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# mesmos valores de reportlab.pdfgen.canvas
+FILL_EVEN_ODD = 0
+FILL_NON_ZERO = 1
+
+_FONTES = {"Helvetica": "F1", "Helvetica-Bold": "F2", "Courier": "F3"}
+
+# fontes padrão usam WinAnsi (cp1252); o resto é trocado por equivalentes
+_TROCAS = str.maketrans({"α": "alfa", "⁴": "^4", "≤": "<=", "≥": ">=", "✅": "", "⚠": "!"})
+
+_OBJ_CATALOGO = 1
+_OBJ_PAGINAS = 2
+
+
+def _num(v: float) -> str:
+    s = f"{v:.3f}".rstrip("0").rstrip(".")
+    return "0" if s in ("", "-0") else s
+
+
+def _texto(txt: str) -> str:
+    return txt.translate(_TROCAS)
+
+
+def _literal(txt: str) -> bytes:
+    b = _texto(txt).encode("cp1252", errors="replace")
+    return b"(" + b.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+class CaminhoFluxo:
+    """Equivalente ao PDFPathObject do ReportLab (moveTo/lineTo/close/rect)."""
+
+    def __init__(self) -> None:
+        self._ops: List[str] = []
+
+    def moveTo(self, x: float, y: float) -> None:
+        self._ops.append(f"{_num(x)} {_num(y)} m")
+
+    def lineTo(self, x: float, y: float) -> None:
+        self._ops.append(f"{_num(x)} {_num(y)} l")
+
+    def rect(self, x: float, y: float, w: float, h: float) -> None:
+        self._ops.append(f"{_num(x)} {_num(y)} {_num(w)} {_num(h)} re")
+
+    def close(self) -> None:
+        self._ops.append("h")
+
+
+class CanvasFluxo:
+    """Canvas (subconjunto da API do ReportLab) que grava página a página."""
+
+    def __init__(
+        self,
+        destino: Union[str, BinaryIO],
+        pagesize: Tuple[float, float] = A4,
+        *,
+        titulo: str = "",
+        compressao: bool = True,
+    ) -> None:
+        self._proprio = isinstance(destino, str)
+        self._arq: BinaryIO = open(destino, "wb") if self._proprio else destino  # type: ignore[arg-type]
+        self._pagesize = pagesize
+        self._titulo = titulo
+        self._compressao = compressao
+        self._pos = 0
+        self._offsets = array("q", [0, 0])  # 1 = catálogo, 2 = árvore de páginas (gravados no fim)
+        self._frente = array("q")
+        self._corpo = array("q")
+        self._ops: List[str] = []
+        self._fechado = False
+
+        self._gravar(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._fontes = {
+            apelido: self._objeto(
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{nome} /Encoding /WinAnsiEncoding >>".encode()
+            )
+            for nome, apelido in _FONTES.items()
+        }
+        self._recursos = (
+            "<< /Font << " + " ".join(f"/{a} {n} 0 R" for a, n in self._fontes.items()) + " >> >>"
+        ).encode()
+        self._reiniciar_estado()
+
+    # -----------------------------
+    # Estado gráfico
+    # -----------------------------
+    def _reiniciar_estado(self) -> None:
+        # como no ReportLab, cada página recomeça com Helvetica 12
+        self._fonte = "Helvetica"
+        self._tamanho = 12.0
+        self._pilha: List[Tuple[str, float]] = []
+
+    def setFont(self, psfontname: str, size: float, leading: Optional[float] = None) -> None:
+        if psfontname not in _FONTES:
+            raise ValueError(f"Fonte não suportada no PDF em fluxo: {psfontname!r}. Use uma de {tuple(_FONTES)}.")
+        self._fonte = psfontname
+        self._tamanho = float(size)
+
+    def stringWidth(self, text: str, fontName: Optional[str] = None, fontSize: Optional[float] = None) -> float:
+        return stringWidth(_texto(text), fontName or self._fonte, self._tamanho if fontSize is None else fontSize)
+
+    def setLineWidth(self, width: float) -> None:
+        self._ops.append(f"{_num(width)} w")
+
+    def setStrokeColorRGB(self, r: float, g: float, b: float) -> None:
+        self._ops.append(f"{_num(r)} {_num(g)} {_num(b)} RG")
+
+    def setFillColorRGB(self, r: float, g: float, b: float) -> None:
+        self._ops.append(f"{_num(r)} {_num(g)} {_num(b)} rg")
+
+    def setDash(self, array: Union[float, Sequence[float]] = (), phase: float = 0) -> None:
+        valores = [array] if isinstance(array, (int, float)) else list(array)
+        self._ops.append("[" + " ".join(_num(v) for v in valores) + f"] {_num(phase)} d")
+
+    def saveState(self) -> None:
+        self._ops.append("q")
+        self._pilha.append((self._fonte, self._tamanho))
+
+    def restoreState(self) -> None:
+        self._ops.append("Q")
+        self._fonte, self._tamanho = self._pilha.pop()
+
+    # -----------------------------
+    # Desenho
+    # -----------------------------
+    def drawString(self, x: float, y: float, text: str) -> None:
+        apelido = _FONTES[self._fonte]
+        self._ops.append(
+            f"BT /{apelido} {_num(self._tamanho)} Tf {_num(x)} {_num(y)} Td "
+            + _literal(text).decode("latin-1") + " Tj ET"
+        )
+
+    def drawRightString(self, x: float, y: float, text: str) -> None:
+        self.drawString(x - self.stringWidth(text), y, text)
+
+    def drawCentredString(self, x: float, y: float, text: str) -> None:
+        self.drawString(x - self.stringWidth(text) / 2, y, text)
+
+    def line(self, x1: float, y1: float, x2: float, y2: float) -> None:
+        self._ops.append(f"{_num(x1)} {_num(y1)} m {_num(x2)} {_num(y2)} l S")
+
+    def rect(self, x: float, y: float, width: float, height: float, stroke: int = 1, fill: int = 0) -> None:
+        self._ops.append(f"{_num(x)} {_num(y)} {_num(width)} {_num(height)} re {self._pintura(stroke, fill, None)}")
+
+    def beginPath(self) -> CaminhoFluxo:
+        return CaminhoFluxo()
+
+    def drawPath(self, aPath: CaminhoFluxo, stroke: int = 1, fill: int = 0, fillMode: Optional[int] = None) -> None:
+        if aPath._ops:
+            self._ops.append("\n".join(aPath._ops) + " " + self._pintura(stroke, fill, fillMode))
+
+    def clipPath(self, aPath: CaminhoFluxo, stroke: int = 1, fill: int = 0, fillMode: Optional[int] = None) -> None:
+        par = "W*" if fillMode == FILL_EVEN_ODD else "W"
+        self._ops.append("\n".join(aPath._ops) + f" {par} " + self._pintura(stroke, fill, fillMode))
+
+    @staticmethod
+    def _pintura(stroke: int, fill: int, fillMode: Optional[int]) -> str:
+        par = "*" if fillMode == FILL_EVEN_ODD else ""
+        if stroke and fill:
+            return "B" + par
+        if fill:
+            return "f" + par
+        return "S" if stroke else "n"
+
+    # -----------------------------
+    # Páginas e arquivo
+    # -----------------------------
+    def getPageNumber(self) -> int:
+        return len(self._frente) + len(self._corpo) + 1
+
+    def showPage(self, frente: bool = False) -> None:
+        """Grava a página atual no arquivo; frente=True a põe no início do documento."""
+        dados = ("\n".join(self._ops) + "\n").encode("latin-1")
+        if self._compressao:
+            dados = zlib.compress(dados, 6)
+            filtro = b" /Filter /FlateDecode"
+        else:
+            filtro = b""
+        conteudo = self._objeto(
+            b"<< /Length %d%s >>\nstream\n" % (len(dados), filtro) + dados + b"\nendstream"
+        )
+        w, h = self._pagesize
+        pagina = self._objeto(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %s %s] /Resources %s /Contents %d 0 R >>"
+            % (_OBJ_PAGINAS, _num(w).encode(), _num(h).encode(), self._recursos, conteudo)
+        )
+        (self._frente if frente else self._corpo).append(pagina)
+        self._ops = []
+        self._reiniciar_estado()
+
+    @property
+    def bytes_escritos(self) -> int:
+        return self._pos
+
+    def save(self) -> None:
+        """Fecha o documento (árvore de páginas, xref e trailer)."""
+        if self._fechado:
+            return
+        if self._ops:
+            self.showPage()
+
+        kids = b" ".join(b"%d 0 R" % n for n in (*self._frente, *self._corpo))
+        self._objeto(
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._frente) + len(self._corpo)),
+            numero=_OBJ_PAGINAS,
+        )
+        self._objeto(b"<< /Type /Catalog /Pages %d 0 R >>" % _OBJ_PAGINAS, numero=_OBJ_CATALOGO)
+        info = self._objeto(
+            b"<< /Producer (momentos_inercia) /CreationDate (D:"
+            + datetime.now().strftime("%Y%m%d%H%M%S").encode()
+            + b") /Title " + _literal(self._titulo) + b" >>"
+        )
+
+        inicio_xref = self._pos
+        n = len(self._offsets)
+        self._gravar(b"xref\n0 %d\n0000000000 65535 f \n" % (n + 1))
+        for i in range(0, n, 4096):
+            self._gravar(b"".join(b"%010d 00000 n \n" % off for off in self._offsets[i:i + 4096]))
+        self._gravar(
+            b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (n + 1, _OBJ_CATALOGO, info, inicio_xref)
+        )
+        self._fechado = True
+        if self._proprio:
+            self._arq.close()
+        else:
+            self._arq.flush()
+
+    def _gravar(self, dados: bytes) -> None:
+        self._arq.write(dados)
+        self._pos += len(dados)
+
+    def _objeto(self, corpo: bytes, numero: Optional[int] = None) -> int:
+        if numero is None:
+            self._offsets.append(0)
+            numero = len(self._offsets)
+        self._offsets[numero - 1] = self._pos
+        self._gravar(b"%d 0 obj\n" % numero + corpo + b"\nendobj\n")
+        return numero
@@ -0,0 +1,144 @@
+"""Desenho vetorial da seção direto no canvas do PDF.
+
+Substitui o PNG do kaleido no relatório: os contornos saem dos mesmos
+geradores do gráfico (interface/plotter.contornos_agrupados: modelos em
+NumPy, sólidos e furos separados por NaN) e viram caminhos do PDF, com
+centroides, CG global e eixos principais (mesma geometria de
+plotter.segmento_eixo). Nada é rasterizado: o arquivo fica pequeno, nítido
+em qualquer zoom e não depende de kaleido/Chrome.
+
+Funciona com o canvas do ReportLab e com interface/pdf_fluxo.CanvasFluxo
+(mesma API).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .pdf_fluxo import FILL_NON_ZERO
+from .plotter import contornos_agrupados, segmento_eixo
+
+_COR_TRACO = (0.2, 0.2, 0.2)
+_COR_SOLIDO = (0.85, 0.88, 0.93)
+_COR_FURO = (1.0, 0.88, 0.88)
+_COR_CG = (0.8, 0.1, 0.1)
+_COR_EIXOS = (0.1, 0.3, 0.7)
+
+
+def _aneis(c: Any, xs: np.ndarray, ys: np.ndarray) -> Iterator[Any]:
+    """Um caminho fechado por trecho entre NaNs."""
+    x, y = xs.tolist(), ys.tolist()
+    inicio = 0
+    for fim in [*np.flatnonzero(np.isnan(xs)).tolist(), len(x)]:
+        if fim - inicio >= 2:
+            p = c.beginPath()
+            p.moveTo(x[inicio], y[inicio])
+            for j in range(inicio + 1, fim):
+                p.lineTo(x[j], y[j])
+            p.close()
+            yield p
+        inicio = fim + 1
+
+
+def _marcas_x(c: Any, xs: np.ndarray, ys: np.ndarray, r: float) -> Any:
+    p = c.beginPath()
+    for x, y in zip(xs.tolist(), ys.tolist()):
+        p.moveTo(x - r, y - r)
+        p.lineTo(x + r, y + r)
+        p.moveTo(x - r, y + r)
+        p.lineTo(x + r, y - r)
+    return p
+
+
+def desenhar_secao(
+    c: Any,
+    figs: List[Dict],
+    xg: Optional[float],
+    yg: Optional[float],
+    alpha1_deg: Optional[float] = None,
+    alpha2_deg: Optional[float] = None,
+    *,
+    caixa: Tuple[float, float, float, float],
+    detalhe: float = 4.0,
+    centroides: bool = True,
+) -> None:
+    """Desenha a seção em escala dentro de caixa = (x, y, largura, altura), em pontos.
+
+    Eixos principais: α1 contínuo, α2 tracejado (como em plot_secao).
+    detalhe: zoom (× a largura da caixa) até o qual os arcos continuam lisos
+    (nível de detalhe de plotter.segmentos_por_volta).
+    """
+    bx, by, bw, bh = caixa
+    ct = contornos_agrupados(figs, largura_px=bw * detalhe)
+    todos_x = np.concatenate([ct["solidos_x"], ct["furos_x"]])
+    todos_y = np.concatenate([ct["solidos_y"], ct["furos_y"]])
+
+    c.saveState()
+    c.setLineWidth(0.6)
+    c.setStrokeColorRGB(*_COR_TRACO)
+    c.rect(bx, by, bw, bh, stroke=1, fill=0)
+    if not np.isfinite(todos_x).any():
+        c.restoreState()
+        return
+
+    minx, maxx = float(np.nanmin(todos_x)), float(np.nanmax(todos_x))
+    miny, maxy = float(np.nanmin(todos_y)), float(np.nanmax(todos_y))
+    esc = 0.85 * min(bw / max(maxx - minx, 1e-12), bh / max(maxy - miny, 1e-12))
+    ox = bx + bw / 2 - esc * (minx + maxx) / 2
+    oy = by + bh / 2 - esc * (miny + maxy) / 2
+
+    def px(v: Any) -> Any:
+        return ox + esc * v
+
+    def py(v: Any) -> Any:
+        return oy + esc * v
+
+    recorte = c.beginPath()
+    recorte.rect(bx, by, bw, bh)
+    c.clipPath(recorte, stroke=0, fill=0)
+
+    # eixos globais (x = 0, y = 0)
+    c.setLineWidth(0.4)
+    c.setStrokeColorRGB(0.6, 0.6, 0.6)
+    c.setDash([3, 2])
+    c.line(bx, py(0.0), bx + bw, py(0.0))
+    c.line(px(0.0), by, px(0.0), by + bh)
+    c.setDash([])
+
+    c.setLineWidth(0.6)
+    c.setStrokeColorRGB(*_COR_TRACO)
+    # um caminho por anel: sobreposições (de qualquer orientação) continuam cheias
+    c.setFillColorRGB(*_COR_SOLIDO)
+    for anel in _aneis(c, px(ct["solidos_x"]), py(ct["solidos_y"])):
+        c.drawPath(anel, stroke=1, fill=1, fillMode=FILL_NON_ZERO)
+    c.setFillColorRGB(*_COR_FURO)
+    for anel in _aneis(c, px(ct["furos_x"]), py(ct["furos_y"])):
+        c.drawPath(anel, stroke=1, fill=1, fillMode=FILL_NON_ZERO)
+
+    if centroides and ct["cx"].size:
+        c.setLineWidth(0.4)
+        c.drawPath(_marcas_x(c, px(ct["cx"]), py(ct["cy"]), 1.5), stroke=1, fill=0)
+
+    if xg is not None and yg is not None:
+        gx, gy = px(xg), py(yg)
+        span = math.hypot(bw, bh)
+        c.setStrokeColorRGB(*_COR_EIXOS)
+        c.setLineWidth(0.8)
+        for ang, traco in ((alpha1_deg, []), (alpha2_deg, [4, 2])):
+            if ang is None:
+                continue
+            c.setDash(traco)
+            c.line(*segmento_eixo(gx, gy, ang, span))
+        c.setDash([])
+
+        c.setStrokeColorRGB(*_COR_CG)
+        c.setFillColorRGB(*_COR_CG)
+        c.setLineWidth(0.8)
+        c.drawPath(_marcas_x(c, np.array([gx]), np.array([gy]), 3.0), stroke=1, fill=0)
+        c.setFont("Helvetica", 7)
+        c.drawString(gx + 4, gy + 4, "CG")
+
+    c.restoreState()
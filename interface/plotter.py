@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import plotly.graph_objects as go
 
 from .adapters import centroid_xy, orient_sx_sy, orient_semi
 
 _C = 4.0 / (3.0 * math.pi)
 
+# acima deste nº de figuras plot_secao agrupa os contornos em poucos traces
+LIMITE_AGRUPADO = 100
+# acima deste nº de figuras os traces passam a ser Scattergl (WebGL)
+LIMITE_WEBGL = 2000
+
+# nível de detalhe dos arcos: segmentos por volta completa (potências de 2)
+# tais que a flecha de cada corda fique abaixo de TOL_FLECHA_PX na tela
+SEGMENTOS_MIN = 8
+SEGMENTOS_MAX = 256
+TOL_FLECHA_PX = 0.5
+
+_FILL_SOLIDO = "rgba(255,255,255,0.18)"
+_FILL_FURO = "rgba(255,0,0,0.12)"
+
 
 def _bounds_update(xs: List[float], ys: List[float], pts: List[Tuple[float, float]]) -> None:
     for x, y in pts:
@@ -16,7 +32,8 @@ def _bounds_update(xs: List[float], ys: List[float], pts: List[Tuple[float, floa
         ys.append(y)
 
 
-def _tri_points(fig: Dict, n_close: bool = True) -> List[Tuple[float, float]]:
+def _ancora_tri(fig: Dict) -> Tuple[float, float, int, int, float, float]:
+    """(x0, y0, sx, sy, b, h): vértice do ângulo reto, orientação e catetos."""
     b = float(fig["base"])
     h = float(fig["altura"])
     modo = fig.get("modo_pos", "Centroide (x, y)")
@@ -29,14 +46,19 @@ def _tri_points(fig: Dict, n_close: bool = True) -> List[Tuple[float, float]]:
     else:
         x0 = float(fig["x0"])
         y0 = float(fig["y0"])
+    return x0, y0, sx, sy, b, h
 
+
+def _tri_points(fig: Dict, n_close: bool = True) -> List[Tuple[float, float]]:
+    x0, y0, sx, sy, b, h = _ancora_tri(fig)
     pts = [(x0, y0), (x0 + sx * b, y0), (x0, y0 + sy * h)]
     if n_close:
         pts.append((x0, y0))
     return pts
 
 
-def _semi_poly(fig: Dict, n: int = 60) -> List[Tuple[float, float]]:
+def _ancora_semi(fig: Dict) -> Tuple[float, float, str, int, float]:
+    """(x0, y0, diametro, sinal, r): ponto médio do diâmetro e orientação."""
     r = float(fig["raio"])
     modo = fig.get("modo_pos", "Centroide (x, y)")
     diam, s = orient_semi(fig)
@@ -52,24 +74,39 @@ def _semi_poly(fig: Dict, n: int = 60) -> List[Tuple[float, float]]:
     else:
         x0 = float(fig["x0"])
         y0 = float(fig["y0"])
+    return x0, y0, diam, s, r
+
 
-    pts: List[Tuple[float, float]] = []
+@lru_cache(maxsize=None)
+def _tabela_arco(quartos: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(cos, sen) de n segmentos em [0, quartos·90°]; tabelas compartilhadas (somente leitura)."""
+    th = np.linspace(0.0, quartos * math.pi / 2, n + 1)
+    c, s = np.cos(th), np.sin(th)
+    c.flags.writeable = False
+    s.flags.writeable = False
+    return c, s
+
+
+def _semi_poly(fig: Dict, n: int = SEGMENTOS_MAX // 2) -> List[Tuple[float, float]]:
+    """Contorno do semicírculo com n segmentos no arco."""
+    x0, y0, diam, s, r = _ancora_semi(fig)
+    c, sn = _tabela_arco(2, n)
 
     if diam == "H":
-        for i in range(n + 1):
-            th = math.pi * i / n
-            pts.append((x0 + r * math.cos(th), y0 + s * r * math.sin(th)))
-        pts.append((x0 - r, y0))
-        return pts
-
-    for i in range(n + 1):
-        th = -math.pi / 2 + math.pi * i / n
-        pts.append((x0 + s * r * math.cos(th), y0 + r * math.sin(th)))
-    pts.append((x0, y0 - r))
+        xs, ys = x0 + r * c, y0 + s * r * sn
+        fecho = (x0 - r, y0)
+    else:
+        # arco de -90° a +90° em torno do diâmetro vertical
+        xs, ys = x0 + s * r * sn, y0 - r * c
+        fecho = (x0, y0 - r)
+
+    pts = list(zip(xs.tolist(), ys.tolist()))
+    pts.append(fecho)
     return pts
 
 
-def _quarter_poly(fig: Dict, n: int = 40) -> List[Tuple[float, float]]:
+def _ancora_quarto(fig: Dict) -> Tuple[float, float, int, int, float]:
+    """(x0, y0, sx, sy, r): canto (centro do arco) e quadrante."""
     r = float(fig["raio"])
     modo = fig.get("modo_pos", "Centroide (x, y)")
     sx, sy = orient_sx_sy(fig)
@@ -81,35 +118,243 @@ def _quarter_poly(fig: Dict, n: int = 40) -> List[Tuple[float, float]]:
     else:
         x0 = float(fig["x0"])
         y0 = float(fig["y0"])
+    return x0, y0, sx, sy, r
 
+
+def _quarter_poly(fig: Dict, n: int = SEGMENTOS_MAX // 4) -> List[Tuple[float, float]]:
+    """Contorno do 1/4 de círculo com n segmentos no arco."""
+    x0, y0, sx, sy, r = _ancora_quarto(fig)
+    c, sn = _tabela_arco(1, n)
     pts: List[Tuple[float, float]] = [(x0, y0)]
-    for i in range(n + 1):
-        th = (math.pi / 2) * i / n
-        pts.append((x0 + sx * r * math.cos(th), y0 + sy * r * math.sin(th)))
+    pts.extend(zip((x0 + sx * r * c).tolist(), (y0 + sy * r * sn).tolist()))
     pts.append((x0, y0))
     return pts
 
 
-def _add_axis_line(fig: go.Figure, x0: float, y0: float, ang_deg: float, span: float, dash: str = "solid") -> None:
-    """Adiciona uma linha infinita 'cortada' pelo span, passando por (x0,y0)."""
+# =========================
+# Modo agrupado (poucos traces)
+# =========================
+# Cada primitiva é um contorno-modelo (u, v) levado ao plano por uma afim
+#   X = x0 + m11·u + m12·v,   Y = y0 + m21·u + m22·v
+# Figuras do mesmo modelo são transformadas em bloco (NumPy) e concatenadas
+# com NaN entre os contornos (o Plotly trata NaN/None como quebra de linha, e
+# fill="toself" preenche cada trecho separadamente).
+# Arcos usam as tabelas de _tabela_arco com nº de segmentos escolhido pelo
+# tamanho do raio na tela (nível de detalhe).
+_ARCOS = {"circulo": 4, "semicirculo": 2, "quarto": 1}  # quartos de volta de cada modelo
+
+
+@lru_cache(maxsize=None)
+def _modelo(nome: str, segmentos: int = SEGMENTOS_MAX) -> np.ndarray:
+    """Contorno-modelo (2, k); `segmentos` é por volta completa (múltiplo de 4)."""
+    if nome == "retangulo":
+        return np.array([[-0.5, 0.5, 0.5, -0.5, -0.5], [-0.5, -0.5, 0.5, 0.5, -0.5]])
+    if nome == "triangulo":
+        return np.array([[0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]])
+    c, s = _tabela_arco(_ARCOS[nome], segmentos * _ARCOS[nome] // 4)
+    if nome == "circulo":
+        return np.vstack([c, s])
+    if nome == "semicirculo":
+        return np.vstack([np.append(c, 1.0), np.append(s, 0.0)])
+    return np.vstack([np.concatenate([[0.0], c, [0.0]]), np.concatenate([[0.0], s, [0.0]])])
+
+
+def segmentos_por_volta(raio_px: np.ndarray) -> np.ndarray:
+    """Segmentos por volta para que a flecha das cordas fique < TOL_FLECHA_PX.
+
+    flecha = r·(1 - cos(π/N))  =>  N = π / acos(1 - tol/r), arredondado para
+    a potência de 2 seguinte e limitado a [SEGMENTOS_MIN, SEGMENTOS_MAX].
+    """
+    r = np.maximum(np.asarray(raio_px, dtype=float), TOL_FLECHA_PX)
+    n = math.pi / np.arccos(np.clip(1.0 - TOL_FLECHA_PX / r, -1.0, 1.0))
+    n = 2.0 ** np.ceil(np.log2(np.maximum(n, 1.0)))
+    return np.clip(n, SEGMENTOS_MIN, SEGMENTOS_MAX).astype(int)
+
+
+def _afim(f: Dict) -> Tuple[str, Tuple[float, float, float, float, float, float]]:
+    """(modelo, (x0, y0, m11, m12, m21, m22)) de uma primitiva."""
+    tipo = f["tipo"]
+    if tipo == "Retângulo":
+        x, y = centroid_xy(f)
+        return "retangulo", (x, y, float(f["base"]), 0.0, 0.0, float(f["altura"]))
+    if tipo == "Círculo":
+        x, y = centroid_xy(f)
+        r = float(f["raio"])
+        return "circulo", (x, y, r, 0.0, 0.0, r)
+    if tipo == "Triângulo Retângulo":
+        x0, y0, sx, sy, b, h = _ancora_tri(f)
+        return "triangulo", (x0, y0, sx * b, 0.0, 0.0, sy * h)
+    if tipo == "Semicírculo":
+        x0, y0, diam, s, r = _ancora_semi(f)
+        if diam == "H":
+            return "semicirculo", (x0, y0, r, 0.0, 0.0, s * r)
+        # diâmetro vertical: modelo girado de -90° (arco para +x se s=+1)
+        return "semicirculo", (x0, y0, 0.0, s * r, -r, 0.0)
+    if tipo == "Quarto de Círculo":
+        x0, y0, sx, sy, r = _ancora_quarto(f)
+        return "quarto", (x0, y0, sx * r, 0.0, 0.0, sy * r)
+    raise ValueError(f"Tipo de figura não suportado no gráfico: {tipo!r}")
+
+
+def _transformar(modelo: np.ndarray, params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Aplica as afins (m, 6) ao modelo (2, k); devolve X, Y achatados com NaN entre contornos."""
+    u, v = modelo
+    p = params.T[:, :, None]
+    gx = np.full((len(params), u.size + 1), np.nan)
+    gy = np.full((len(params), u.size + 1), np.nan)
+    gx[:, :-1] = p[0] + p[2] * u + p[3] * v
+    gy[:, :-1] = p[1] + p[4] * u + p[5] * v
+    return gx.ravel(), gy.ravel()
+
+
+def _caixa(nome: str, params: np.ndarray) -> Tuple[float, float, float, float]:
+    """Caixa envolvente das figuras de um modelo (não depende do nº de segmentos)."""
+    u, v = _modelo(nome, SEGMENTOS_MIN)
+    cu = np.array([u.min(), u.max(), u.min(), u.max()])
+    cv = np.array([v.min(), v.min(), v.max(), v.max()])
+    p = params.T[:, :, None]
+    gx = p[0] + p[2] * cu + p[3] * cv
+    gy = p[1] + p[4] * cu + p[5] * cv
+    return gx.min(), gx.max(), gy.min(), gy.max()
+
+
+def _escala_tela(caixas: List[Tuple[float, float, float, float]], largura_px: Optional[float]) -> Optional[float]:
+    """Pixels por unidade do desenho (margem de 15% de cada lado); None sem largura_px."""
+    if largura_px is None or not caixas:
+        return None
+    c = np.array(caixas)
+    extensao = max(c[:, 1].max() - c[:, 0].min(), c[:, 3].max() - c[:, 2].min())
+    return largura_px / max(1.3 * extensao, 1e-300)
+
+
+def contornos_agrupados(figs: List[Dict], largura_px: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """Contornos de todas as figuras em dois grupos (sólidos e furos) + centroides.
+
+    largura_px: largura do gráfico na tela; define o nº de segmentos de cada
+    arco pelo raio em pixels (segmentos_por_volta). None = SEGMENTOS_MAX.
+
+    Retorna {"solidos_x", "solidos_y", "furos_x", "furos_y", "cx", "cy"}.
+    """
+    params: Dict[Tuple[str, bool], List[Tuple[float, ...]]] = {}
+    partes: Dict[bool, Tuple[List[np.ndarray], List[np.ndarray]]] = {False: ([], []), True: ([], [])}
+    cx = np.empty(len(figs))
+    cy = np.empty(len(figs))
+
+    for i, f in enumerate(figs):
+        is_furo = bool(f.get("furo", False))
+        cx[i], cy[i] = centroid_xy(f)
+        if f["tipo"] == "Polígono":
+            for k, anel in enumerate([f["vertices"]] + list(f.get("furos") or [])):
+                a = np.asarray(anel, dtype=float).reshape(-1, 2)
+                xs, ys = partes[is_furo or k > 0]
+                xs.append(np.concatenate([a[:, 0], a[:1, 0], [np.nan]]))
+                ys.append(np.concatenate([a[:, 1], a[:1, 1], [np.nan]]))
+            continue
+        nome, afim = _afim(f)
+        params.setdefault((nome, is_furo), []).append(afim)
+
+    blocos = {chave: np.array(linhas, dtype=float) for chave, linhas in params.items()}
+
+    escala = None
+    if largura_px is not None and blocos:
+        caixas = [_caixa(nome, p) for (nome, _), p in blocos.items()]
+        for xs, ys in zip(partes[False][0] + partes[True][0], partes[False][1] + partes[True][1]):
+            caixas.append((np.nanmin(xs), np.nanmax(xs), np.nanmin(ys), np.nanmax(ys)))
+        escala = _escala_tela(caixas, largura_px)
+
+    for (nome, is_furo), p in blocos.items():
+        if nome not in _ARCOS or escala is None:
+            grupos = [(SEGMENTOS_MAX, p)]
+        else:
+            raio = np.hypot(p[:, 2], p[:, 4])
+            seg = segmentos_por_volta(raio * escala)
+            grupos = [(int(n), p[seg == n]) for n in np.unique(seg)]
+        for n, sub in grupos:
+            gx, gy = _transformar(_modelo(nome, n), sub)
+            partes[is_furo][0].append(gx)
+            partes[is_furo][1].append(gy)
+
+    def _juntar(lst: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate(lst) if lst else np.empty(0)
+
+    return {
+        "solidos_x": _juntar(partes[False][0]), "solidos_y": _juntar(partes[False][1]),
+        "furos_x": _juntar(partes[True][0]), "furos_y": _juntar(partes[True][1]),
+        "cx": cx, "cy": cy,
+    }
+
+
+def _plot_agrupado(
+    fig: go.Figure, figs: List[Dict], trace: type, largura_px: Optional[float],
+) -> Tuple[float, float, float, float]:
+    """Três traces no total (sólidos, furos, centroides); devolve (minx, maxx, miny, maxy)."""
+    c = contornos_agrupados(figs, largura_px)
+    for chave, fill in (("solidos", _FILL_SOLIDO), ("furos", _FILL_FURO)):
+        gx, gy = c[f"{chave}_x"], c[f"{chave}_y"]
+        if gx.size:
+            fig.add_trace(trace(
+                x=gx, y=gy,
+                mode="lines",
+                fill="toself",
+                fillcolor=fill,
+                line=dict(width=2),
+                showlegend=False,
+                hoverinfo="skip",
+            ))
+    fig.add_trace(trace(
+        x=c["cx"], y=c["cy"],
+        mode="markers",
+        marker=dict(size=9, symbol="x"),
+        showlegend=False,
+        hoverinfo="skip",
+    ))
+
+    todos_x = np.concatenate([c["solidos_x"], c["furos_x"]])
+    todos_y = np.concatenate([c["solidos_y"], c["furos_y"]])
+    if not np.isfinite(todos_x).any():
+        return -10, 10, -10, 10
+    return (float(np.nanmin(todos_x)), float(np.nanmax(todos_x)),
+            float(np.nanmin(todos_y)), float(np.nanmax(todos_y)))
+
+
+def segmento_eixo(x0: float, y0: float, ang_deg: float, span: float) -> Tuple[float, float, float, float]:
+    """(x1, y1, x2, y2) da reta por (x0, y0) com ângulo ang_deg, cortada em ±span."""
     ang = math.radians(ang_deg)
     ux, uy = math.cos(ang), math.sin(ang)
-    x1, y1 = x0 - span * ux, y0 - span * uy
-    x2, y2 = x0 + span * ux, y0 + span * uy
+    return x0 - span * ux, y0 - span * uy, x0 + span * ux, y0 + span * uy
+
+
+def _add_axis_line(fig: go.Figure, x0: float, y0: float, ang_deg: float, span: float, dash: str = "solid") -> None:
+    """Adiciona uma linha infinita 'cortada' pelo span, passando por (x0,y0)."""
+    x1, y1, x2, y2 = segmento_eixo(x0, y0, ang_deg, span)
     fig.add_shape(type="line", x0=x1, y0=y1, x1=x2, y1=y2, line=dict(width=2, dash=dash))
 
 
-def plot_secao(
-    figs: List[Dict],
-    xg: Optional[float],
-    yg: Optional[float],
-    alpha1_deg: Optional[float] = None,
-    alpha2_deg: Optional[float] = None,
-) -> go.Figure:
-    fig = go.Figure()
+def _plot_individual(
+    fig: go.Figure, figs: List[Dict], trace: type, largura_px: Optional[float],
+) -> Tuple[float, float, float, float]:
+    """Uma shape/trace por figura; devolve (minx, maxx, miny, maxy).
+
+    Semicírculos e 1/4 de círculo usam o mesmo nível de detalhe do modo
+    agrupado (segmentos_por_volta pelo raio em pixels); círculos são shapes.
+    """
     xs: List[float] = []
     ys: List[float] = []
 
+    caixas = []
+    if largura_px is not None:
+        for f in figs:
+            if f["tipo"] == "Polígono":
+                a = np.asarray(f["vertices"], dtype=float).reshape(-1, 2)
+                caixas.append((a[:, 0].min(), a[:, 0].max(), a[:, 1].min(), a[:, 1].max()))
+            else:
+                nome, afim = _afim(f)
+                caixas.append(_caixa(nome, np.array([afim])))
+    escala = _escala_tela(caixas, largura_px)
+
+    def por_volta(raio: float) -> int:
+        return SEGMENTOS_MAX if escala is None else int(segmentos_por_volta(raio * escala))
+
     for f in figs:
         tipo = f["tipo"]
         is_furo = bool(f.get("furo", False))
@@ -134,7 +379,7 @@ def plot_secao(
         elif tipo == "Triângulo Retângulo":
             pts = _tri_points(f)
             _bounds_update(xs, ys, pts)
-            fig.add_trace(go.Scatter(
+            fig.add_trace(trace(
                 x=[p[0] for p in pts],
                 y=[p[1] for p in pts],
                 mode="lines",
@@ -146,9 +391,9 @@ def plot_secao(
             ))
 
         elif tipo == "Semicírculo":
-            pts = _semi_poly(f)
+            pts = _semi_poly(f, por_volta(float(f["raio"])) // 2)
             _bounds_update(xs, ys, pts)
-            fig.add_trace(go.Scatter(
+            fig.add_trace(trace(
                 x=[p[0] for p in pts],
                 y=[p[1] for p in pts],
                 mode="lines",
@@ -160,9 +405,9 @@ def plot_secao(
             ))
 
         elif tipo == "Quarto de Círculo":
-            pts = _quarter_poly(f)
+            pts = _quarter_poly(f, por_volta(float(f["raio"])) // 4)
             _bounds_update(xs, ys, pts)
-            fig.add_trace(go.Scatter(
+            fig.add_trace(trace(
                 x=[p[0] for p in pts],
                 y=[p[1] for p in pts],
                 mode="lines",
@@ -173,8 +418,24 @@ def plot_secao(
                 hoverinfo="skip",
             ))
 
+        elif tipo == "Polígono":
+            for k, anel in enumerate([f["vertices"]] + list(f.get("furos") or [])):
+                pts = [(float(px), float(py)) for px, py in anel]
+                pts.append(pts[0])
+                _bounds_update(xs, ys, pts)
+                fig.add_trace(trace(
+                    x=[p[0] for p in pts],
+                    y=[p[1] for p in pts],
+                    mode="lines",
+                    fill="toself",
+                    fillcolor=fill if k == 0 else fill_furo,
+                    line=dict(width=2),
+                    showlegend=False,
+                    hoverinfo="skip",
+                ))
+
         # centroide da figura
-        fig.add_trace(go.Scatter(
+        fig.add_trace(trace(
             x=[x], y=[y],
             mode="markers",
             marker=dict(size=9, symbol="x"),
@@ -182,12 +443,42 @@ def plot_secao(
             hoverinfo="skip",
         ))
 
-    # limites
-    if xs and ys:
-        minx, maxx = min(xs), max(xs)
-        miny, maxy = min(ys), max(ys)
+    if not xs:
+        return -10, 10, -10, 10
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+def plot_secao(
+    figs: List[Dict],
+    xg: Optional[float],
+    yg: Optional[float],
+    alpha1_deg: Optional[float] = None,
+    alpha2_deg: Optional[float] = None,
+    agrupar: Optional[bool] = None,
+    *,
+    largura_px: Optional[float] = 900,
+    limite_webgl: Optional[int] = LIMITE_WEBGL,
+) -> go.Figure:
+    """Gráfico da seção (figuras, centroides, CG global e eixos principais).
+
+    agrupar: True junta todos os contornos em um trace de sólidos e outro de
+    furos (+ um de centroides), com custo praticamente constante em nº de
+    traces; False desenha uma shape/trace por figura. None escolhe pelo
+    tamanho (agrupado acima de LIMITE_AGRUPADO figuras).
+    largura_px: largura aproximada do gráfico na tela; os arcos (nos dois
+    modos) são discretizados conforme o raio em pixels (None = detalhe máximo).
+    limite_webgl: acima deste nº de figuras os traces usam Scattergl
+    (None desativa).
+    """
+    fig = go.Figure()
+    if agrupar is None:
+        agrupar = len(figs) > LIMITE_AGRUPADO
+    webgl = limite_webgl is not None and len(figs) > limite_webgl
+    trace = go.Scattergl if webgl else go.Scatter
+    if agrupar and figs:
+        minx, maxx, miny, maxy = _plot_agrupado(fig, figs, trace, largura_px)
     else:
-        minx, maxx, miny, maxy = -10, 10, -10, 10
+        minx, maxx, miny, maxy = _plot_individual(fig, figs, trace, largura_px)
 
     dx = max(1.0, (maxx - minx) * 0.15)
     dy = max(1.0, (maxy - miny) * 0.15)
@@ -200,7 +491,7 @@ def plot_secao(
 
     # centroide global
     if xg is not None and yg is not None:
-        fig.add_trace(go.Scatter(
+        fig.add_trace(trace(
             x=[xg], y=[yg],
             mode="markers+text",
             marker=dict(size=12),
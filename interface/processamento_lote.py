@@ -0,0 +1,333 @@
+"""Processamento em lote de seções (pool de processos).
+
+Lê um arquivo de seções (JSONL ou CSV, ver interface/arquivos.py), distribui blocos de seções
+entre processos (ProcessPoolExecutor) e grava os resultados na mesma
+ordem da entrada, à medida que ficam prontos.
+
+Formato de entrada JSONL (uma linha por seção; figuras no formato dos dicts
+da UI, os mesmos aceitos por interface/adapters.dict_to_core):
+    {"id": "VS-250", "unidade": "cm", "figuras": [{"tipo": "Retângulo", "base": 12, "altura": 1.2, "x": 0, "y": 6.9}, ...]}
+
+Saída (JSONL ou CSV): {"id": ..., **ResultadosSecao.como_dict()} ou {"id": ..., "erro": "..."}.
+Saída .pdf: relatório com sumário e páginas por seção, gravado em fluxo
+(interface/relatorio.escrever_relatorio_lote); --graficos desenha as seções.
+--imagens DIR exporta também o gráfico de cada seção (PNG/SVG) pelo
+serviço de exportação (interface/exportacao.py), em paralelo à escrita.
+
+Uso (a partir da raiz do projeto):
+    python -m interface.processamento_lote secoes.jsonl resultados.jsonl --workers 8 --bloco 512
+    python -m interface.processamento_lote secoes.jsonl catalogo.pdf --graficos
+    python -m interface.processamento_lote secoes.jsonl resultados.jsonl --imagens graficos/ --formato-imagem svg
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.cache_resultados import CacheResultados
+from core.secao_composta import SecaoComposta
+
+from .adapters import dict_to_core
+from .arquivos import EscritorResultados, ler_secoes
+from .exportacao import FORMATOS, ServicoExportacao, validar_formato
+from .plotter import plot_secao
+from .relatorio import escrever_relatorio_lote
+
+
+@dataclass
+class EstatisticasLote:
+    secoes: int = 0
+    erros: int = 0
+    decorrido_s: float = 0.0
+    imagens: int = 0
+    falhas_imagem: int = 0
+    ultimo_erro_imagem: Optional[str] = None
+
+    @property
+    def secoes_por_s(self) -> float:
+        return self.secoes / self.decorrido_s if self.decorrido_s > 0 else 0.0
+
+
+# Um cache por processo (os workers abrem o mesmo arquivo sqlite).
+_CACHES: Dict[str, CacheResultados] = {}
+
+
+def _cache(caminho: Optional[str]) -> Optional[CacheResultados]:
+    if caminho is None:
+        return None
+    if caminho not in _CACHES:
+        _CACHES[caminho] = CacheResultados(caminho=caminho)
+    return _CACHES[caminho]
+
+
+def calcular_registro(
+    registro: Dict[str, Any],
+    *,
+    incluir_ab: bool = True,
+    derivadas: bool = False,
+    cache: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Calcula uma seção descrita como dict (unidade + lista de figuras da UI).
+
+    derivadas: inclui W, raios de giração e fibras extremas em extras["derivadas"].
+    cache: caminho de um CacheResultados em disco (core/cache_resultados.py);
+      seções já calculadas, nesta ou em execuções anteriores, são reaproveitadas.
+    """
+    ident = registro.get("id")
+    try:
+        secao = SecaoComposta(unidade_comprimento=registro.get("unidade", "cm"))
+        for f in registro.get("figuras", []):
+            secao.adicionar(dict_to_core(f))
+        c = _cache(cache)
+        if c is not None:
+            res = c.calcular(secao, derivadas=derivadas).como_dict()
+        else:
+            res = secao.calcular(modo="quiet", derivadas=derivadas).como_dict()
+    except (ValueError, KeyError, TypeError) as exc:
+        return {"id": ident, "erro": str(exc)}
+
+    if not incluir_ab:
+        res["extras"].pop("parametros_ab", None)
+    return {"id": ident, **res}
+
+
+def _processar_bloco(
+    bloco: List[Dict[str, Any]], incluir_ab: bool, derivadas: bool, cache: Optional[str],
+) -> List[Dict[str, Any]]:
+    return [calcular_registro(r, incluir_ab=incluir_ab, derivadas=derivadas, cache=cache) for r in bloco]
+
+
+def _em_blocos(registros: Iterable[Dict[str, Any]], tamanho: int) -> Iterator[List[Dict[str, Any]]]:
+    bloco: List[Dict[str, Any]] = []
+    for r in registros:
+        bloco.append(r)
+        if len(bloco) >= tamanho:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+def processar_lote(
+    registros: Iterable[Dict[str, Any]],
+    *,
+    workers: Optional[int] = None,
+    tamanho_bloco: int = 256,
+    max_pendentes: Optional[int] = None,
+    incluir_ab: bool = True,
+    derivadas: bool = False,
+    cache: Optional[str] = None,
+    progresso: Optional[Callable[[EstatisticasLote], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Gera os resultados na ordem da entrada.
+
+    workers: processos (None = nº de CPUs; 1 = tudo no processo atual).
+    tamanho_bloco: seções por tarefa enviada ao pool.
+    max_pendentes: blocos em voo ao mesmo tempo (limita a memória;
+      padrão 2 × workers). A entrada é consumida sob demanda.
+    cache: caminho .sqlite do cache de resultados (None = sem cache).
+    progresso: chamado após cada bloco com as estatísticas acumuladas.
+    """
+    stats = EstatisticasLote()
+    t0 = time.perf_counter()
+
+    def entregar(resultados: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        stats.secoes += len(resultados)
+        stats.erros += sum(1 for r in resultados if "erro" in r)
+        stats.decorrido_s = time.perf_counter() - t0
+        if progresso:
+            progresso(stats)
+        yield from resultados
+
+    blocos = _em_blocos(registros, tamanho_bloco)
+
+    if workers == 1:
+        for bloco in blocos:
+            yield from entregar(_processar_bloco(bloco, incluir_ab, derivadas, cache))
+        return
+
+    workers = workers or os.cpu_count() or 1
+    limite = max_pendentes or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pendentes: Deque[Future] = deque()
+        for bloco in blocos:
+            pendentes.append(ex.submit(_processar_bloco, bloco, incluir_ab, derivadas, cache))
+            if len(pendentes) >= limite:
+                yield from entregar(pendentes.popleft().result())
+        while pendentes:
+            yield from entregar(pendentes.popleft().result())
+
+
+def _nome_imagem(n: int, ident: Any, formato: str) -> str:
+    """'000001_VS-250.png': posição na entrada + id (só caracteres seguros)."""
+    sufixo = re.sub(r"[^\w.-]+", "_", str(ident)) if ident is not None else "secao"
+    return f"{n:06d}_{sufixo}.{formato}"
+
+
+def exportar_imagens(
+    resultados: Iterable[Dict[str, Any]],
+    entradas: Iterable[Dict[str, Any]],
+    diretorio: str,
+    formato: str = "png",
+    *,
+    servico: Optional[ServicoExportacao] = None,
+    max_pendentes: int = 8,
+    stats: Optional[EstatisticasLote] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Repassa os resultados e grava o gráfico de cada seção calculada em `diretorio`.
+
+    entradas: registros de entrada na mesma ordem (fonte das figuras).
+    servico: ServicoExportacao a usar (None = cria um e fecha no fim).
+    max_pendentes: imagens em voo; as prontas são gravadas em ordem.
+    Falhas de exportação não interrompem o lote: ficam em stats
+    (falhas_imagem, ultimo_erro_imagem).
+    """
+    validar_formato(formato)
+    os.makedirs(diretorio, exist_ok=True)
+    stats = stats if stats is not None else EstatisticasLote()
+    proprio = servico is None
+    servico = servico or ServicoExportacao()
+    pendentes: Deque[Tuple[str, Future]] = deque()
+
+    def gravar(caminho: str, futuro: Future) -> None:
+        try:
+            dados = futuro.result()
+        except Exception as exc:
+            stats.falhas_imagem += 1
+            stats.ultimo_erro_imagem = f"{type(exc).__name__}: {exc}"
+            return
+        with open(caminho, "wb") as f:
+            f.write(dados)
+        stats.imagens += 1
+
+    try:
+        for n, (res, entrada) in enumerate(zip(resultados, entradas), start=1):
+            if "erro" not in res:
+                extras = res.get("extras") or {}
+                grafico = plot_secao(
+                    entrada.get("figuras", []), res["xg"], res["yg"],
+                    extras.get("alpha1_graus"), extras.get("alpha2_graus"),
+                )
+                caminho = os.path.join(diretorio, _nome_imagem(n, res.get("id"), formato))
+                pendentes.append((caminho, servico.enviar(grafico, formato)))
+                if len(pendentes) >= max_pendentes:
+                    gravar(*pendentes.popleft())
+            yield res
+        while pendentes:
+            gravar(*pendentes.popleft())
+    finally:
+        if proprio:
+            servico.fechar()
+
+
+def rodar_lote(
+    entrada: str,
+    saida: str,
+    *,
+    workers: Optional[int] = None,
+    tamanho_bloco: int = 256,
+    incluir_ab: bool = True,
+    derivadas: bool = False,
+    cache: Optional[str] = None,
+    graficos: bool = False,
+    imagens: Optional[str] = None,
+    formato_imagem: str = "png",
+    servico_imagens: Optional[ServicoExportacao] = None,
+    progresso: Optional[Callable[[EstatisticasLote], None]] = None,
+) -> EstatisticasLote:
+    """Lê `entrada`, processa em lote e grava `saida` (formatos pela extensão).
+
+    Saída .pdf gera o relatório de lote; graficos=True desenha cada seção
+    (as figuras da entrada acompanham o resultado via itertools.tee, com
+    defasagem limitada aos blocos em voo).
+    imagens: diretório para o gráfico de cada seção em `formato_imagem`
+    (exportar_imagens; servico_imagens = serviço já aquecido, opcional).
+    """
+    final = EstatisticasLote()
+
+    def acompanhar(stats: EstatisticasLote) -> None:
+        final.secoes, final.erros, final.decorrido_s = stats.secoes, stats.erros, stats.decorrido_s
+        if progresso:
+            progresso(stats)
+
+    relatorio = saida.lower().endswith(".pdf")
+    registros = ler_secoes(entrada)
+    if imagens is not None:
+        registros, para_imagens = itertools.tee(registros)
+    if relatorio and graficos:
+        registros, figuras = itertools.tee(registros)
+
+    resultados = processar_lote(
+        registros,
+        workers=workers,
+        tamanho_bloco=tamanho_bloco,
+        incluir_ab=incluir_ab,
+        derivadas=derivadas,
+        cache=cache,
+        progresso=acompanhar,
+    )
+    if imagens is not None:
+        resultados = exportar_imagens(
+            resultados, para_imagens, imagens, formato_imagem, servico=servico_imagens, stats=final,
+        )
+    if relatorio:
+        if graficos:
+            resultados = ({**r, "figuras": e.get("figuras", [])} for r, e in zip(resultados, figuras))
+        escrever_relatorio_lote(saida, resultados, graficos=graficos, incluir_ab=incluir_ab)
+        return final
+
+    with EscritorResultados(saida) as esc:
+        esc.escrever_varios(resultados)
+    return final
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Processa um arquivo de seções (JSONL/CSV) em lote.")
+    ap.add_argument("entrada")
+    ap.add_argument("saida", help="resultados .jsonl/.csv ou relatório .pdf")
+    ap.add_argument("--workers", type=int, default=None, help="processos (padrão: nº de CPUs)")
+    ap.add_argument("--bloco", type=int, default=256, help="seções por tarefa")
+    ap.add_argument("--sem-ab", action="store_true", help="omite a tabela parametros_ab na saída")
+    ap.add_argument("--derivadas", action="store_true", help="inclui W, raios de giração e fibras extremas")
+    ap.add_argument("--cache", default=None, help="arquivo .sqlite do cache de resultados (reaproveitado entre execuções)")
+    ap.add_argument("--graficos", action="store_true", help="saída .pdf: desenha os contornos de cada seção")
+    ap.add_argument("--imagens", default=None, help="diretório para o gráfico de cada seção (kaleido)")
+    ap.add_argument("--formato-imagem", choices=FORMATOS, default="png", help="formato das imagens de --imagens")
+    args = ap.parse_args(argv)
+
+    def mostrar(stats: EstatisticasLote) -> None:
+        print(f"\r{stats.secoes} seções | {stats.erros} erros | {stats.secoes_por_s:,.0f} seções/s",
+              end="", file=sys.stderr, flush=True)
+
+    stats = rodar_lote(
+        args.entrada,
+        args.saida,
+        workers=args.workers,
+        tamanho_bloco=args.bloco,
+        incluir_ab=not args.sem_ab,
+        derivadas=args.derivadas,
+        cache=args.cache,
+        graficos=args.graficos,
+        imagens=args.imagens,
+        formato_imagem=args.formato_imagem,
+        progresso=mostrar,
+    )
+    print(f"\n✅ {stats.secoes} seções em {stats.decorrido_s:.2f} s ({stats.secoes_por_s:,.0f} seções/s)",
+          file=sys.stderr)
+    if args.imagens is not None:
+        print(f"{stats.imagens} imagens em {args.imagens}", file=sys.stderr)
+        if stats.falhas_imagem:
+            print(f"⚠ {stats.falhas_imagem} falhas na exportação; última: {stats.ultimo_erro_imagem}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""Relatório PDF dos resultados (ReportLab).
+
+Fica fora do app Streamlit para poder ser usado (e medido) sem a UI.
+
+- build_pdf_bytes: uma seção, em memória (download do app);
+- escrever_relatorio_lote: milhares de seções num único PDF gravado em
+  fluxo (interface/pdf_fluxo.py), com sumário, uma ou mais páginas por
+  seção (tabela a/b) e gráfico opcional.
+
+Os gráficos são vetoriais (interface/pdf_vetorial.py), sem kaleido.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from io import BytesIO
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas as pdf_canvas
+
+from core.eixos_principais import eixos_principais
+
+from .pdf_fluxo import CanvasFluxo
+from .pdf_vetorial import desenhar_secao
+
+
+def _linhas_resultados(res_dict: dict, unidade: str) -> List[str]:
+    return [
+        f"Unidade: {unidade}",
+        f"Área total: {res_dict['area_total']:.4f} {unidade}^2",
+        f"Xg: {res_dict['xg']:.4f} {unidade}",
+        f"Yg: {res_dict['yg']:.4f} {unidade}",
+        "",
+        f"Ix: {res_dict['ix']:.4f} {unidade}^4",
+        f"Iy: {res_dict['iy']:.4f} {unidade}^4",
+        f"Ixy: {res_dict['ixy']:.4f} {unidade}^4",
+        "",
+        f"I1 (maior): {res_dict['i1']:.4f} {unidade}^4",
+        f"I2 (menor): {res_dict['i2']:.4f} {unidade}^4",
+        f"α1 (eixo de I1): {res_dict['a1']:.4f}°",
+        f"α2 (eixo de I2): {res_dict['a2']:.4f}°",
+        "",
+        "Parâmetros a e b (a = yi - Yg ; b = xi - Xg):",
+    ]
+
+
+def _linha_ab(r: dict, unidade: str) -> str:
+    return (
+        f"Fig #{r.get('idx')} ({r.get('nome','')}): "
+        f"xi={float(r.get('xi',0.0)):.4f} {unidade} | "
+        f"yi={float(r.get('yi',0.0)):.4f} {unidade} | "
+        f"a={float(r.get('a',0.0)):.4f} {unidade} | "
+        f"b={float(r.get('b',0.0)):.4f} {unidade}"
+    )
+
+
+def build_pdf_bytes(
+    res_dict: dict, unidade: str, plot_png: bytes | None = None, figs: Optional[List[Dict]] = None,
+) -> bytes:
+    """
+    Export: 1 página A4 com resultados + tabela a/b + (opcional) desenho da seção.
+
+    figs (dicts da UI): desenho vetorial (interface/pdf_vetorial.py), com os
+    eixos principais em res_dict["a1"]/["a2"]; plot_png: imagem pronta
+    (usada só quando figs não é dado).
+    """
+    buf = BytesIO()
+    c = pdf_canvas.Canvas(buf, pagesize=A4)
+    w, h = A4
+
+    x = 20 * mm
+    y = h - 20 * mm
+
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(x, y, "Momentos de Inércia — Relatório")
+    y -= 8 * mm
+
+    c.setFont("Helvetica", 10)
+    c.drawString(x, y, f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
+    y -= 10 * mm
+
+    # Gráfico primeiro (quando existir)
+    if figs:
+        img_h = 95 * mm
+        desenhar_secao(
+            c, figs, res_dict["xg"], res_dict["yg"], res_dict.get("a1"), res_dict.get("a2"),
+            caixa=(x, y - img_h, 170 * mm, img_h),
+        )
+        y -= (img_h + 8 * mm)
+    elif plot_png:
+        try:
+            from reportlab.lib.utils import ImageReader
+            img = ImageReader(BytesIO(plot_png))
+            img_w = 170 * mm
+            img_h = 95 * mm
+            if y - img_h < 20 * mm:
+                c.showPage()
+                y = h - 20 * mm
+            c.drawImage(img, x, y - img_h, width=img_w, height=img_h, preserveAspectRatio=True, anchor="sw")
+            y -= (img_h + 8 * mm)
+        except Exception:
+            pass
+
+    c.setFont("Helvetica-Bold", 12)
+    c.drawString(x, y, "Resultados")
+    y -= 8 * mm
+
+    c.setFont("Helvetica", 10)
+
+    for line in _linhas_resultados(res_dict, unidade):
+        c.drawString(x, y, line)
+        y -= 6.2 * mm
+        if y < 20 * mm:
+            c.showPage()
+            y = h - 20 * mm
+            c.setFont("Helvetica", 10)
+
+    # tabela a/b
+    for r in res_dict.get("ab_rows", []):
+        c.drawString(x, y, _linha_ab(r, unidade))
+        y -= 6.2 * mm
+        if y < 20 * mm:
+            c.showPage()
+            y = h - 20 * mm
+            c.setFont("Helvetica", 10)
+
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+# =========================
+# Relatório de lote (em fluxo)
+# =========================
+_MARGEM = 20 * mm
+_PASSO = 6.2 * mm
+_PASSO_SUMARIO = 4.6 * mm
+
+# colunas do sumário: (título, x da borda direita em mm; None = texto à esquerda)
+_COLUNAS_SUMARIO = (
+    ("#", 28), ("Seção", None), ("A", 88), ("Xg", 104), ("Yg", 120),
+    ("Ix", 138), ("Iy", 156), ("I1", 174), ("α1 (°)", 190), ("Pág.", 202),
+)
+
+
+@dataclass
+class EstatisticasRelatorio:
+    secoes: int = 0
+    erros: int = 0
+    paginas: int = 0
+    bytes: int = 0
+    decorrido_s: float = 0.0
+
+    @property
+    def secoes_por_s(self) -> float:
+        return self.secoes / self.decorrido_s if self.decorrido_s > 0 else 0.0
+
+
+def res_dict_de_registro(registro: Dict[str, Any]) -> dict:
+    """Resultado no formato do processamento em lote ({id, **como_dict()}) -> dict do relatório.
+
+    Ângulos na convenção do formulário, em graus (a mesma do app).
+    """
+    i1, i2, a1, a2 = eixos_principais(registro["ix"], registro["iy"], registro["ixy"], "formulario", graus=True)
+    return {
+        "area_total": float(registro["area_total"]),
+        "xg": float(registro["xg"]),
+        "yg": float(registro["yg"]),
+        "ix": float(registro["ix"]), "iy": float(registro["iy"]), "ixy": float(registro["ixy"]),
+        "i1": i1, "i2": i2, "a1": a1, "a2": a2,
+        "ab_rows": (registro.get("extras") or {}).get("parametros_ab", []),
+    }
+
+
+def _fmt(v: float) -> str:
+    return f"{v:.5g}"
+
+
+class _Paginador:
+    """Cursor vertical com quebra de página e cabeçalho de continuação."""
+
+    def __init__(self, c: CanvasFluxo, titulo: str) -> None:
+        self.c = c
+        self.titulo = titulo
+        self.h = A4[1]
+        self.y = self.h - _MARGEM
+
+    def linha(self, texto: str, passo: float = _PASSO) -> None:
+        if self.y < _MARGEM:
+            self.c.showPage()
+            self.y = self.h - _MARGEM
+            self.c.setFont("Helvetica-Bold", 11)
+            self.c.drawString(_MARGEM, self.y, f"{self.titulo} (cont.)")
+            self.y -= 8 * mm
+            self.c.setFont("Helvetica", 10)
+        self.c.drawString(_MARGEM, self.y, texto)
+        self.y -= passo
+
+
+def _paginas_secao(
+    c: CanvasFluxo, k: int, registro: Dict[str, Any], unidade: str, graficos: bool, incluir_ab: bool,
+) -> Optional[dict]:
+    """Escreve as páginas de uma seção; devolve o dict de resultados (None se o registro tem erro)."""
+    ident = registro.get("id")
+    titulo = f"Seção {k}: {ident}" if ident is not None else f"Seção {k}"
+    pg = _Paginador(c, titulo)
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(_MARGEM, pg.y, titulo)
+    pg.y -= 10 * mm
+    c.setFont("Helvetica", 10)
+
+    if "erro" in registro:
+        pg.linha(f"Erro no cálculo: {registro['erro']}")
+        c.showPage()
+        return None
+
+    res = res_dict_de_registro(registro)
+    figs = registro.get("figuras")
+    if graficos and figs:
+        alto = 95 * mm
+        desenhar_secao(c, figs, res["xg"], res["yg"], res["a1"], res["a2"], caixa=(_MARGEM, pg.y - alto, 170 * mm, alto))
+        pg.y -= alto + 8 * mm
+
+    for texto in _linhas_resultados(res, unidade):
+        pg.linha(texto)
+    if incluir_ab:
+        for r in res["ab_rows"]:
+            pg.linha(_linha_ab(r, unidade))
+    c.showPage()
+    return res
+
+
+def _paginas_sumario(c: CanvasFluxo, linhas: Any, n: int, erros: int, titulo: str, por_pagina: int) -> None:
+    """Sumário (páginas na frente do documento): uma linha por seção com a página dela."""
+    h = A4[1]
+    total = math.ceil(n / por_pagina) if n else 1
+
+    def cabecalho(pagina: int) -> float:
+        y = h - _MARGEM
+        if pagina == 1:
+            c.setFont("Helvetica-Bold", 16)
+            c.drawString(_MARGEM, y, titulo)
+            y -= 8 * mm
+            c.setFont("Helvetica", 10)
+            c.drawString(_MARGEM, y, f"Gerado em: {datetime.now().strftime('%d/%m/%Y %H:%M')} | "
+                                     f"{n} seções | {erros} com erro")
+            y -= 10 * mm
+        c.setFont("Helvetica-Bold", 8)
+        for nome, direita in _COLUNAS_SUMARIO:
+            if direita is None:
+                c.drawString(31 * mm, y, nome)
+            else:
+                c.drawRightString(direita * mm, y, nome)
+        c.setFont("Helvetica", 7.5)
+        return y - _PASSO_SUMARIO
+
+    pagina = 1
+    y = cabecalho(pagina)
+    for i, linha in enumerate(linhas):
+        if i and i % por_pagina == 0:
+            c.showPage(frente=True)
+            pagina += 1
+            y = cabecalho(pagina)
+        k, ident, pag, valores = linha
+        c.drawRightString(28 * mm, y, str(k))
+        nome = str(ident if ident is not None else "")
+        c.drawString(31 * mm, y, nome if len(nome) <= 22 else nome[:21] + "…")
+        if valores is None:
+            c.drawString(70 * mm, y, "erro (ver página da seção)")
+        else:
+            for (_, direita), v in zip(_COLUNAS_SUMARIO[2:-1], valores):
+                c.drawRightString(direita * mm, y, _fmt(v))
+        c.drawRightString(202 * mm, y, str(pag + total))
+        y -= _PASSO_SUMARIO
+    c.showPage(frente=True)
+
+
+def escrever_relatorio_lote(
+    caminho: str,
+    registros: Iterable[Dict[str, Any]],
+    *,
+    titulo: str = "Momentos de Inércia — Relatório de seções",
+    graficos: bool = False,
+    incluir_ab: bool = True,
+    linhas_por_pagina_sumario: int = 50,
+    progresso: Optional[Callable[[EstatisticasRelatorio], None]] = None,
+) -> EstatisticasRelatorio:
+    """Grava um PDF com sumário + páginas de cada seção, página a página.
+
+    registros: resultados no formato do processamento em lote
+      ({"id", **ResultadosSecao.como_dict()} ou {"id", "erro"}), consumidos
+      um a um; com "figuras" (dicts da UI) e graficos=True a seção ganha o
+      desenho dos contornos.
+    Memória limitada: as páginas vão para o arquivo assim que terminam e as
+    linhas do sumário esperam num arquivo temporário; o sumário é escrito no
+    fim e colocado no início do documento.
+    progresso: chamado após cada seção com as estatísticas acumuladas.
+    """
+    stats = EstatisticasRelatorio()
+    t0 = time.perf_counter()
+    c = CanvasFluxo(caminho, A4, titulo=titulo)
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as sumario:
+        for k, registro in enumerate(registros, start=1):
+            pagina = c.getPageNumber()
+            unidade = registro.get("unidade_comprimento", "cm")
+            res = _paginas_secao(c, k, registro, unidade, graficos, incluir_ab)
+            valores = None if res is None else [
+                res["area_total"], res["xg"], res["yg"], res["ix"], res["iy"], res["i1"], res["a1"],
+            ]
+            sumario.write(json.dumps([k, registro.get("id"), pagina, valores], ensure_ascii=False))
+            sumario.write("\n")
+
+            stats.secoes = k
+            stats.erros += res is None
+            stats.paginas = c.getPageNumber() - 1
+            stats.bytes = c.bytes_escritos
+            stats.decorrido_s = time.perf_counter() - t0
+            if progresso:
+                progresso(stats)
+
+        sumario.seek(0)
+        _paginas_sumario(
+            c, (json.loads(l) for l in sumario), stats.secoes, stats.erros, titulo, linhas_por_pagina_sumario,
+        )
+
+    c.save()
+    stats.paginas = c.getPageNumber() - 1
+    stats.bytes = c.bytes_escritos
+    stats.decorrido_s = time.perf_counter() - t0
+    if progresso:
+        progresso(stats)
+    return stats
@@ -0,0 +1,19 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+from interface.app_streamlit import chave_exportacao  # noqa: E402
+
+FIGS = [
+    {"id": 1, "tipo": "Retângulo", "base": 10.0, "altura": 2.0, "x": 0.0, "y": 5.0, "furo": False},
+    {"id": 2, "tipo": "Círculo", "raio": 1.0, "x": 0.0, "y": 0.0, "furo": True},
+]
+
+
+def test_chave_depende_so_do_conteudo_e_da_unidade():
+    reordenado = [dict(reversed(list(f.items()))) for f in FIGS]
+    assert chave_exportacao(FIGS, "cm") == chave_exportacao(reordenado, "cm")
+    assert chave_exportacao(FIGS, "cm") != chave_exportacao(FIGS, "mm")
+    alterado = [dict(FIGS[0], altura=2.5), FIGS[1]]
+    assert chave_exportacao(FIGS, "cm") != chave_exportacao(alterado, "cm")
+    assert chave_exportacao(FIGS, "cm") != chave_exportacao(FIGS[::-1], "cm")
@@ -0,0 +1,123 @@
+from core.cache_resultados import CacheResultados, chaves_secao
+from core.figuras import Circulo, Retangulo
+from core.poligono import Poligono
+from core.secao_composta import SecaoComposta
+from core.tabela_figuras import TabelaFiguras
+
+
+def _figuras():
+    return (
+        Retangulo(base=2, altura=4, x=1, y=2),
+        Poligono(vertices=[(3, 0), (6, 0), (6, 3)]),
+        Circulo(raio=1, x=5, y=5),
+    )
+
+
+def _nomes(res):
+    return [r["nome"] for r in res.extras["parametros_ab"]]
+
+
+def test_ordem_distingue_primitivas_e_genericas_intercaladas():
+    r, p, _ = _figuras()
+    for tipo in (list, TabelaFiguras):
+        chave_rp, ordem_rp = chaves_secao(SecaoComposta(figuras=tipo([r, p])))
+        chave_pr, ordem_pr = chaves_secao(SecaoComposta(figuras=tipo([p, r])))
+        assert chave_rp == chave_pr
+        assert ordem_rp != ordem_pr
+
+
+def test_lista_e_tabela_tem_mesmas_chaves():
+    figs = _figuras()
+    assert chaves_secao(SecaoComposta(figuras=list(figs))) == chaves_secao(SecaoComposta(figuras=TabelaFiguras(figs)))
+
+
+def test_acerto_em_outra_ordem_remonta_parametros_ab():
+    r, p, c = _figuras()
+    cache = CacheResultados()
+    cache.calcular(SecaoComposta(figuras=[r, p, c]))
+    res = cache.calcular(SecaoComposta(figuras=[p, c, r]))
+    assert cache.estatisticas()["acertos_memoria"] == 1
+    assert _nomes(res) == ["Polígono", "Círculo", "Retângulo"]
+
+
+def test_alterar_parametros_ab_nao_suja_o_cache():
+    secao = SecaoComposta(figuras=list(_figuras()))
+    cache = CacheResultados()
+    res = cache.calcular(secao)
+    res.extras["parametros_ab"].clear()
+    res = cache.calcular(secao)
+    res.extras["parametros_ab"][0]["nome"] = "alterado"
+    assert _nomes(cache.calcular(secao)) == ["Retângulo", "Polígono", "Círculo"]
+
+
+
+class _ConexaoComPausa:
+    """Conexão sqlite que roda `pausa` logo depois de ler o tamanho antigo da entrada."""
+
+    def __init__(self, db, pausa):
+        self._db = db
+        self._pausa = pausa
+
+    def execute(self, sql, *args):
+        cursor = self._db.execute(sql, *args)
+        if sql.startswith("SELECT tamanho"):
+            self._pausa()
+        return cursor
+
+    def __getattr__(self, nome):
+        return getattr(self._db, nome)
+
+
+def test_total_de_bytes_consistente_entre_conexoes(tmp_path):
+    import sqlite3
+    import threading
+
+    caminho = str(tmp_path / "resultados.sqlite")
+    res = CacheResultados().calcular(SecaoComposta(figuras=list(_figuras())))
+    a = CacheResultados(capacidade=0, caminho=caminho)
+    b = CacheResultados(capacidade=0, caminho=caminho)
+    outro = threading.Thread(target=b.guardar, args=("chave", res, "ordem"))
+
+    def pausa():
+        # a outra conexão grava a mesma chave entre a leitura e a escrita desta
+        if not outro.is_alive() and outro.ident is None:
+            outro.start()
+            outro.join(timeout=0.3)
+
+    a._db = _ConexaoComPausa(a._db, pausa)
+    a.guardar("chave", res, "ordem")
+    outro.join()
+    a.fechar()
+    b.fechar()
+
+    with sqlite3.connect(caminho) as db:
+        (total,) = db.execute("SELECT bytes FROM totais").fetchone()
+        (soma,) = db.execute("SELECT SUM(tamanho) FROM resultados").fetchone()
+    assert total == soma
+
+
+def test_hash_de_array_em_blocos_igual_ao_hash_inteiro(monkeypatch):
+    import hashlib
+
+    import numpy as np
+
+    from core import cache_resultados
+
+    monkeypatch.setattr(cache_resultados, "_BYTES_POR_BLOCO", 100)
+    for arr in (np.random.default_rng(0).random((50, 9)), np.asfortranarray(np.arange(12).reshape(3, 4)), np.array(2.5)):
+        esperado = hashlib.sha256(np.ascontiguousarray(arr).tobytes()).hexdigest()
+        assert cache_resultados._digest_array(arr) == esperado
+
+
+def test_mascara_mapeada_tem_a_mesma_chave_que_em_memoria(tmp_path):
+    import numpy as np
+
+    from core.mascara import FiguraMascara
+
+    arr = np.zeros((40, 30), dtype=np.uint8)
+    arr[5:25, 10:20] = 1
+    caminho = tmp_path / "mascara.npy"
+    np.save(caminho, arr)
+    mapeada = FiguraMascara(np.load(caminho, mmap_mode="r"), tamanho_pixel=0.5)
+    em_memoria = FiguraMascara(arr, tamanho_pixel=0.5)
+    assert chaves_secao(SecaoComposta(figuras=[mapeada])) == chaves_secao(SecaoComposta(figuras=[em_memoria]))
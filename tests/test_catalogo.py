@@ -0,0 +1,84 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.catalogo import Catalogo, montar_secao, secao_i, secao_l, secao_tubo, secao_tubo_retangular
+
+PERFIS = [
+    {"nome": "W 200 x 15", "tipo": "I", "h": 20.0, "b": 10.0, "tw": 0.43, "tf": 0.52, "r": 0.76},
+    {"nome": "W 310 x 38.7", "tipo": "I", "h": 31.0, "b": 16.5, "tw": 0.58, "tf": 0.97, "r": 1.0},
+    {"nome": "HP 250 x 62", "tipo": "H", "h": 24.6, "b": 25.6, "tw": 1.05, "tf": 1.07, "r": 1.3},
+    {"nome": "U 152 x 12.2", "tipo": "U", "h": 15.2, "b": 4.8, "tw": 0.51, "tf": 0.87},
+    {"nome": "L 50 x 5", "tipo": "L", "h": 5.0, "b": 5.0, "t": 0.5, "r": 0.7},
+    {"nome": "T 100", "tipo": "T", "h": 10.0, "b": 10.0, "tw": 0.8, "tf": 1.0},
+    {"nome": "Tubo 114 x 6", "tipo": "tubo", "d": 11.4, "t": 0.6},
+    {"nome": "RHS 100 x 50 x 4", "tipo": "tubo_retangular", "h": 10.0, "b": 5.0, "t": 0.4},
+]
+
+
+@pytest.fixture(scope="module")
+def catalogo():
+    return Catalogo.construir(PERFIS)
+
+
+def test_perfis_em_forma_fechada():
+    h, b, tw, tf = 20.0, 10.0, 0.5, 1.0
+    r = secao_i(h, b, tw, tf).calcular()
+    assert r.ix == pytest.approx((b * h**3 - (b - tw) * (h - 2 * tf) ** 3) / 12)
+    assert r.iy == pytest.approx((2 * tf * b**3 + (h - 2 * tf) * tw**3) / 12)
+
+    r = secao_tubo(10.0, 1.0).calcular()
+    assert r.ix == pytest.approx(math.pi * (10.0**4 - 8.0**4) / 64)
+
+    r = secao_tubo_retangular(10.0, 6.0, 1.0).calcular()
+    assert r.ix == pytest.approx((6 * 10**3 - 4 * 8**3) / 12)
+
+    r = secao_l(6.0, 4.0, 1.0).calcular()
+    assert (r.xg, r.yg) == pytest.approx(((6 * 0.5 + 3 * 2.5) / 9, (6 * 3 + 3 * 0.5) / 9))
+
+
+def test_concordancias_somam_r2_vezes_1_menos_pi_sobre_4():
+    h, b, tw, tf, raio = 20.0, 10.0, 0.5, 1.0, 0.8
+    sem, com = secao_i(h, b, tw, tf).calcular(), secao_i(h, b, tw, tf, raio).calcular()
+    assert com.area_total - sem.area_total == pytest.approx(4 * raio**2 * (1 - math.pi / 4))
+    assert (com.xg, com.yg, com.ixy) == pytest.approx((0.0, 0.0, 0.0), abs=1e-12)
+    assert com.ix > sem.ix and com.iy > sem.iy
+
+
+def test_propriedades_conferem_com_cada_secao(catalogo):
+    assert len(catalogo) == len(PERFIS)
+    for k, p in enumerate(PERFIS):
+        ref = montar_secao(p).calcular(derivadas=True)
+        d = ref.extras["derivadas"]
+        assert catalogo.propriedades["area"][k] == pytest.approx(ref.area_total, rel=1e-12)
+        assert catalogo.propriedades["ix"][k] == pytest.approx(ref.ix, rel=1e-12)
+        assert catalogo.propriedades["wx"][k] == pytest.approx(min(d["wx_sup"], d["wx_inf"]), rel=1e-12)
+        assert catalogo.propriedades["massa_por_metro"][k] == pytest.approx(ref.area_total * 1e-4 * 7850.0)
+        assert catalogo.resultado(p["nome"]).i1 == pytest.approx(ref.i1, rel=1e-12)
+        assert catalogo.perfil(k) == {c: v for c, v in p.items()}
+
+
+def test_consultas_iguais_a_busca_exaustiva(catalogo):
+    ix, iy, massa = (catalogo.propriedades[c] for c in ("ix", "iy", "massa_por_metro"))
+    esperado = np.flatnonzero((ix >= 500) & (iy >= 50))
+    assert sorted(catalogo.filtrar(ix_min=500, iy_min=50)) == list(esperado)
+    assert catalogo.mais_leve(ix_min=500, iy_min=50) == esperado[np.argmin(massa[esperado])]
+    assert list(catalogo.faixa("ix", 100, 1000)) == sorted(np.flatnonzero((ix >= 100) & (ix <= 1000)), key=ix.__getitem__)
+    assert list(catalogo.filtrar(tipo="I")) == [0, 1]
+    assert catalogo.mais_leve(ix_min=1e9) is None
+    with pytest.raises(ValueError, match="sem índice"):
+        catalogo.filtrar(xg_min=0)
+
+
+def test_salvar_e_carregar(catalogo, tmp_path):
+    caminho = tmp_path / "perfis.npz"
+    catalogo.salvar(str(caminho))
+    lido = Catalogo.carregar(str(caminho))
+    assert lido.unidade_comprimento == "cm"
+    assert list(lido.nomes) == list(catalogo.nomes)
+    for campo, valores in catalogo.propriedades.items():
+        np.testing.assert_array_equal(lido.propriedades[campo], valores)
+    assert lido.posicao("L 50 x 5") == 4
+    with pytest.raises(KeyError):
+        lido.posicao("W 999")
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from core.contorno import ArcoEliptico, Bezier, FiguraContorno, SegmentoReta, contorno_de_pontos, elipse
+from core.figuras import Circulo, Semicirculo
+from core.poligono import Poligono
+
+
+def _proprias(fig):
+    return fig.area(), fig.x, fig.y, fig.ix_proprio(), fig.iy_proprio(), fig.ixy_proprio()
+
+
+@pytest.mark.parametrize("cx, cy", [(0.0, 0.0), (5.0, -3.0), (1e4, 2e4)])
+def test_elipse_com_semieixos_iguais_confere_com_circulo(cx, cy):
+    e = elipse(cx, cy, 2.0, 2.0)
+    c = Circulo(raio=2.0, x=cx, y=cy)
+    for ve, vc in zip(_proprias(e), _proprias(c)):
+        assert ve == pytest.approx(vc, rel=1e-10, abs=1e-8)
+
+
+def test_elipse_girada_em_forma_fechada():
+    a, b, th = 3.0, 1.0, math.radians(30)
+    e = elipse(0.0, 0.0, a, b, rotacao=th)
+    iu, iv = math.pi * a * b**3 / 4, math.pi * a**3 * b / 4  # eixos próprios da elipse
+    c, s = math.cos(th), math.sin(th)
+    assert e.area() == pytest.approx(math.pi * a * b, rel=1e-12)
+    assert e.ix_proprio() == pytest.approx(iu * c * c + iv * s * s, rel=1e-10)
+    assert e.iy_proprio() == pytest.approx(iu * s * s + iv * c * c, rel=1e-10)
+    assert e.ixy_proprio() == pytest.approx((iv - iu) * s * c, rel=1e-10)  # eixo maior no 1º/3º quadrantes
+
+
+def test_semicirculo_por_arco_e_reta():
+    r = 2.0
+    f = FiguraContorno(contorno=(ArcoEliptico(0, 0, r, r, 0.0, math.pi), SegmentoReta((-r, 0.0), (r, 0.0))))
+    ref = Semicirculo(raio=r, y=4 * r / (3 * math.pi))
+    assert f.area() == pytest.approx(ref.area(), rel=1e-12)
+    assert f.y == pytest.approx(ref.y, rel=1e-12)
+    assert f.iy_proprio() == pytest.approx(ref.iy_proprio(), rel=1e-12)
+    assert f.ix_proprio() == pytest.approx((math.pi / 8 - 8 / (9 * math.pi)) * r**4, rel=1e-12)
+    assert f.ix_proprio() == pytest.approx(ref.ix_proprio(), rel=1e-3)  # 0,1098·R⁴ do formulário
+
+
+def test_segmento_parabolico_tem_dois_tercos_do_retangulo():
+    # Bézier quadrática = parábola de (0,0) a (4,0) com flecha 3
+    f = FiguraContorno(contorno=(Bezier(((4, 0), (2, 6), (0, 0))), SegmentoReta((0, 0), (4, 0))))
+    assert f.area() == pytest.approx(2 / 3 * 4 * 3, rel=1e-13)
+    assert f.y == pytest.approx(2 / 5 * 3, rel=1e-13)
+
+
+def test_retas_conferem_com_poligono_com_furo():
+    externo = [(0, 0), (6, 0), (6, 4), (2, 5), (0, 3)]
+    interno = [(1, 1), (3, 1), (2, 2)]
+    f = FiguraContorno(contorno=contorno_de_pontos(externo), furos=(contorno_de_pontos(interno),))
+    p = Poligono(externo, furos=[interno])
+    for vf, vp in zip(_proprias(f), _proprias(p)):
+        assert vf == pytest.approx(vp, rel=1e-12, abs=1e-12)
+
+
+def test_contorno_aberto_levanta_value_error():
+    with pytest.raises(ValueError, match="não fechado"):
+        FiguraContorno(contorno=(SegmentoReta((0, 0), (1, 0)), SegmentoReta((1, 0), (1, 1))))
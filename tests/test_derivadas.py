@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.derivadas import calcular_derivadas
+from core.figuras import Circulo, Retangulo
+from core.lote import calcular_lote
+from core.poligono import Poligono
+from core.secao_composta import SecaoComposta
+from core.tabela_figuras import TabelaFiguras
+
+
+def _derivadas(figuras):
+    secao = SecaoComposta(figuras=figuras)
+    return calcular_derivadas(secao.figuras, secao.calcular())
+
+
+def test_retangulo_em_forma_fechada():
+    b, h = 6.0, 10.0
+    d = _derivadas([Retangulo(base=b, altura=h, x=3, y=-2)])
+    assert (d.rx, d.ry) == pytest.approx((h / math.sqrt(12), b / math.sqrt(12)))
+    assert (d.y_sup, d.y_inf, d.x_dir, d.x_esq) == pytest.approx((h / 2, h / 2, b / 2, b / 2))
+    assert (d.wx_sup, d.wx_inf) == pytest.approx((b * h**2 / 6, b * h**2 / 6))
+    assert (d.wy_dir, d.wy_esq) == pytest.approx((h * b**2 / 6, h * b**2 / 6))
+    # eixos principais = eixos centroidais; u ao longo do eixo de I1 (Ix, pois h > b)
+    assert (d.r1, d.r2) == pytest.approx((d.rx, d.ry))
+    assert d.w1_pos == pytest.approx(b * h**2 / 6)
+    assert d.w2_pos == pytest.approx(h * b**2 / 6)
+
+
+def test_circulo_com_furo_ignora_o_furo_nas_fibras():
+    r = 4.0
+    d = _derivadas([Circulo(raio=r), Circulo(raio=1.0, furo=True)])
+    assert d.y_sup == pytest.approx(r)
+    assert d.wx_sup == pytest.approx(math.pi * (r**4 - 1.0) / 4 / r)
+    for c in (d.y_inf, d.x_dir, d.x_esq, d.u_pos, d.v_neg):
+        assert c == pytest.approx(r)
+
+
+def test_perfil_t_assimetrico():
+    # mesa 10 x 2 no topo, alma 2 x 8; base da alma em y = 0
+    figs = [Retangulo(base=10, altura=2, x=0, y=9), Retangulo(base=2, altura=8, x=0, y=4)]
+    res = SecaoComposta(figuras=figs).calcular()
+    yg = (20 * 9 + 16 * 4) / 36
+    assert res.yg == pytest.approx(yg)
+    d = calcular_derivadas(figs, res)
+    assert (d.y_sup, d.y_inf) == pytest.approx((10 - yg, yg))
+    assert (d.wx_sup, d.wx_inf) == pytest.approx((res.ix / (10 - yg), res.ix / yg))
+    assert d.wx_min == pytest.approx(res.ix / yg)
+
+
+def test_poligono_girado_usa_os_vertices():
+    # quadrado 2 x 2 girado 45°: fibra extrema em x e y a sqrt(2) do centro
+    s = math.sqrt(2)
+    d = _derivadas([Poligono([(s, 0), (0, s), (-s, 0), (0, -s)])])
+    assert (d.y_sup, d.x_dir) == pytest.approx((s, s))
+    assert d.wx_sup == pytest.approx((2**4 / 12) / s)
+
+
+def test_lote_e_tabela_conferem_com_a_secao():
+    secoes = [
+        SecaoComposta(figuras=[Retangulo(base=4, altura=2), Circulo(raio=0.5, x=1, furo=True)]),
+        SecaoComposta(figuras=TabelaFiguras([Retangulo(base=10, altura=2, y=9), Retangulo(base=2, altura=8, y=4)])),
+        SecaoComposta(figuras=[Circulo(raio=2, x=5, y=5)]),
+    ]
+    lote = calcular_lote(secoes, derivadas=True).derivadas.como_dict()
+    for k, s in enumerate(secoes):
+        unica = s.calcular(derivadas=True).extras["derivadas"]
+        for campo, valor in unica.items():
+            assert lote[campo][k] == pytest.approx(valor, rel=1e-12), campo
+    assert np.all(np.isfinite(lote["wx_sup"]))
@@ -0,0 +1,45 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.eixos_principais import CONVENCOES, eixos_principais
+
+
+def test_valores_conhecidos_nas_duas_convencoes():
+    i1, i2, a1, a2 = eixos_principais(4.0, 2.0, 1.0)
+    assert (i1, i2) == pytest.approx((3 + math.sqrt(2), 3 - math.sqrt(2)))
+    assert (a1, a2) == pytest.approx((3 * math.pi / 8, 7 * math.pi / 8))
+
+    i1, i2, a1, a2 = eixos_principais(4.0, 2.0, 1.0, "formulario", graus=True)
+    assert (i1, i2) == pytest.approx((3 + math.sqrt(2), 3 - math.sqrt(2)))
+    assert (a1, a2) == pytest.approx((-22.5, 67.5))
+
+
+def test_secao_isotropa_usa_45_graus():
+    assert eixos_principais(5.0, 5.0, 0.0, graus=True) == pytest.approx((5.0, 5.0, 45.0, 135.0))
+    _, _, a1, _ = eixos_principais(np.array([5.0, 1.0]), np.array([5.0, 2.0]), np.array([0.0, 0.0]))
+    assert a1[0] == pytest.approx(math.pi / 4)
+
+
+@pytest.mark.parametrize("convencao", CONVENCOES)
+def test_arrays_conferem_com_escalares_e_invariantes(convencao):
+    rng = np.random.default_rng(1)
+    ix, iy = rng.uniform(1, 100, 50), rng.uniform(1, 100, 50)
+    ixy = rng.uniform(-40, 40, 50)
+    i1, i2, a1, a2 = eixos_principais(ix.reshape(5, 10), iy.reshape(5, 10), ixy.reshape(5, 10), convencao)
+    assert i1.shape == (5, 10)
+    for k in range(50):
+        esperado = eixos_principais(ix[k], iy[k], ixy[k], convencao)
+        obtido = (i1.flat[k], i2.flat[k], a1.flat[k], a2.flat[k])
+        assert obtido == pytest.approx(esperado, rel=1e-12, abs=1e-12)
+    # Mohr: traço e determinante se conservam; |alpha2 - alpha1| = 90°
+    assert (i1 + i2).ravel() == pytest.approx(ix + iy)
+    assert (i1 * i2).ravel() == pytest.approx(ix * iy - ixy ** 2)
+    assert np.all(i1 >= i2)
+    assert np.abs(a2 - a1) == pytest.approx(np.full((5, 10), math.pi / 2))
+
+
+def test_convencao_invalida_levanta_value_error():
+    with pytest.raises(ValueError, match="Convenção"):
+        eixos_principais(1.0, 2.0, 0.0, "horario")
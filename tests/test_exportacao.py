@@ -0,0 +1,95 @@
+import json
+import threading
+
+import pytest
+
+from interface.exportacao import ServicoExportacao, validar_formato
+from interface.processamento_lote import rodar_lote
+
+
+class _Renderizador:
+    """Renderizador falso: conta chamadas e pode segurar a renderização."""
+
+    def __init__(self, falhar=False):
+        self.chamadas = 0
+        self.liberar = threading.Event()
+        self.liberar.set()
+        self.falhar = falhar
+
+    def __call__(self, espec, formato, escala, largura, altura):
+        self.liberar.wait(5)
+        self.chamadas += 1
+        if self.falhar:
+            raise RuntimeError("sem renderizador")
+        return f"{formato}:{len(json.dumps(espec))}".encode()
+
+
+def _grafico(n=1):
+    return {"data": [{"type": "scatter", "x": list(range(n)), "y": list(range(n))}], "layout": {}}
+
+
+def test_cache_devolve_a_mesma_imagem_sem_renderizar_de_novo():
+    r = _Renderizador()
+    with ServicoExportacao(renderizador=r, aquecer=False) as servico:
+        a = servico.renderizar(_grafico(), "png")
+        b = servico.renderizar(_grafico(), "png")
+        c = servico.renderizar(_grafico(), "svg")
+        stats = servico.estatisticas()
+    assert a == b and c.startswith(b"svg")
+    assert r.chamadas == 2
+    assert stats["acertos_cache"] == 1 and stats["renderizacoes"] == 2
+
+
+def test_pedidos_iguais_em_andamento_compartilham_o_future():
+    r = _Renderizador()
+    r.liberar.clear()
+    with ServicoExportacao(trabalhadores=2, renderizador=r, aquecer=False) as servico:
+        f1 = servico.enviar(_grafico(3), "png")
+        f2 = servico.enviar(_grafico(3), "png")
+        assert f1 is f2
+        r.liberar.set()
+        assert f1.result(5) == f2.result(5)
+        assert servico.estatisticas()["compartilhados"] == 1
+    assert r.chamadas == 1
+
+
+def test_falha_chega_no_future_e_nas_estatisticas():
+    with ServicoExportacao(renderizador=_Renderizador(falhar=True), aquecer=False) as servico:
+        with pytest.raises(RuntimeError):
+            servico.renderizar(_grafico(), "png")
+        assert servico.png_ou_none(_grafico(2)) is None
+        stats = servico.estatisticas()
+    assert stats["falhas"] == 2 and "sem renderizador" in stats["ultimo_erro"]
+    assert stats["entradas_cache"] == 0
+
+
+def test_capacidade_limita_o_cache():
+    with ServicoExportacao(capacidade=2, renderizador=_Renderizador(), aquecer=False) as servico:
+        for n in range(4):
+            servico.renderizar(_grafico(n), "png")
+        assert servico.estatisticas()["entradas_cache"] == 2
+
+
+def test_formato_invalido():
+    with pytest.raises(ValueError):
+        validar_formato("jpg")
+
+
+def test_lote_exporta_uma_imagem_por_secao_calculada(tmp_path):
+    entrada = tmp_path / "secoes.jsonl"
+    linhas = [
+        {"id": "VS 250", "unidade": "cm", "figuras": [{"tipo": "Retângulo", "base": 12, "altura": 2, "x": 0, "y": 0}]},
+        {"id": "vazia", "unidade": "cm", "figuras": []},
+        {"id": "C", "unidade": "cm", "figuras": [{"tipo": "Círculo", "raio": 3, "x": 1, "y": 1}]},
+    ]
+    entrada.write_text("\n".join(json.dumps(l, ensure_ascii=False) for l in linhas), encoding="utf-8")
+    r = _Renderizador()
+    with ServicoExportacao(renderizador=r, aquecer=False) as servico:
+        stats = rodar_lote(
+            str(entrada), str(tmp_path / "saida.jsonl"), workers=1,
+            imagens=str(tmp_path / "graficos"), formato_imagem="svg", servico_imagens=servico,
+        )
+    arquivos = sorted(p.name for p in (tmp_path / "graficos").iterdir())
+    assert arquivos == ["000001_VS_250.svg", "000003_C.svg"]
+    assert stats.imagens == 2 and stats.falhas_imagem == 0 and stats.erros == 1
+    assert (tmp_path / "graficos" / "000003_C.svg").read_bytes().startswith(b"svg:")
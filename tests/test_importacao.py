@@ -0,0 +1,95 @@
+import gzip
+import math
+import shutil
+from pathlib import Path
+
+import pytest
+
+from core.contorno import ArcoEliptico, FiguraContorno, SegmentoReta
+from core.figuras import Circulo, QuartoCirculo, Retangulo, Semicirculo
+from core.poligono import Poligono
+from core.secao_composta import SecaoComposta
+from interface.importacao import EstatisticasImportacao, figuras_csv, importar_geometria
+
+DADOS = Path(__file__).parent / "dados"
+CAMPOS = ("area_total", "xg", "yg", "ix", "iy", "ixy")
+
+
+def _setor(cx, cy, r, ini_graus, fim_graus, furo=False):
+    ini, fim = math.radians(ini_graus), math.radians(fim_graus)
+    p0 = (cx + r * math.cos(ini), cy + r * math.sin(ini))
+    p1 = (cx + r * math.cos(fim), cy + r * math.sin(fim))
+    return FiguraContorno(
+        contorno=(SegmentoReta((cx, cy), p0), ArcoEliptico(cx, cy, r, r, ini, fim), SegmentoReta(p1, (cx, cy))),
+        furo=furo,
+    )
+
+
+def _referencia_chapa() -> SecaoComposta:
+    """Mesma geometria de dados/chapa.dxf montada à mão com figuras do core."""
+    rasgo = FiguraContorno(
+        contorno=(
+            SegmentoReta((8, 2), (12, 2)),
+            ArcoEliptico(12, 3, 1, 1, -math.pi / 2, math.pi / 2),
+            SegmentoReta((12, 4), (8, 4)),
+            ArcoEliptico(8, 3, 1, 1, math.pi / 2, 3 * math.pi / 2),
+        ),
+        furo=True,
+    )
+    return SecaoComposta(figuras=[
+        Retangulo(base=20, altura=12, x=10, y=6),
+        Circulo(raio=1.5, x=5, y=6, furo=True),
+        Circulo(raio=1.0, x=15, y=6, furo=True),
+        rasgo,
+        _setor(20, 12, 3, 0, 90),
+        _setor(10, 12, 4, 0, 180),
+        _setor(0, 0, 2, 180, 240),
+    ])
+
+
+def _conferir(secao, ref, rel):
+    r, e = secao.calcular(), ref.calcular()
+    for campo in CAMPOS:
+        assert getattr(r, campo) == pytest.approx(getattr(e, campo), rel=rel), campo
+
+
+def test_dxf_vira_as_figuras_esperadas():
+    stats = EstatisticasImportacao()
+    secao = importar_geometria(str(DADOS / "chapa.dxf"), estatisticas=stats)
+    assert [type(f) for f in secao.figuras] == [
+        Poligono, Circulo, Circulo, FiguraContorno, QuartoCirculo, Semicirculo, FiguraContorno,
+    ]
+    assert [f.furo for f in secao.figuras] == [False, True, True, True, False, False, False]
+    assert (stats.entidades, stats.figuras) == (9, 7)
+    assert stats.ignoradas == {"LINE": 1, "LWPOLYLINE": 1}
+    assert secao.figuras[3].area() == pytest.approx(-(4 * 2 + math.pi), rel=1e-12)
+
+
+def test_dxf_confere_com_a_secao_montada_a_mao():
+    # Semicirculo usa Ix̄ = 0,1098·R⁴ (formulário), daí a tolerância
+    _conferir(importar_geometria(str(DADOS / "chapa.dxf")), _referencia_chapa(), rel=1e-4)
+
+
+def test_dxf_compactado(tmp_path):
+    gz = tmp_path / "chapa.dxf.gz"
+    with open(DADOS / "chapa.dxf", "rb") as src, gzip.open(gz, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    _conferir(importar_geometria(str(gz)), importar_geometria(str(DADOS / "chapa.dxf")), rel=1e-15)
+
+
+def test_csv_de_vertices():
+    caixa, recorte = figuras_csv(str(DADOS / "poligonos.csv"))
+    assert caixa.area() == pytest.approx(10 * 8 - 4 * 4)
+    assert (caixa.x, caixa.y) == pytest.approx((5, 4))
+    assert recorte.furo and recorte.area() == pytest.approx(-0.5)
+    ref = SecaoComposta(figuras=[
+        Retangulo(base=10, altura=8, x=5, y=4),
+        Retangulo(base=4, altura=4, x=5, y=4, furo=True),
+        Poligono([(0, 0), (1, 0), (0, 1)], furo=True),
+    ])
+    _conferir(importar_geometria(str(DADOS / "poligonos.csv")), ref, rel=1e-12)
+
+
+def test_formato_desconhecido_levanta_value_error():
+    with pytest.raises(ValueError, match="não suportado"):
+        importar_geometria("secao.step")
@@ -0,0 +1,24 @@
+import pytest
+
+from core.figuras import Retangulo
+from core.lote import calcular_lote
+from core.secao_composta import SecaoComposta
+
+
+def _secao(unidade):
+    return SecaoComposta(unidade_comprimento=unidade, figuras=[Retangulo(base=2, altura=4)])
+
+
+def test_unidades_diferentes_levantam_value_error():
+    with pytest.raises(ValueError, match="unidades diferentes"):
+        calcular_lote([_secao("cm"), _secao("mm")])
+
+
+def test_unidade_comum_vai_para_o_resultado():
+    assert calcular_lote([_secao("mm"), _secao("mm")]).unidade_comprimento == "mm"
+
+
+def test_unidade_informada_diferente_das_secoes_levanta_value_error():
+    with pytest.raises(ValueError, match="difere"):
+        calcular_lote([_secao("mm")], unidade_comprimento="cm")
+    assert calcular_lote([_secao("mm")], unidade_comprimento="mm").unidade_comprimento == "mm"
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from core.figuras import Retangulo
+from core.mascara import FiguraMascara
+from core.secao_composta import SecaoComposta
+
+H = 0.5
+ORIGEM = (10.0, -4.0)
+
+
+def _mascara_l() -> np.ndarray:
+    # 16 linhas x 24 colunas; linha 0 no topo
+    m = np.zeros((16, 24), dtype=bool)
+    m[12:16, 2:22] = True   # aba inferior: 4 linhas x 20 colunas
+    m[2:12, 2:6] = True     # alma: 10 linhas x 4 colunas
+    return m
+
+
+def _proprias(fig):
+    return fig.area(), fig.x, fig.y, fig.ix_proprio(), fig.iy_proprio(), fig.ixy_proprio()
+
+
+def _retangulo_pixels(linhas, colunas, n_linhas):
+    """Retangulo equivalente a m[linhas, colunas] (linha 0 no topo)."""
+    base = (colunas.stop - colunas.start) * H
+    altura = (linhas.stop - linhas.start) * H
+    x = ORIGEM[0] + (colunas.start * H + base / 2)
+    y = ORIGEM[1] + (n_linhas - linhas.stop) * H + altura / 2
+    return Retangulo(base=base, altura=altura, x=x, y=y)
+
+
+def test_mascara_retangular_confere_com_retangulo():
+    m = np.zeros((16, 24), dtype=bool)
+    m[4:14, 2:22] = True
+    f = FiguraMascara(m, H, origem=ORIGEM)
+    r = _retangulo_pixels(slice(4, 14), slice(2, 22), 16)
+    for vf, vr in zip(_proprias(f), _proprias(r)):
+        assert vf == pytest.approx(vr, rel=1e-12, abs=1e-12)
+    assert f.limites == pytest.approx((r.x - 5, r.x + 5, r.y - 2.5, r.y + 2.5))
+
+
+@pytest.mark.parametrize("linhas_por_bloco", [None, 1, 3])
+def test_mascara_em_l_confere_com_dois_retangulos(linhas_por_bloco):
+    ref = SecaoComposta(figuras=[
+        _retangulo_pixels(slice(12, 16), slice(2, 22), 16),
+        _retangulo_pixels(slice(2, 12), slice(2, 6), 16),
+    ]).calcular()
+    f = FiguraMascara(_mascara_l(), H, origem=ORIGEM, linhas_por_bloco=linhas_por_bloco)
+    r = SecaoComposta(figuras=[f]).calcular()
+    for campo in ("area_total", "xg", "yg", "ix", "iy", "ixy"):
+        assert getattr(r, campo) == pytest.approx(getattr(ref, campo), rel=1e-12, abs=1e-12)
+
+
+def test_linha_0_embaixo_espelha_em_y():
+    m = _mascara_l()
+    topo = FiguraMascara(m, H)
+    baixo = FiguraMascara(m[::-1], H, linha_0_no_topo=False)
+    for vt, vb in zip(_proprias(topo), _proprias(baixo)):
+        assert vt == pytest.approx(vb, rel=1e-12, abs=1e-12)
+
+
+def test_tons_de_cinza_e_limiar():
+    m = _mascara_l()
+    cinza = np.where(m, 255, 0).astype(np.uint8)
+    assert FiguraMascara(cinza, H).area() == pytest.approx(FiguraMascara(m, H).area())
+    meio = np.where(m, 128, 0).astype(np.uint8)
+    assert FiguraMascara(meio, H).area() == pytest.approx(FiguraMascara(m, H).area() * 128 / 255)
+    assert FiguraMascara(meio, H, limiar=0.5).area() == pytest.approx(FiguraMascara(m, H).area())
+
+
+def test_de_arquivo_npy_e_binario_cru(tmp_path):
+    m = _mascara_l()
+    ref = FiguraMascara(m, H, origem=ORIGEM)
+    np.save(tmp_path / "m.npy", m)
+    cru = tmp_path / "m.raw"
+    np.where(m, 255, 0).astype(np.uint8).tofile(cru)
+    for f in (
+        FiguraMascara.de_arquivo(str(tmp_path / "m.npy"), H, origem=ORIGEM),
+        FiguraMascara.de_arquivo(str(cru), H, forma=m.shape, origem=ORIGEM),
+    ):
+        for vf, vr in zip(_proprias(f), _proprias(ref)):
+            assert vf == pytest.approx(vr, rel=1e-12, abs=1e-12)
+    with pytest.raises(ValueError, match="forma"):
+        FiguraMascara.de_arquivo(str(cru), H)
@@ -0,0 +1,31 @@
+import pytest
+
+from core.figuras import Retangulo
+from core.otimizacao import Restricao, otimizar
+from core.varredura import FiguraParametrica, ModeloSecao
+
+
+def test_iteracoes_zero_levanta_value_error():
+    modelo = ModeloSecao([FiguraParametrica(Retangulo, base="b", altura=2)])
+    with pytest.raises(ValueError, match="iteracoes"):
+        otimizar(modelo, {"b": (1, 2)}, iteracoes=0)
+
+
+def test_sem_candidato_avaliavel_levanta_value_error():
+    # chapa e furo iguais: área nula, propriedades NaN em todos os pontos
+    modelo = ModeloSecao([
+        FiguraParametrica(Retangulo, base="b", altura=2),
+        FiguraParametrica(Retangulo, base="b", altura=2, furo=True),
+    ])
+    with pytest.raises(ValueError, match="Nenhum candidato"):
+        otimizar(modelo, {"b": (1, 2)}, [Restricao("i1", minimo=1)], n_amostras=20, iteracoes=2)
+
+
+@pytest.mark.parametrize("objetivo, restricoes", [
+    ("area", ()),
+    ("area_total", [Restricao("I1", minimo=1)]),
+])
+def test_campo_desconhecido_levanta_value_error_antes_de_avaliar(objetivo, restricoes):
+    modelo = ModeloSecao([FiguraParametrica(Retangulo, base="b", altura=2)])
+    with pytest.raises(ValueError, match="area_total, xg, yg"):
+        otimizar(modelo, {"b": (1, 2)}, restricoes, objetivo=objetivo)
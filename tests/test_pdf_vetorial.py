@@ -0,0 +1,62 @@
+import re
+from io import BytesIO
+
+from interface.pdf_fluxo import CanvasFluxo
+from interface.pdf_vetorial import desenhar_secao
+from interface.relatorio import build_pdf_bytes
+
+CAIXA = (50.0, 100.0, 400.0, 300.0)
+
+FIGS = [
+    {"tipo": "Retângulo", "base": 12.0, "altura": 2.0, "x": 0.0, "y": 6.0, "furo": False},
+    {"tipo": "Retângulo", "base": 1.0, "altura": 10.0, "x": 0.0, "y": 0.0, "furo": False},  # sobrepõe a mesa
+    {"tipo": "Círculo", "raio": 0.3, "x": 0.0, "y": 0.0, "furo": True},
+    {"tipo": "Triângulo Retângulo", "base": 3.0, "altura": 3.0, "x": 2.0, "y": -4.0,
+     "orientacao": "SW ( -x, -y )", "furo": False},
+    {"tipo": "Polígono", "vertices": [[-8, -6], [-4, -6], [-4, -2], [-8, -2]],
+     "furos": [[[-7, -5], [-5, -5], [-5, -3]]], "furo": False},
+]
+
+
+def _operadores(figs, **opcoes) -> str:
+    buf = BytesIO()
+    c = CanvasFluxo(buf, compressao=False)
+    desenhar_secao(c, figs, 0.0, 1.0, 30.0, 120.0, caixa=CAIXA, **opcoes)
+    c.save()
+    return buf.getvalue().decode("latin-1")
+
+
+def test_um_caminho_cheio_por_anel_sem_par_impar():
+    ops = _operadores(FIGS)
+    # sólidos: 2 retângulos + triângulo + contorno do polígono; furos: círculo + anel interno
+    assert len(re.findall(r"^h B$", ops, re.M)) == 6
+    assert "B*" not in ops and "f*" not in ops
+
+
+def test_contornos_ficam_dentro_da_caixa():
+    ops = _operadores(FIGS)
+    bx, by, bw, bh = CAIXA
+    pontos = [(float(x), float(y)) for x, y in re.findall(r"^(-?[\d.]+) (-?[\d.]+) [ml]$", ops, re.M)]
+    aneis = [p for p in pontos if bx <= p[0] <= bx + bw and by <= p[1] <= by + bh]
+    assert len(aneis) > 20
+    xs, ys = zip(*aneis)
+    # escala de 85% da caixa, centrada
+    assert max(xs) - min(xs) <= 0.85 * bw + 1e-6 and max(ys) - min(ys) <= 0.85 * bh + 1e-6
+
+
+def test_eixos_principais_tracejado_so_no_alpha2():
+    ops = _operadores(FIGS)
+    assert ops.count("[4 2] 0 d") == 1
+    assert ops.count("(CG) Tj") == 1
+
+
+def test_secao_vazia_desenha_so_a_moldura():
+    ops = _operadores([])
+    assert "re S" in ops and " B" not in ops
+
+
+def test_build_pdf_bytes_com_desenho_vetorial():
+    res = {"area_total": 30.0, "xg": 0.0, "yg": 1.0, "ix": 100.0, "iy": 50.0, "ixy": 0.0,
+           "i1": 100.0, "i2": 50.0, "a1": 0.0, "a2": 90.0, "ab_rows": []}
+    pdf = build_pdf_bytes(res, "cm", figs=FIGS)
+    assert pdf.startswith(b"%PDF") and b"/Subtype /Image" not in pdf
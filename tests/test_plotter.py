@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from core.poligono import Poligono
+from interface.adapters import ORIENT_Q, ORIENT_SEMI, defaults_for, dict_to_core
+from interface.plotter import SEGMENTOS_MAX, SEGMENTOS_MIN, contornos_agrupados, plot_secao, segmentos_por_volta
+
+
+def _figs():
+    return [
+        {"tipo": "Retângulo", "base": 400, "altura": 20, "x": 0, "y": 0, "furo": False},
+        {"tipo": "Semicírculo", "raio": 0.5, "x": 10, "y": 20, "furo": False},
+        {"tipo": "Semicírculo", "raio": 150, "x": 10, "y": 100, "furo": False},
+    ]
+
+
+def _pontos_dos_arcos(fig):
+    return [len(t.x) for t in fig.data if t.mode == "lines"]
+
+
+def test_segmentos_por_volta_cresce_com_o_raio_e_respeita_limites():
+    n = segmentos_por_volta(np.array([0.01, 5.0, 50.0, 1e6]))
+    assert n[0] == SEGMENTOS_MIN and n[-1] == SEGMENTOS_MAX
+    assert np.all(np.diff(n) >= 0)
+
+
+def test_modo_por_figura_usa_nivel_de_detalhe():
+    pequeno, grande = _pontos_dos_arcos(plot_secao(_figs(), 0, 0, agrupar=False, largura_px=900))
+    assert pequeno < grande
+    maximo = _pontos_dos_arcos(plot_secao(_figs(), 0, 0, agrupar=False, largura_px=None))
+    assert maximo == [SEGMENTOS_MAX // 2 + 2] * 2
+
+
+def test_contornos_agrupados_separam_solidos_e_furos():
+    figs = _figs() + [{"tipo": "Círculo", "raio": 1, "x": 0, "y": 0, "furo": True}]
+    c = contornos_agrupados(figs, largura_px=900)
+    assert np.nanmax(c["furos_x"]) <= 1 + 1e-12
+    assert np.isnan(c["solidos_x"]).sum() == 3
+    assert len(c["cx"]) == 4
+
+
+def _figs_todas_orientacoes():
+    figs = [dict(defaults_for("Retângulo", 1), x=3.0, y=-2.0), dict(defaults_for("Círculo", 2), x=-4.0)]
+    for k, ori in enumerate(ORIENT_Q):
+        figs.append(dict(defaults_for("Triângulo Retângulo", 10 + k), orientacao=ori, x=k, y=1.0))
+        figs.append(dict(defaults_for("Quarto de Círculo", 20 + k), orientacao=ori, x=-k, y=5.0))
+    for k, ori in enumerate(ORIENT_SEMI):
+        figs.append(dict(defaults_for("Semicírculo", 30 + k), orientacao=ori, x=2 * k, y=-6.0))
+    return figs
+
+
+def test_contorno_agrupado_tem_a_area_e_o_centroide_da_figura():
+    for f in _figs_todas_orientacoes():
+        c = contornos_agrupados([f], largura_px=None)
+        x, y = c["solidos_x"], c["solidos_y"]
+        ok = np.isfinite(x)
+        p = Poligono(np.column_stack([x[ok], y[ok]]))
+        ref = dict_to_core(f)
+        assert p.area() == pytest.approx(ref.area(), rel=1e-3), f.get("orientacao", f["tipo"])
+        assert (p.x, p.y) == pytest.approx((ref.x, ref.y), abs=1e-3)
+
+
+def test_agrupado_e_individual_cobrem_a_mesma_regiao():
+    figs = _figs_todas_orientacoes()
+    agrupado = plot_secao(figs, 0.5, 0.5, 30.0, 120.0, agrupar=True, largura_px=None)
+    individual = plot_secao(figs, 0.5, 0.5, 30.0, 120.0, agrupar=False, largura_px=None)
+    for eixo in ("xaxis", "yaxis"):
+        np.testing.assert_allclose(agrupado.layout[eixo].range, individual.layout[eixo].range, rtol=1e-9)
+    # sólidos + furos + centroides + CG global, qualquer que seja o nº de figuras
+    assert len(agrupado.data) <= 4 < len(individual.data)
+
+
+def test_webgl_acima_do_limite():
+    figs = _figs_todas_orientacoes()
+    assert {t.type for t in plot_secao(figs, 0, 0, agrupar=True, limite_webgl=5).data} == {"scattergl"}
+    assert {t.type for t in plot_secao(figs, 0, 0, agrupar=True, limite_webgl=None).data} == {"scatter"}
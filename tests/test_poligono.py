@@ -0,0 +1,54 @@
+import pytest
+
+from core.figuras import Retangulo
+from core.poligono import Poligono
+from core.secao_composta import SecaoComposta
+
+
+def _retangulo(b, h, x, y):
+    return [(x - b / 2, y - h / 2), (x + b / 2, y - h / 2), (x + b / 2, y + h / 2), (x - b / 2, y + h / 2)]
+
+
+def _proprias(fig):
+    return fig.area(), fig.x, fig.y, fig.ix_proprio(), fig.iy_proprio(), fig.ixy_proprio()
+
+
+@pytest.mark.parametrize("x, y", [(0.0, 0.0), (3.0, -2.0), (1e6, 1e6)])
+@pytest.mark.parametrize("horario", [False, True])
+def test_shoelace_confere_com_retangulo(x, y, horario):
+    vertices = _retangulo(4.0, 6.0, x, y)
+    if horario:
+        vertices = vertices[::-1]
+    p = Poligono(vertices)
+    r = Retangulo(base=4.0, altura=6.0, x=x, y=y)
+    for vp, vr in zip(_proprias(p), _proprias(r)):
+        assert vp == pytest.approx(vr, rel=1e-12, abs=1e-9)
+
+
+def test_furo_interno_igual_a_diferenca_de_retangulos():
+    caixa = Poligono(_retangulo(10, 8, 1, 2), furos=[_retangulo(6, 4, 2, 2)])
+    ref = SecaoComposta(figuras=[
+        Retangulo(base=10, altura=8, x=1, y=2),
+        Retangulo(base=6, altura=4, x=2, y=2, furo=True),
+    ]).calcular()
+    r = SecaoComposta(figuras=[caixa]).calcular()
+    for campo in ("area_total", "xg", "yg", "ix", "iy", "ixy"):
+        assert getattr(r, campo) == pytest.approx(getattr(ref, campo), rel=1e-12, abs=1e-12)
+
+
+def test_poligono_em_l_tem_produto_de_inercia():
+    # L: 4x1 na base + 1x3 na esquerda; dois retângulos como referência
+    p = Poligono([(0, 0), (4, 0), (4, 1), (1, 1), (1, 4), (0, 4)])
+    ref = SecaoComposta(figuras=[
+        Retangulo(base=4, altura=1, x=2, y=0.5),
+        Retangulo(base=1, altura=3, x=0.5, y=2.5),
+    ]).calcular()
+    r = SecaoComposta(figuras=[p]).calcular()
+    assert r.ixy == pytest.approx(ref.ixy, rel=1e-12)
+    assert r.ixy < 0
+    assert (r.i1, r.i2) == pytest.approx((ref.i1, ref.i2), rel=1e-12)
+
+
+def test_furo_maior_que_o_contorno_levanta_value_error():
+    with pytest.raises(ValueError, match="positiva"):
+        Poligono(_retangulo(1, 1, 0, 0), furos=[_retangulo(2, 2, 0, 0)])
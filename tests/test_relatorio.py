@@ -0,0 +1,100 @@
+import re
+import zlib
+
+from interface.pdf_fluxo import CanvasFluxo
+from interface.processamento_lote import calcular_registro
+from interface.relatorio import escrever_relatorio_lote
+
+_TEXTO = re.compile(rb"\(((?:\\.|[^\\)])*)\) Tj")
+
+
+def _objeto(pdf: bytes, offsets: dict, n: int) -> bytes:
+    inicio = offsets[n]
+    assert pdf.startswith(b"%d 0 obj\n" % n, inicio)
+    return pdf[inicio:pdf.index(b"\nendobj\n", inicio)]
+
+
+def _ler_pdf(pdf: bytes) -> list:
+    """Confere xref/trailer e devolve os textos (Tj) de cada página, na ordem do documento."""
+    assert pdf.startswith(b"%PDF-1.4\n") and pdf.endswith(b"%%EOF\n")
+    inicio_xref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", pdf).group(1))
+    assert pdf.startswith(b"xref\n0 ", inicio_xref)
+    cabecalho, corpo = pdf[inicio_xref:].split(b"trailer\n")
+    linhas = cabecalho.split(b"\n")
+    n = int(linhas[1].split()[1])
+    entradas = linhas[3:3 + n - 1]  # a entrada 0 é a livre
+    assert all(len(e) == 19 and e.endswith(b" n ") for e in entradas)
+    offsets = {k: int(e[:10]) for k, e in enumerate(entradas, start=1)}
+    assert int(re.search(rb"/Size (\d+)", corpo).group(1)) == n
+
+    raiz = int(re.search(rb"/Root (\d+) 0 R", corpo).group(1))
+    paginas = int(re.search(rb"/Pages (\d+) 0 R", _objeto(pdf, offsets, raiz)).group(1))
+    arvore = _objeto(pdf, offsets, paginas)
+    kids = [int(k) for k in re.findall(rb"(\d+) 0 R", re.search(rb"/Kids \[(.*?)\]", arvore).group(1))]
+    assert int(re.search(rb"/Count (\d+)", arvore).group(1)) == len(kids)
+
+    textos = []
+    for kid in kids:
+        conteudo = int(re.search(rb"/Contents (\d+) 0 R", _objeto(pdf, offsets, kid)).group(1))
+        obj = _objeto(pdf, offsets, conteudo)
+        tamanho = int(re.search(rb"/Length (\d+)", obj).group(1))
+        dados = obj[obj.index(b"stream\n") + 7:][:tamanho]
+        ops = zlib.decompress(dados)
+        textos.append([t.decode("cp1252") for t in _TEXTO.findall(ops)])
+    return textos
+
+
+def _registros(n: int):
+    for k in range(1, n + 1):
+        if k == 7:
+            yield {"id": "sec-7", "erro": "Área total ~ 0."}
+            continue
+        entrada = {"id": f"sec-{k}", "figuras": [
+            {"tipo": "Retângulo", "base": 10.0 + k, "altura": 2.0, "x": 0.0, "y": 5.0},
+            {"tipo": "Círculo", "raio": 1.0 + k / 100, "x": 0.0, "y": 0.0},
+        ]}
+        yield {**calcular_registro(entrada), "figuras": entrada["figuras"]}
+
+
+def test_canvas_fluxo_gera_xref_valida_e_paginas_na_frente(tmp_path):
+    caminho = tmp_path / "x.pdf"
+    c = CanvasFluxo(str(caminho), titulo="Teste (1)")
+    for texto in ("corpo 1", "corpo 2"):
+        c.drawString(72, 700, texto)
+        c.showPage()
+    c.drawString(72, 700, "frente")
+    c.showPage(frente=True)
+    c.save()
+    pdf = caminho.read_bytes()
+    assert _ler_pdf(pdf) == [["frente"], ["corpo 1"], ["corpo 2"]]
+    assert c.bytes_escritos == len(pdf)
+    assert b"/Title (Teste \\(1\\))" in pdf
+
+
+def test_relatorio_lote_sumario_aponta_para_a_pagina_de_cada_secao(tmp_path):
+    caminho = tmp_path / "relatorio.pdf"
+    chamadas = []
+    stats = escrever_relatorio_lote(
+        str(caminho), _registros(120), graficos=True, linhas_por_pagina_sumario=50, progresso=chamadas.append,
+    )
+    pdf = caminho.read_bytes()
+    paginas = _ler_pdf(pdf)
+
+    assert (stats.secoes, stats.erros) == (120, 1)
+    assert stats.paginas == len(paginas) and stats.bytes == len(pdf)
+    assert len(chamadas) == 121
+    assert paginas[0][0] == "Momentos de Inércia — Relatório de seções"
+
+    sumario = [t for p in paginas[:3] for t in p]  # 120 linhas / 50 por página
+    for k in (1, 7, 51, 120):
+        i = sumario.index(f"sec-{k}")
+        pagina = int(sumario[i + (2 if k == 7 else 8)])
+        assert paginas[pagina - 1][0] == f"Seção {k}: sec-{k}"
+    assert "Erro no cálculo: Área total ~ 0." in paginas[int(sumario[sumario.index("sec-7") + 2]) - 1]
+
+
+def test_relatorio_lote_vazio(tmp_path):
+    caminho = tmp_path / "vazio.pdf"
+    stats = escrever_relatorio_lote(str(caminho), iter(()))
+    assert stats.paginas == 1
+    assert "0 seções | 0 com erro" in _ler_pdf(caminho.read_bytes())[0][1]
@@ -0,0 +1,55 @@
+import pytest
+
+from core.cache_resultados import CacheResultados
+from core.figuras import Circulo, Retangulo
+from core.secao_composta import SecaoComposta
+from core.secao_incremental import SecaoIncremental
+
+
+def _figuras():
+    return [Retangulo(base=2, altura=4, x=1, y=2), Circulo(raio=1, x=5, y=5)]
+
+
+@pytest.mark.parametrize("opcoes", [{}, {"soma": "fsum"}, {"motor": "numpy"}])
+def test_derivadas_iguais_a_secao_composta(opcoes):
+    esperado = SecaoComposta(figuras=_figuras()).calcular(derivadas=True).extras["derivadas"]
+    obtido = SecaoIncremental(figuras=_figuras()).calcular(derivadas=True, **opcoes).extras["derivadas"]
+    assert obtido == pytest.approx(esperado)
+
+
+def test_cache_repassa_derivadas():
+    res = CacheResultados().calcular(SecaoIncremental(figuras=_figuras()), derivadas=True)
+    assert "derivadas" in res.extras
+
+
+def test_extras_soma_indica_estrategia_dos_totais():
+    secao = SecaoIncremental(figuras=_figuras())
+    assert secao.calcular().extras["soma"]["estrategia"] == "fsum"
+    secao.adicionar(Retangulo(base=1, altura=1, x=-2, y=0))
+    soma = secao.calcular().extras["soma"]
+    assert soma["estrategia"] == "naive"
+    assert set(soma) == {"estrategia", "tempo_s", "custo"}
+
+
+def _conferir_com_secao_composta(secao):
+    esperado = SecaoComposta(figuras=list(secao.figuras)).calcular()
+    obtido = secao.calcular()
+    for campo in ("area_total", "xg", "yg", "ix", "iy", "ixy"):
+        assert getattr(obtido, campo) == pytest.approx(getattr(esperado, campo))
+
+
+def test_substituir_com_ressoma_periodica_no_meio():
+    secao = SecaoIncremental(figuras=[Retangulo(base=2, altura=4, x=1, y=2)], ressomar_a_cada=2)
+    secao.adicionar(Circulo(raio=1, x=5, y=5))
+    secao.substituir(0, Retangulo(base=3, altura=3))
+    assert secao.calcular().area_total == pytest.approx(9 + 3.141592653589793)
+    _conferir_com_secao_composta(secao)
+
+
+def test_substituir_com_ressoma_por_cancelamento_no_meio():
+    secao = SecaoIncremental(figuras=[
+        Retangulo(base=2, altura=2), Retangulo(base=2, altura=2, furo=True), Circulo(raio=1, x=3),
+    ])
+    secao.substituir(2, Circulo(raio=2, x=3))
+    assert secao.calcular().area_total == pytest.approx(4 * 3.141592653589793)
+    _conferir_com_secao_composta(secao)
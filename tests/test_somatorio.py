@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+import pytest
+
+from core.figuras import Circulo, Retangulo
+from core.secao_composta import SecaoComposta
+from core.somatorio import ESTRATEGIAS, somar, somar_array
+
+# 1 some na soma ingênua (1e16 + 1 == 1e16), mas não nas compensadas.
+_CANCELAMENTO = [1e16, 1.0, -1e16]
+
+
+def test_cancelamento_por_estrategia():
+    assert somar(_CANCELAMENTO, "naive") == 0.0
+    assert somar(_CANCELAMENTO, "neumaier") == 1.0
+    assert somar(_CANCELAMENTO, "fsum") == 1.0
+    assert somar_array(np.array(_CANCELAMENTO), "naive") == 0.0
+    assert somar_array(np.array(_CANCELAMENTO), "neumaier") == 1.0
+
+
+@pytest.mark.parametrize("estrategia", ESTRATEGIAS)
+def test_todas_as_estrategias_perto_do_fsum(estrategia):
+    valores = np.random.default_rng(0).normal(size=1000).tolist()
+    exato = math.fsum(valores)
+    assert somar(valores, estrategia) == pytest.approx(exato, abs=1e-11)
+    assert somar_array(np.array(valores), estrategia) == pytest.approx(exato, abs=1e-11)
+    assert somar([], estrategia) == 0.0
+
+
+def test_estrategia_desconhecida_levanta_value_error():
+    with pytest.raises(ValueError, match="naive, pairwise"):
+        somar([1.0], "kahan")
+
+
+def test_fsum_na_secao_recupera_a_chapa_perfurada():
+    # chapa 1000 x 1000 com 2000 furos de raio 1 longe da origem
+    figs = [Retangulo(base=1000, altura=1000, x=1e5, y=1e5)]
+    figs += [Circulo(raio=1, x=1e5 - 400 + k % 40 * 20, y=1e5 - 400 + k // 40 * 15, furo=True)
+             for k in range(2000)]
+    exata = 1000 * 1000 - 2000 * math.pi
+    r_fsum = SecaoComposta(figuras=figs).calcular(soma="fsum")
+    r_naive = SecaoComposta(figuras=figs).calcular(soma="naive")
+    assert r_fsum.area_total == pytest.approx(exata, rel=1e-15)
+    assert abs(r_fsum.area_total - exata) <= abs(r_naive.area_total - exata)
+    assert r_fsum.extras["soma"]["estrategia"] == "fsum"
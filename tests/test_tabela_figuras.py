@@ -0,0 +1,61 @@
+import pytest
+
+from core.figuras import Circulo, QuartoCirculo, Retangulo, Semicirculo, TrianguloRetangulo
+from core.secao_composta import SecaoComposta
+from core.tabela_figuras import TabelaFiguras
+
+
+def _figuras():
+    return [
+        Retangulo(base=2, altura=3, x=1, y=-1),
+        Circulo(raio=0.5, x=0.2, furo=True),
+        TrianguloRetangulo(base=1, altura=2, x=3, sinal_ixy=-1),
+        Retangulo(base=1, altura=1, nome="Chapa"),  # nome próprio: guardada como objeto
+        Semicirculo(raio=1, y=2),
+        QuartoCirculo(raio=2, x=-2),
+        Retangulo(base=4, altura=0.5, nome="Mesa"),
+    ]
+
+
+def test_ida_e_volta_preserva_figuras_e_propriedades():
+    figs = _figuras()
+    tabela = TabelaFiguras(figs)
+    assert list(tabela) == figs
+    assert sorted(tabela.genericas) == [3, 6]
+    ref = SecaoComposta(figuras=list(figs)).calcular()
+    r = SecaoComposta(figuras=tabela).calcular()
+    for campo in ("area_total", "xg", "yg", "ix", "iy", "ixy"):
+        assert getattr(r, campo) == pytest.approx(getattr(ref, campo), rel=1e-14)
+
+
+@pytest.mark.parametrize("fatia", [slice(1, 4), slice(None, None, 2), slice(-2, None), slice(5, 2), slice(0, 0)])
+def test_del_fatia_igual_a_lista(fatia):
+    lista, tabela = _figuras(), TabelaFiguras(_figuras())
+    del lista[fatia]
+    del tabela[fatia]
+    assert list(tabela) == lista
+    assert {k: f.nome for k, f in tabela.genericas.items()} == {
+        k: f.nome for k, f in enumerate(lista) if f.nome in ("Chapa", "Mesa")
+    }
+
+
+@pytest.mark.parametrize("fatia, novas", [
+    (slice(1, 4), [Retangulo(base=9, altura=9, nome="Nova")]),
+    (slice(2, 2), [Circulo(raio=3), Retangulo(base=1, altura=1, nome="Nova")]),
+    (slice(0, None), []),
+    (slice(None, None, 3), [Circulo(raio=1), Circulo(raio=2), Retangulo(base=1, altura=1, nome="Nova")]),
+])
+def test_atribuir_fatia_igual_a_lista(fatia, novas):
+    lista, tabela = _figuras(), TabelaFiguras(_figuras())
+    lista[fatia] = novas
+    tabela[fatia] = novas
+    assert list(tabela) == lista
+    assert {k: f.nome for k, f in tabela.genericas.items()} == {
+        k: f.nome for k, f in enumerate(lista) if f.nome in ("Chapa", "Mesa", "Nova")
+    }
+
+
+def test_fatia_estendida_com_tamanho_diferente_levanta_value_error():
+    tabela = TabelaFiguras(_figuras())
+    with pytest.raises(ValueError, match="passo 2"):
+        tabela[::2] = [Circulo(raio=1)]
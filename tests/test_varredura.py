@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from core.figuras import Circulo, QuartoCirculo, Retangulo, TrianguloRetangulo
+from core.varredura import FiguraParametrica, ModeloSecao, varrer
+
+
+def _perfil_i() -> ModeloSecao:
+    return ModeloSecao([
+        FiguraParametrica(Retangulo, base=12, altura="tf", y=lambda p: (p["hw"] + p["tf"]) / 2),
+        FiguraParametrica(Retangulo, base=0.8, altura="hw"),
+        FiguraParametrica(Retangulo, base=8, altura="tf", y=lambda p: -(p["hw"] + p["tf"]) / 2),
+        FiguraParametrica(TrianguloRetangulo, base="tf", altura=3, x=4, sinal_ixy=-1),
+        FiguraParametrica(QuartoCirculo, raio=1.5, x=-3, y=2),
+        FiguraParametrica(Circulo, raio=0.3, x=1, furo=True),
+    ])
+
+
+def test_sinal_ixy_em_classe_sem_o_campo_levanta_value_error():
+    with pytest.raises(ValueError, match="sinal_ixy"):
+        FiguraParametrica(Retangulo, base=1, altura=2, sinal_ixy=-1)
+
+
+def test_grade_confere_com_secao_composta_em_cada_ponto():
+    modelo = _perfil_i()
+    tf = np.array([0.8, 1.4, 2.0])
+    hw = np.array([10.0, 30.0])
+    r = varrer(modelo, {"tf": tf, "hw": hw})
+    assert r.forma == (3, 2)
+    for i, t in enumerate(tf):
+        for j, h in enumerate(hw):
+            ref = modelo.instanciar({"tf": t, "hw": h}).calcular()
+            for campo in ("area_total", "xg", "yg", "ix", "iy", "ixy", "i1", "i2"):
+                assert getattr(r, campo)[i, j] == pytest.approx(getattr(ref, campo), rel=1e-12, abs=1e-12)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from core.figuras import Circulo, QuartoCirculo, Retangulo, Semicirculo, TrianguloRetangulo
+from core.poligono import Poligono
+from core.secao_composta import SecaoComposta
+from core.somatorio import somar, somar_array
+
+
+def _secao():
+    return SecaoComposta(figuras=[
+        Retangulo(base=20, altura=2, x=0, y=11),
+        Retangulo(base=1, altura=20, x=0, y=0),
+        Circulo(raio=0.5, x=0, y=5, furo=True),
+        TrianguloRetangulo(base=3, altura=4, x=4, y=-8, sinal_ixy=-1),
+        Semicirculo(raio=2, x=-5, y=-10),
+        QuartoCirculo(raio=1.5, x=6, y=8),
+        Poligono(vertices=[(-3, -3), (-1, -3), (-1, -1)]),
+    ])
+
+
+def test_motor_numpy_igual_ao_laco_de_referencia():
+    ref = _secao().calcular(motor="python")
+    vet = _secao().calcular(motor="numpy")
+    for campo in ("area_total", "xg", "yg", "ix", "iy", "ixy", "i1", "i2"):
+        assert getattr(vet, campo) == pytest.approx(getattr(ref, campo), rel=1e-12, abs=1e-9)
+    assert [r["nome"] for r in vet.extras["parametros_ab"]] == [r["nome"] for r in ref.extras["parametros_ab"]]
+
+
+def test_retangulo_tem_forma_fechada():
+    res = SecaoComposta(figuras=[Retangulo(base=6, altura=4, x=1, y=2)]).calcular(motor="numpy")
+    assert res.area_total == pytest.approx(24)
+    assert (res.xg, res.yg) == pytest.approx((1, 2))
+    assert res.ix == pytest.approx(6 * 4**3 / 12)
+    assert res.iy == pytest.approx(4 * 6**3 / 12)
+
+
+def test_soma_naive_no_numpy_e_sequencial():
+    # 1 + 1e-16 repetido: a soma sequencial perde todos os 1e-16, a por pares não
+    valores = np.array([1.0] + [1e-16] * 100_000)
+    assert somar_array(valores, "naive") == somar(valores.tolist(), "naive") == 1.0
+    assert somar_array(valores, "pairwise") > 1.0
+    assert somar_array(np.array([]), "naive") == 0.0